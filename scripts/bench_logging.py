@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for logging overhead on the parsing path.
+
+Parses a mix of valid and invalid postcodes one at a time with `Service.parse_one`:
+
+- disabled: the package logger is above ERROR, so nothing is logged.
+- every error: each invalid postcode logs one ERROR line, as before summaries existed.
+- summarized: only the first error of each code per window is logged.
+
+Log lines are written to an in-memory stream, so the numbers exclude terminal or disk I/O.
+Every mode also pays for the metrics and tracing checks in `parse_one`. Compare modes from
+the same run, not against numbers taken at another commit or on another machine.
+
+Usage:
+    python scripts/bench_logging.py [--count N] [--invalid RATIO]
+"""
+
+import argparse
+import io
+import logging
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from src.postcode.logging import configure_logger, error_summary, logger  # noqa: E402
+from src.postcode.service import Service  # noqa: E402
+
+VALID = ["SW1A 1AA", "M1 1AE", "B33 8TH", "CR2 6XH", "DN55 1PT", "W1A 0AX", "EC1A 1BB", "L1 8JQ"]
+INVALID = ["HELLO", "SW1A 1A", "QQ1 1ZZZ", "", "SW1A/1AA", "12345678901", "A1"]
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+
+
+def run(service: Service, postcodes: list[str]) -> float:
+    start = time.perf_counter()
+    for postcode in postcodes:
+        service.parse_one(postcode)
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=50_000, help="Number of postcodes to parse.")
+    parser.add_argument("--invalid", type=float, default=0.5, help="Fraction of invalid postcodes.")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(22)
+    postcodes = [rng.choice(INVALID if rng.random() < args.invalid else VALID) for _ in range(args.count)]
+    service = Service.using_regex()
+
+    modes = {"disabled": ("CRITICAL", 60.0), "every error": ("ERROR", 0.0), "summarized": ("ERROR", 60.0)}
+    print(f"{'mode':<12} {'per postcode':>13} {'log lines':>10}")
+    for name, (level, interval) in modes.items():
+        configure_logger(level=level, to_console=False, error_summary_interval=interval)
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(FORMAT))
+        logger.addHandler(handler)
+        elapsed = min(run(service, postcodes) for _ in range(3))
+        error_summary.flush()
+        logger.removeHandler(handler)
+        print(f"{name:<12} {elapsed / args.count * 1e6:>10.2f} us {stream.getvalue().count(chr(10)):>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark for regex postcode matching.
+
+Compares trying each pattern of `RegexHandler.RULES` in turn with the single combined
+alternation used by `RegexRule.match_parts`, and with the standard-postcode fast path
+in front of it, on a mix of valid and invalid inputs.
+
+Usage:
+    python scripts/bench_regex.py [--repeat N]
+"""
+
+import argparse
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from src.postcode.handlers.regex import RegexHandler  # noqa: E402
+from src.postcode.handlers.standard import parse_standard  # noqa: E402
+from src.postcode.logging import logger  # noqa: E402
+
+MIXES = {
+    "standard": ["SW1A 1AA", "M1 1AE", "B33 8TH", "CR2 6XH", "DN55 1PT", "W1A 0AX", "EC1A 1BB", "L1 8JQ"],
+    "special": ["BFPO 1234", "D02 X285", "ASCN 1ZZ", "AI-2640", "KY1-1001", "MSR-1110", "VG1110", "HM 01", "GIR 0AA"],
+    "invalid": ["", "HELLO", "12345", "SW1A 1A", "QQ1 1ZZZ", "A-1", "ZZZZZZZZ", "SW1A-1AA"],
+}
+
+
+def sequential(rule, value):
+    """The previous `RegexRule.match_parts`: each pattern in turn, with its debug logging."""
+    logger.debug("Matching value '%s' against patterns for type '%s'", value, rule.type)
+    for regex in rule.patterns:
+        match = regex.match(value)
+        if match:
+            logger.debug("Matched value '%s' with regex '%s'", value, regex.pattern)
+            groups = match.groupdict()
+            return rule.type, groups.get("area"), groups.get("district"), groups.get("sector"), groups.get("unit")
+    logger.debug("No match found for value '%s' with type '%s'", value, rule.type)
+    return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5_000, help="Passes over each mix.")
+    args = parser.parse_args(argv)
+
+    rule = RegexHandler.RULES[0]
+    candidates = {
+        "sequential": lambda v: sequential(rule, v),
+        "combined": rule.match_parts,
+        "fast path": lambda v: parse_standard(v) or rule.match_parts(v),
+    }
+    print(f"{'mix':<10}" + "".join(f"{name:>13}" for name in candidates))
+    for name, values in MIXES.items():
+        per_value = args.repeat * len(values) / 1e9
+        timings = [min(timeit.repeat(lambda: [fn(v) for v in values], number=args.repeat, repeat=5)) for fn in candidates.values()]
+        print(f"{name:<10}" + "".join(f"{t / per_value:>10.0f} ns" for t in timings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ PACKAGE_VERSION = "1.0.0"
 
 from .postcode import (
     Postcode,
+    PostcodeValue,
     PostcodeError,
     PostcodeErrorCode,
     PostcodeFormatError,
@@ -11,12 +12,20 @@ from .postcode import (
     PostcodeTypeError,
 )
 from .result import Result
+from .batch import PostcodeColumns, PostcodeRow
 from .error import Error, InternalError
-from .logging import configure_logger
+from .logging import DropPolicy, configure_logger, shutdown_logger
+from .cache import CacheSettings, CacheStats, ResultCache
+from .metrics import MetricsRegistry
+from .tracing import set_tracer
+from .directory import DirectoryColumn, DirectoryHeader, PostcodeDirectory, build_directory
+from .suggest import PostcodeSuggester, Suggestion
 from .service import Service
+from .async_service import AsyncService
 
 __all__ = [
     "Postcode",
+    "PostcodeValue",
     "PostcodeError",
     "PostcodeErrorCode",
     "PostcodeFormatError",
@@ -24,8 +33,24 @@ __all__ = [
     "PostcodeNotFoundError",
     "PostcodeTypeError",
     "Result",
+    "PostcodeColumns",
+    "PostcodeRow",
     "Error",
     "InternalError",
     "configure_logger",
+    "shutdown_logger",
+    "DropPolicy",
+    "CacheSettings",
+    "CacheStats",
+    "ResultCache",
+    "MetricsRegistry",
+    "set_tracer",
+    "DirectoryColumn",
+    "DirectoryHeader",
+    "PostcodeDirectory",
+    "build_directory",
+    "PostcodeSuggester",
+    "Suggestion",
     "Service",
+    "AsyncService",
 ]
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from typing import Optional
+
+from .handlers.base import BaseHandler, BaseHandlerSettings
+from .handlers.factory import HandlerFactory
+from .handlers.regex import RegexHandlerSettings
+from .handlers.http.postcode_io import PostcodeIOHandlerSettings
+from .handlers.http.osdatahub import OSDataHubHandlerSettings
+from .handlers.errors import HandlerError
+from .postcode.normalize import normalize_postcode
+from .postcode.validation import validate_postcode
+from .postcode.errors import PostcodeError
+from .result import Result
+from .error import Error, InternalError
+from .logging import logger
+from .metrics import ERRORS, PARSE_SECONDS
+
+
+class AsyncService:
+    """
+    Asyncio counterpart of `Service`.
+
+    Every lookup is a coroutine, so thousands of postcodes can be in flight on a single
+    event loop. The HTTP handlers issue their requests with a non-blocking client
+    (requires the `async` extra, i.e. `httpx`), while offline handlers such as the
+    regex handler run inline.
+
+    Example:
+        async with AsyncService.using_postcode_io() as service:
+            results = await service.parse_many(["SW1A 1AA", "L1 8JQ"])
+
+    ### Core Methods
+    - parse_one(postcode): Parse and validate a single postcode.
+    - parse_many(postcodes): Bulk parse multiple postcodes concurrently.
+    - validate_one(postcode): Check if a postcode is valid.
+    - validate_many(postcodes): Bulk validation.
+    - aclose(): Release the handler's network resources.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 100
+
+    def __init__(self, handler: BaseHandler):
+        self._handler = handler
+
+    async def __aenter__(self) -> "AsyncService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close any network clients held by the handler."""
+        await self._handler.aclose()
+        self._handler.close()
+
+    # ------------------------------------------------------------------
+    # Parsing Methods
+    # ------------------------------------------------------------------
+
+    async def parse_one(self, postcode: str) -> Result:
+        """
+        Validate and parse a single postcode.
+
+        Args:
+            postcode (str): The raw postcode string (can be lowercased, spaced, etc.).
+
+        Returns:
+            Result: Contains the parsed postcode or an error.
+        """
+        start = time.perf_counter()
+        result = await self._parse_one(postcode)
+        PARSE_SECONDS.labels("ok" if result.error is None else "error").observe(time.perf_counter() - start)
+        if result.error is not None:
+            ERRORS.labels(result.error.code).inc()
+        return result
+
+    async def _parse_one(self, postcode: str) -> Result:
+        """Validate, normalize and look up a single postcode, returning any failure as a `Result`."""
+        try:
+            validate_postcode(postcode)
+            return Result.success(await self._handler.ahandle(normalize_postcode(postcode), timed=False))
+        except (PostcodeError, HandlerError, InternalError, Error) as e:
+            return Result.failure(e)
+        except Exception as e:
+            error = InternalError(f"An unexpected error occurred while parsing postcode '{postcode}': {str(e)}")
+            logger.exception(str(error))
+            return Result.failure(error)
+
+    async def parse_many(self, postcodes: list[str], max_concurrency: Optional[int] = None) -> list[Result]:
+        """
+        Validate and parse a list of postcodes concurrently.
+
+        Args:
+            postcodes (list[str]): A list of postcode strings.
+            max_concurrency (Optional[int]): Maximum number of lookups in flight at once.
+                Defaults to `DEFAULT_MAX_CONCURRENCY`. Values below 1 raise `ValueError`.
+
+        Returns:
+            list[Result]: A list of results, one for each postcode, in input order.
+                Repeated inputs are only looked up once and share the same `Result`.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.DEFAULT_MAX_CONCURRENCY
+        elif max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(postcode: str) -> Result:
+            async with semaphore:
+                return await self.parse_one(postcode)
+
+        unique = list(dict.fromkeys(p for p in postcodes if isinstance(p, str)))
+        parsed = dict(zip(unique, await asyncio.gather(*(bounded(p) for p in unique))))
+        return [parsed[p] if isinstance(p, str) else await self.parse_one(p) for p in postcodes]
+
+    # ------------------------------------------------------------------
+    # Validation Methods
+    # ------------------------------------------------------------------
+
+    async def validate_one(self, postcode: str) -> bool:
+        """
+        Validate a single postcode.
+
+        Args:
+            postcode (str): The postcode to validate.
+
+        Returns:
+            bool: True if valid, False otherwise.
+        """
+        return (await self.parse_one(postcode)).valid
+
+    async def validate_many(self, postcodes: list[str], max_concurrency: Optional[int] = None) -> list[bool]:
+        """
+        Validate multiple postcodes concurrently.
+
+        Args:
+            postcodes (list[str]): A list of postcode strings.
+            max_concurrency (Optional[int]): Maximum number of lookups in flight at once.
+
+        Returns:
+            list[bool]: List of booleans representing the validity of each postcode.
+        """
+        return [result.valid for result in await self.parse_many(postcodes, max_concurrency=max_concurrency)]
+
+    # ------------------------------------------------------------------
+    # Factory Methods
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def create(cls, settings: BaseHandlerSettings) -> "AsyncService":
+        """
+        Create an AsyncService instance using the provided handler settings.
+
+        Args:
+            settings (BaseHandlerSettings): Configuration for the handler.
+
+        Returns:
+            AsyncService: A fully constructed service instance.
+        """
+        return cls(HandlerFactory.create(settings))
+
+    @classmethod
+    def using_regex(cls) -> "AsyncService":
+        """
+        Create an AsyncService using the built-in regex-based validation.
+
+        Returns:
+            AsyncService: Regex-backed postcode service.
+        """
+        return cls.create(RegexHandlerSettings())
+
+    @classmethod
+    def using_postcode_io(cls, timeout: float = 5) -> "AsyncService":
+        """
+        Create an AsyncService using the Postcode.io API handler.
+
+        Args:
+            timeout (float): Timeout for HTTP requests in seconds.
+
+        Returns:
+            AsyncService: Postcode.io-backed postcode service.
+        """
+        return cls.create(PostcodeIOHandlerSettings(timeout=timeout))
+
+    @classmethod
+    def using_osdatahub(cls, api_key: str, timeout: float = 5) -> "AsyncService":
+        """
+        Create an AsyncService using the OS Data Hub API handler.
+
+        Args:
+            api_key (str): API key for OS Data Hub.
+            timeout (float): Timeout for HTTP requests in seconds.
+
+        Returns:
+            AsyncService: OS Data Hub-backed postcode service.
+        """
+        return cls.create(OSDataHubHandlerSettings(api_key=api_key, timeout=timeout))
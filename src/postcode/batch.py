@@ -0,0 +1,177 @@
+from typing import Iterator, Optional
+
+from .error import Error
+from .postcode.format import PostcodeFormat
+from .postcode.model import Postcode, PostcodeParts
+from .postcode.value import PostcodeValue
+from .result import Result
+
+
+class PostcodeColumns:
+    """
+    Column-oriented (struct-of-arrays) outcome of a batch parse.
+
+    Instead of one `Result` and `Postcode` model per input, each component is held in
+    its own list, aligned by input position. Invalid rows hold `None` in every component
+    column, `False` in `valid`, and the failure's code in `error_code`.
+
+    ### Examples:
+        columns = service.parse_columns(["SW1A 1AA", "INVALID"])
+        columns.area        # ['SW', None]
+        columns.valid       # [True, False]
+        columns.error_code  # [None, 'POSTCODE_NOT_FOUND_ERROR']
+        columns[0].to_postcode()
+
+    ### Attributes:
+    - format, area, district, sector, unit: Parsed components per row.
+    - valid: Validity mask, one boolean per row.
+    - error_code: Error code per row, `None` for valid rows.
+    - errors: The structured `Error` per row, `None` for valid rows.
+    """
+
+    __slots__ = ("format", "area", "district", "sector", "unit", "valid", "error_code", "errors")
+
+    def __init__(self) -> None:
+        self.format: list[Optional[PostcodeFormat]] = []
+        self.area: list[Optional[str]] = []
+        self.district: list[Optional[str]] = []
+        self.sector: list[Optional[str]] = []
+        self.unit: list[Optional[str]] = []
+        self.valid: list[bool] = []
+        self.error_code: list[Optional[str]] = []
+        self.errors: list[Optional[Error]] = []
+
+    def append_parts(self, parts: PostcodeParts) -> None:
+        """Append a successfully parsed row."""
+        format, area, district, sector, unit = parts
+        self.format.append(format)
+        self.area.append(area)
+        self.district.append(district)
+        self.sector.append(sector)
+        self.unit.append(unit)
+        self.valid.append(True)
+        self.error_code.append(None)
+        self.errors.append(None)
+
+    def append_error(self, error: Error) -> None:
+        """Append a failed row."""
+        self.format.append(None)
+        self.area.append(None)
+        self.district.append(None)
+        self.sector.append(None)
+        self.unit.append(None)
+        self.valid.append(False)
+        self.error_code.append(error.code)
+        self.errors.append(error)
+
+    @property
+    def outcode(self) -> list[Optional[str]]:
+        """Return the outward code (area + district) of each row."""
+        return [f"{a or ''}{d or ''}" if v else None for a, d, v in zip(self.area, self.district, self.valid)]
+
+    @property
+    def incode(self) -> list[Optional[str]]:
+        """Return the inward code (sector + unit) of each row."""
+        return [f"{s or ''}{u or ''}" if v else None for s, u, v in zip(self.sector, self.unit, self.valid)]
+
+    @property
+    def full(self) -> list[Optional[str]]:
+        """Return the full postcode (outward + inward) of each row."""
+        return [f"{o} {i}" if v else None for o, i, v in zip(self.outcode, self.incode, self.valid)]
+
+    def to_dict(self) -> dict[str, list]:
+        """Return the columns as a dictionary, e.g. for building a data frame."""
+        return {
+            "format": self.format,
+            "area": self.area,
+            "district": self.district,
+            "sector": self.sector,
+            "unit": self.unit,
+            "outcode": self.outcode,
+            "incode": self.incode,
+            "valid": self.valid,
+            "error_code": self.error_code,
+        }
+
+    def to_results(self) -> list[Result]:
+        """Materialize a `Result` per row."""
+        return [row.to_result() for row in self]
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __getitem__(self, index: int) -> "PostcodeRow":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PostcodeColumns index out of range")
+        return PostcodeRow(self, index)
+
+    def __iter__(self) -> Iterator["PostcodeRow"]:
+        return (PostcodeRow(self, i) for i in range(len(self)))
+
+
+class PostcodeRow:
+    """A cheap view of a single row in `PostcodeColumns`; models are only built on request."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: PostcodeColumns, index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    @property
+    def valid(self) -> bool:
+        """Return True if the row was parsed successfully."""
+        return self._columns.valid[self._index]
+
+    @property
+    def area(self) -> Optional[str]:
+        """Return the area of the row."""
+        return self._columns.area[self._index]
+
+    @property
+    def district(self) -> Optional[str]:
+        """Return the district of the row."""
+        return self._columns.district[self._index]
+
+    @property
+    def sector(self) -> Optional[str]:
+        """Return the sector of the row."""
+        return self._columns.sector[self._index]
+
+    @property
+    def unit(self) -> Optional[str]:
+        """Return the unit of the row."""
+        return self._columns.unit[self._index]
+
+    @property
+    def error(self) -> Optional[Error]:
+        """Return the structured error for the row, if it failed."""
+        return self._columns.errors[self._index]
+
+    @property
+    def error_code(self) -> Optional[str]:
+        """Return the error code for the row, if it failed."""
+        return self._columns.error_code[self._index]
+
+    def to_postcode(self) -> Optional[Postcode]:
+        """Materialize the row as a `Postcode` model, or None if the row is invalid."""
+        if not self.valid:
+            return None
+        columns, i = self._columns, self._index
+        return Postcode.from_parts((columns.format[i], columns.area[i], columns.district[i], columns.sector[i], columns.unit[i]))
+
+    def to_value(self) -> Optional[PostcodeValue]:
+        """Return the row as a lightweight `PostcodeValue`, or None if the row is invalid."""
+        if not self.valid:
+            return None
+        columns, i = self._columns, self._index
+        return PostcodeValue(columns.format[i], columns.area[i], columns.district[i], columns.sector[i], columns.unit[i])
+
+    def to_result(self) -> Result:
+        """Materialize the row as a `Result`."""
+        return Result.success(self.to_postcode()) if self.valid else Result.failure(self.error)
+
+    def __repr__(self) -> str:
+        return f"PostcodeRow(index={self._index}, valid={self.valid}, postcode={self.to_postcode()}, error_code={self.error_code})"
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .error import Error
+from .handlers.errors import HandlerNoResultsError
+from .postcode.errors import PostcodeNotFoundError
+from .postcode.model import Postcode
+
+
+class CacheSettings(BaseModel):
+    """Settings for the in-process result cache."""
+
+    max_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum number of postcodes held; the least recently used entry is evicted first.",
+    )
+    ttl: Optional[float] = Field(
+        default=3600,
+        gt=0,
+        description="Seconds a successful lookup stays cached. None keeps entries until evicted.",
+    )
+    negative_ttl: Optional[float] = Field(
+        default=300,
+        ge=0,
+        description="Seconds a 'not found' outcome stays cached. 0 disables negative caching, None keeps them until evicted.",
+    )
+
+
+class CacheStats(BaseModel):
+    """A snapshot of cache counters."""
+
+    hits: int = Field(0, description="Lookups answered from the cache.")
+    misses: int = Field(0, description="Lookups that had to go to the handler.")
+    evictions: int = Field(0, description="Entries removed to respect the size bound.")
+    expirations: int = Field(0, description="Entries dropped because their TTL elapsed.")
+    size: int = Field(0, description="Number of entries currently cached.")
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+CacheValue = Union[Postcode, Error]
+
+
+class ResultCache:
+    """
+    A thread-safe, size-bounded LRU cache of lookup outcomes keyed by normalized postcode.
+
+    Successful lookups and definitive misses (`PostcodeNotFoundError`,
+    `HandlerNoResultsError`) are cached with separate TTLs. Transient failures such as
+    timeouts or connection errors are never cached.
+    """
+
+    NEGATIVE_ERRORS = (PostcodeNotFoundError, HandlerNoResultsError)
+
+    def __init__(self, settings: Optional[CacheSettings] = None, clock: Callable[[], float] = time.monotonic):
+        self._settings = settings or CacheSettings()
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[CacheValue, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def settings(self) -> CacheSettings:
+        """Return the cache settings."""
+        return self._settings
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        """Return the cached `Postcode` or negative `Error` for the key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: CacheValue) -> None:
+        """Cache a successful lookup or a negative outcome; other errors are ignored."""
+        if isinstance(value, Error):
+            if not isinstance(value, self.NEGATIVE_ERRORS):
+                return
+            ttl = self._settings.negative_ttl
+            if ttl == 0:
+                return
+        else:
+            ttl = self._settings.ttl
+
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._settings.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss, eviction and expiration counters."""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,17 @@
+from .format import KEY_SIZE, DirectoryColumn, DirectoryHeader, PostcodeDirectory, pack_key, unpack_key
+from .builder import build_directory
+from .hierarchy import HierarchyLevel, PostcodeHierarchy
+from .cli import main
+
+__all__ = [
+    "KEY_SIZE",
+    "DirectoryColumn",
+    "DirectoryHeader",
+    "PostcodeDirectory",
+    "pack_key",
+    "unpack_key",
+    "build_directory",
+    "HierarchyLevel",
+    "PostcodeHierarchy",
+    "main",
+]
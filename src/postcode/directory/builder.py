@@ -0,0 +1,170 @@
+"""
+Streaming builder for postcode directory files.
+
+Directories are built from a postcode CSV (e.g. ONSPD or Code-Point Open), streaming the
+input and sorting it externally in bounded memory. The same is available from the
+command line:
+
+    python -m postcode.directory build ONSPD.csv onspd.pcdir --column pcds --attribute lat:10 --attribute long:10
+    python -m postcode.directory info onspd.pcdir
+"""
+
+import csv
+import heapq
+import os
+import tempfile
+import zlib
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from .format import COPY_SIZE, DESCRIPTOR, HEADER, KEY_SIZE, MAGIC, VERSION, DirectoryColumn, DirectoryHeader, pack_key
+from ..error import Error, InternalError, log_and_raise
+from ..logging import logger
+from ..postcode.normalize import normalize_postcode
+
+
+def _directory_key(postcode: str, parser) -> Optional[bytes]:
+    """Return the packed key of a CSV value if it is a standard (outward + inward code) postcode."""
+    compact = "".join(normalize_postcode(postcode).split())
+    if len(compact) < 5:
+        return None
+    parts = parser.try_handle_parts(f"{compact[:-3]} {compact[-3:]}")
+    if isinstance(parts, Error):
+        return None
+    _, area, _, sector, unit = parts
+    if area is None or sector is None or unit is None or len(unit) != 2:
+        return None
+    return pack_key(compact)
+
+
+def _encode_value(value: str, column: DirectoryColumn) -> bytes:
+    """Encode an attribute value to the column's fixed width."""
+    encoded = value.encode("utf-8")
+    if len(encoded) > column.width:
+        log_and_raise(InternalError(f"Value '{value}' does not fit in column '{column.name}' ({column.width} bytes)."))
+    return encoded.ljust(column.width, b"\0")
+
+
+def _read_records(path: str, size: int) -> Iterator[bytes]:
+    """Yield fixed-size records from a sorted run file."""
+    with open(path, "rb") as f:
+        while True:
+            record = f.read(size)
+            if len(record) < size:
+                return
+            yield record
+
+
+def _write_run(records: list[bytes], directory: str) -> str:
+    """Sort a chunk of records by key and spill it to a temporary run file."""
+    records.sort(key=lambda r: r[:KEY_SIZE])
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"".join(records))
+    return path
+
+
+def _copy(source: BinaryIO, target: BinaryIO, checksum: int) -> int:
+    """Append a file to the output, returning the updated CRC32."""
+    source.seek(0)
+    while chunk := source.read(COPY_SIZE):
+        target.write(chunk)
+        checksum = zlib.crc32(chunk, checksum)
+    return checksum
+
+
+def build_directory(
+    source: str,
+    target: str,
+    column: str = "pcds",
+    attributes: Optional[Iterable[DirectoryColumn]] = None,
+    chunk_size: int = 1_000_000,
+    encoding: str = "utf-8-sig",
+) -> DirectoryHeader:
+    """
+    Build a postcode directory file from a CSV and return its header.
+
+    Rows are streamed from `source` and sorted in runs of `chunk_size`, which are merged
+    from temporary files, so memory use does not grow with the input. Postcodes are
+    normalized and checked against the regex rules; rows that are not standard UK
+    postcodes are skipped, and for duplicated postcodes the first row wins. The output is
+    written to a temporary file and moved into place.
+
+    Args:
+        source (str): Path to the postcode CSV.
+        target (str): Path of the directory file to write.
+        column (str): Name of the CSV column holding the postcode.
+        attributes (Optional[Iterable[DirectoryColumn]]): CSV columns to store alongside each postcode.
+        chunk_size (int): Number of rows sorted in memory at a time.
+        encoding (str): Encoding of the CSV.
+
+    Returns:
+        DirectoryHeader: The header of the written directory.
+    """
+    from ..handlers.regex import RegexHandler
+
+    columns = list(attributes or [])
+    record_size = KEY_SIZE + sum(c.width for c in columns)
+    parser = RegexHandler.default()
+    output_dir = os.path.dirname(os.path.abspath(target))
+    skipped = 0
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as workdir:
+        runs: list[str] = []
+        records: list[bytes] = []
+        with open(source, newline="", encoding=encoding) as f:
+            reader = csv.DictReader(f)
+            missing = [name for name in [column, *(c.name for c in columns)] if name not in (reader.fieldnames or [])]
+            if missing:
+                log_and_raise(InternalError(f"Postcode CSV '{source}' has no column(s) {', '.join(missing)}."))
+            for row in reader:
+                key = _directory_key(row[column] or "", parser)
+                if key is None:
+                    skipped += 1
+                    continue
+                records.append(key + b"".join(_encode_value(row[c.name] or "", c) for c in columns))
+                if len(records) >= chunk_size:
+                    runs.append(_write_run(records, workdir))
+                    records = []
+
+        if runs:
+            if records:
+                runs.append(_write_run(records, workdir))
+            merged = heapq.merge(*(_read_records(run, record_size) for run in runs), key=lambda r: r[:KEY_SIZE])
+        else:
+            records.sort(key=lambda r: r[:KEY_SIZE])
+            merged = iter(records)
+
+        blocks = [tempfile.TemporaryFile(dir=workdir) for _ in range(len(columns) + 1)]
+        count, previous = 0, None
+        for record in merged:
+            key = record[:KEY_SIZE]
+            if key == previous:
+                continue
+            previous = key
+            count += 1
+            blocks[0].write(key)
+            offset = KEY_SIZE
+            for block, c in zip(blocks[1:], columns):
+                block.write(record[offset : offset + c.width])
+                offset += c.width
+        records = []
+
+        fd, tmp = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(b"\0" * HEADER.size)
+                descriptors = b"".join(DESCRIPTOR.pack(c.name.encode("utf-8"), c.width) for c in columns)
+                out.write(descriptors)
+                checksum = zlib.crc32(descriptors)
+                for block in blocks:
+                    checksum = _copy(block, out, checksum)
+                    block.close()
+                out.seek(0)
+                out.write(HEADER.pack(MAGIC, VERSION, KEY_SIZE, count, len(columns), checksum))
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    logger.info("Built postcode directory '%s' with %d postcodes (%d rows skipped)", target, count, skipped)
+    return DirectoryHeader(count=count, columns=columns, checksum=checksum)
@@ -0,0 +1,38 @@
+import argparse
+from typing import Optional
+
+from .builder import build_directory
+from .format import DirectoryColumn, PostcodeDirectory
+
+
+def _parse_attribute(value: str) -> DirectoryColumn:
+    name, _, width = value.rpartition(":")
+    if not name or not width.isdigit():
+        raise argparse.ArgumentTypeError(f"expected NAME:WIDTH, got '{value}'")
+    return DirectoryColumn(name=name, width=int(width))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point for building and inspecting directory files."""
+    parser = argparse.ArgumentParser(prog="postcode-directory", description="Build and inspect compact postcode directory files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Build a directory file from a postcode CSV.")
+    build.add_argument("source", help="Path to the postcode CSV, e.g. an ONSPD or Code-Point Open extract.")
+    build.add_argument("target", help="Path of the directory file to write.")
+    build.add_argument("--column", default="pcds", help="CSV column holding the postcode (default: pcds).")
+    build.add_argument("--attribute", action="append", type=_parse_attribute, default=[], metavar="NAME:WIDTH")
+    build.add_argument("--chunk-size", type=int, default=1_000_000, help="Rows sorted in memory at a time.")
+
+    info = commands.add_parser("info", help="Validate a directory file and print its header.")
+    info.add_argument("path", help="Path of the directory file.")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        header = build_directory(args.source, args.target, args.column, args.attribute, args.chunk_size)
+    else:
+        directory = PostcodeDirectory(args.path)
+        header = directory.header
+        directory.close()
+    print(header.model_dump_json(indent=2))
+    return 0
@@ -0,0 +1,208 @@
+"""
+Compact binary postcode directory format.
+
+A directory file holds a sorted set of postcodes, plus optional fixed-width attribute
+columns, in a form that can be memory-mapped and binary-searched without parsing:
+
+    header         magic, version, key size, postcode count, column count, CRC32
+    descriptors    one (name, width) entry per attribute column
+    key block      `count` keys of `KEY_SIZE` bytes, sorted ascending
+    column blocks  one block of `count * width` bytes per attribute column
+
+Keys pack the outward code padded to 4 characters followed by the 3-character inward
+code (e.g. `L1  8JQ`) as a base-37 number in 5 big-endian bytes, so byte order matches
+postcode order and ~2.6M UK postcodes take about 13 MB. Attribute values are UTF-8,
+NUL-padded to the column width. The CRC32 covers everything after the header.
+
+Directories are written by `postcode.directory.builder` and read by `PostcodeDirectory`.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from ..error import InternalError, log_and_raise
+from ..postcode.normalize import normalize_postcode
+
+MAGIC = b"PCDIR\x00\r\n"
+VERSION = 1
+KEY_SIZE = 5
+HEADER = struct.Struct("<8sHHQHxxI")
+DESCRIPTOR = struct.Struct("<32sH")
+
+ALPHABET = " 0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = {c: i for i, c in enumerate(ALPHABET)}
+_BASE = len(ALPHABET)
+COPY_SIZE = 1 << 20
+
+
+class DirectoryColumn(BaseModel):
+    """A fixed-width attribute column of a postcode directory."""
+
+    name: str = Field(..., max_length=32, description="Name of the column, e.g. the CSV header it was built from.")
+    width: int = Field(..., ge=1, le=65535, description="Width of each value in bytes.")
+
+
+class DirectoryHeader(BaseModel):
+    """The header of a postcode directory file."""
+
+    version: int = Field(VERSION, description="Format version.")
+    count: int = Field(..., description="Number of postcodes in the directory.")
+    columns: list[DirectoryColumn] = Field(default_factory=list, description="Attribute columns, in file order.")
+    checksum: int = Field(0, description="CRC32 of everything after the header.")
+
+
+def pack_key(postcode: str) -> Optional[bytes]:
+    """
+    Return the packed key of a postcode, or None if it cannot be stored in a directory.
+
+    The postcode is normalized first, so `sw1w0ny`, `SW1W 0NY` and `SW1W  0NY` share a key.
+    """
+    compact = "".join(normalize_postcode(postcode).split())
+    if not 5 <= len(compact) <= 7 or any(c not in _DIGITS for c in compact):
+        return None
+    return pack_text(compact[:-3].ljust(4) + compact[-3:])
+
+
+def pack_text(text: str) -> bytes:
+    """Pack a 7-character key text (outward code padded to 4, then inward code) into a key."""
+    value = 0
+    for c in text:
+        value = value * _BASE + _DIGITS[c]
+    return value.to_bytes(KEY_SIZE, "big")
+
+
+def unpack_key(key: bytes) -> str:
+    """Return the postcode, in `OUTCODE INCODE` form, stored under a packed key."""
+    value = int.from_bytes(key, "big")
+    chars = []
+    for _ in range(7):
+        value, digit = divmod(value, _BASE)
+        chars.append(ALPHABET[digit])
+    text = "".join(reversed(chars))
+    return f"{text[:4].rstrip()} {text[4:]}"
+
+
+class PostcodeDirectory:
+    """A read-only, memory-mapped postcode directory file."""
+
+    def __init__(self, path: str, verify: bool = True):
+        self._path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                self._corrupt("file is too short")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, key_size, count, column_count, checksum = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._corrupt("not a postcode directory")
+        if version != VERSION or key_size != KEY_SIZE:
+            self._corrupt(f"unsupported version {version}")
+
+        columns = []
+        for i in range(column_count):
+            name, width = DESCRIPTOR.unpack_from(self._mmap, HEADER.size + i * DESCRIPTOR.size)
+            columns.append(DirectoryColumn(name=name.rstrip(b"\0").decode("utf-8"), width=width))
+        self._header = DirectoryHeader(version=version, count=count, columns=columns, checksum=checksum)
+
+        self._keys = HEADER.size + column_count * DESCRIPTOR.size
+        self._offsets = {}
+        offset = self._keys + count * KEY_SIZE
+        for column in columns:
+            self._offsets[column.name] = (offset, column.width)
+            offset += count * column.width
+        if offset != size:
+            self._corrupt(f"expected {offset} bytes, found {size}")
+        if verify:
+            self.verify()
+
+    @property
+    def header(self) -> DirectoryHeader:
+        """Return the directory header."""
+        return self._header
+
+    @property
+    def columns(self) -> list[DirectoryColumn]:
+        """Return the attribute columns."""
+        return self._header.columns
+
+    def __len__(self) -> int:
+        return self._header.count
+
+    def __contains__(self, postcode: str) -> bool:
+        return self.find(postcode) is not None
+
+    def verify(self) -> None:
+        """Check the CRC32 of the file, raising `InternalError` if it does not match."""
+        checksum = 0
+        for start in range(HEADER.size, len(self._mmap), COPY_SIZE):
+            checksum = zlib.crc32(self._mmap[start : start + COPY_SIZE], checksum)
+        if checksum != self._header.checksum:
+            self._corrupt("checksum mismatch")
+
+    def key_at(self, position: int) -> bytes:
+        """Return the packed key at a position."""
+        offset = self._keys + position * KEY_SIZE
+        return self._mmap[offset : offset + KEY_SIZE]
+
+    def key_block(self) -> bytes:
+        """Return a copy of the sorted key block."""
+        return self._mmap[self._keys : self._keys + self._header.count * KEY_SIZE]
+
+    def postcode_at(self, position: int) -> str:
+        """Return the postcode at a position, in `OUTCODE INCODE` form."""
+        return unpack_key(self.key_at(position))
+
+    def bisect_left(self, key: bytes) -> int:
+        """Return the position of the first key not less than `key`."""
+        lo, hi = 0, self._header.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def bisect_right(self, key: bytes) -> int:
+        """Return the position of the first key greater than `key`."""
+        lo, hi = 0, self._header.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, postcode: str) -> Optional[int]:
+        """Return the position of a postcode, or None if it is not in the directory."""
+        key = pack_key(postcode)
+        if key is None:
+            return None
+        position = self.bisect_left(key)
+        if position < self._header.count and self.key_at(position) == key:
+            return position
+        return None
+
+    def attribute(self, position: int, name: str) -> str:
+        """Return an attribute value of the postcode at a position."""
+        offset, width = self._offsets[name]
+        start = offset + position * width
+        return self._mmap[start : start + width].rstrip(b"\0").decode("utf-8")
+
+    def attributes(self, position: int) -> dict[str, str]:
+        """Return every attribute value of the postcode at a position."""
+        return {name: self.attribute(position, name) for name in self._offsets}
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def _corrupt(self, reason: str) -> None:
+        log_and_raise(InternalError(f"Invalid postcode directory '{self._path}': {reason}."))
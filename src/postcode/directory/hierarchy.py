@@ -0,0 +1,114 @@
+"""
+Hierarchical queries over a postcode directory.
+
+Postcodes in a directory are sorted by their packed key, so every area, district and
+sector occupies one contiguous range of positions. A query turns a prefix such as `SW`,
+`SW1A` or `SW1A 1` into that range with two binary searches:
+
+- count: the size of the range, in O(log n).
+- enumerate: the postcodes in the range, in O(result).
+- children: the next level down with their counts, found by skipping from one child's
+  range to the next, in O(children * log n) without visiting the postcodes themselves.
+"""
+
+import re
+from enum import Enum
+from typing import Iterator
+
+from .format import PostcodeDirectory, pack_text
+from ..error import log_and_raise
+from ..postcode.errors import PostcodeFormatError
+from ..postcode.normalize import normalize_postcode
+
+_PREFIX = re.compile(
+    r"^(?:(?P<area>[A-Z]{1,4})(?P<district>[0-9][0-9A-Z]?)?" r"(?: ?(?P<unit_sector>[0-9])(?P<unit>[A-Z]{2})| (?P<sector>[0-9]))?)?$"
+)
+_AREA = re.compile(r"^[A-Z]+")
+
+
+class HierarchyLevel(str, Enum):
+    """Enumeration of the levels of the postcode hierarchy."""
+
+    ROOT = "root"
+    AREA = "area"
+    DISTRICT = "district"
+    SECTOR = "sector"
+    UNIT = "unit"
+
+
+class PostcodeHierarchy:
+    """Area, district, sector and unit queries over a `PostcodeDirectory`."""
+
+    def __init__(self, directory: PostcodeDirectory):
+        self._directory = directory
+
+    @staticmethod
+    def level(prefix: str) -> HierarchyLevel:
+        """Return the level a prefix addresses, e.g. `SW1A` is a district and `SW1A 1` a sector."""
+        return PostcodeHierarchy._parse(prefix)[0]
+
+    def count(self, prefix: str = "") -> int:
+        """Return the number of postcodes under a prefix; an empty prefix counts the whole directory."""
+        start, end = self._range(prefix)
+        return end - start
+
+    def postcodes(self, prefix: str = "") -> Iterator[str]:
+        """Yield the postcodes under a prefix in sorted order."""
+        start, end = self._range(prefix)
+        for position in range(start, end):
+            yield self._directory.postcode_at(position)
+
+    def children(self, prefix: str = "") -> dict[str, int]:
+        """
+        Return the entries one level below a prefix with their postcode counts, in sorted order.
+
+        The children of the root are areas, of an area its districts (outward codes), of a
+        district its sectors (e.g. `SW1A 1`) and of a sector its units (full postcodes).
+        """
+        level, _ = self._parse(prefix)
+        start, end = self._range(prefix)
+        children: dict[str, int] = {}
+        position = start
+        while position < end:
+            postcode = self._directory.postcode_at(position)
+            outcode, incode = postcode.split(" ")
+            if level is HierarchyLevel.ROOT:
+                child = _AREA.match(outcode).group()
+            elif level is HierarchyLevel.AREA:
+                child = outcode
+            elif level is HierarchyLevel.DISTRICT:
+                child = f"{outcode} {incode[0]}"
+            else:
+                child = postcode
+            child_end = min(end, self._range(child)[1])
+            children[child] = child_end - position
+            position = child_end
+        return children
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        """Return the [start, end) positions of the postcodes under a prefix."""
+        level, text = self._parse(prefix)
+        # An area's districts start with a digit, so `S` must not reach into `SW`.
+        upper = text + "9" if level is HierarchyLevel.AREA else text
+        lower, upper = pack_text(text.ljust(7, " ")), pack_text(upper.ljust(7, "Z"))
+        return self._directory.bisect_left(lower), self._directory.bisect_right(upper)
+
+    @staticmethod
+    def _parse(prefix: str) -> tuple[HierarchyLevel, str]:
+        """Return the level of a prefix and the start of the key text shared by the postcodes under it."""
+        text = " ".join(normalize_postcode(prefix).split())
+        match = _PREFIX.match(text)
+        if match is None:
+            log_and_raise(PostcodeFormatError(prefix, f"'{prefix}' is not a postcode area, district, sector or unit."))
+
+        area, district = match["area"], match["district"]
+        outcode = f"{area or ''}{district or ''}".ljust(4)
+        if match["unit"]:
+            return HierarchyLevel.UNIT, outcode + match["unit_sector"] + match["unit"]
+        if match["sector"]:
+            return HierarchyLevel.SECTOR, outcode + match["sector"]
+        if district:
+            return HierarchyLevel.DISTRICT, outcode
+        if area:
+            return HierarchyLevel.AREA, area
+        return HierarchyLevel.ROOT, ""
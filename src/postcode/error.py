@@ -1,27 +1,76 @@
-from .logging import logger
+from typing import Any, Optional
+
+from .logging import error_summary
 
 
 class Error(Exception):
-    """A structured error with a code and message."""
+    """
+    A structured error with a code and message.
+
+    The message may be given as a `str.format` template with its `params`, which is only
+    formatted the first time the message is read. Errors returned as values in bulk
+    operations are often only counted or checked by code, so their messages are never
+    formatted. The template and params are kept in `args`, so errors pickle and cross
+    process boundaries like any other exception.
+    """
+
+    _reported = False
 
-    def __init__(self, code: str, message: str) -> None:
+    def __init__(self, code: str, message: str, params: Optional[dict[str, Any]] = None) -> None:
         self.code = code
-        self.message = message
-        super().__init__(message)
+        self._message = message
+        self._params = params
+        if params:
+            super().__init__(message, params)
+        else:
+            super().__init__(message)
+
+    @property
+    def message(self) -> str:
+        """Return the error message, formatting it on first access."""
+        if self._params is not None:
+            self._message, self._params = self._message.format(**self._params), None
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message, self._params = message, None
 
     def __str__(self) -> str:
         return f"[{self.code}] {self.message}"
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __reduce__(self):
+        # Subclass constructors take different arguments than `args`, so rebuild from the state.
+        return _restore, (type(self), self.args, self.__dict__)
+
+
+def _restore(cls: type, args: tuple, state: dict) -> Error:
+    """Recreate a pickled `Error` without calling its constructor."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
 
 class InternalError(Error):
     """A generic internal error for unexpected failures."""
 
     def __init__(self, message: str = "An internal error occurred.") -> None:
         super().__init__("INTERNAL_ERROR", message)
-        logger.exception(message)
 
 
 def log_and_raise(error: Error) -> None:
-    """Log the exception and raise it."""
-    logger.error(str(error), stacklevel=3)
+    """
+    Log the exception and raise it.
+
+    Errors are logged through `error_summary`, so repeats of the same code are counted
+    and summarized rather than logged one by one. An error re-raised by an outer layer
+    is only reported once.
+    """
+    if not error._reported:
+        error._reported = True
+        error_summary.report(error, stacklevel=3)
     raise error
@@ -1,7 +1,20 @@
 from .base import BaseHandler, BaseHandlerSettings
 from .regex import RegexHandler, RegexHandlerSettings
+from .http.base import BaseHttpHandler, BaseHttpHandlerSettings
 from .http.osdatahub import OSDataHubHandlerSettings, OSDataHubHttpHandler
 from .http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from .http.ratelimit import FileTokenBucket, TokenBucket
+from .dataset import LocalDatasetHandler, LocalDatasetHandlerSettings
+from .wrapper import BaseWrapperHandler, WrapperHandlerSettings
+from .sqlite_cache import SqliteCacheHandler, SqliteCacheHandlerSettings
+from .breaker import (
+    CircuitBreaker,
+    CircuitBreakerHandler,
+    CircuitBreakerHandlerSettings,
+    CircuitBreakerSnapshot,
+    CircuitState,
+)
+from .chain import ChainHandler, ChainHandlerSettings, ChainTierSettings, ChainTierStats
 from .factory import HandlerFactory
 from .errors import (
     HandlerError,
@@ -11,6 +24,8 @@ from .errors import (
     HandlerConnectionError,
     HandlerAPIError,
     HandlerNoResultsError,
+    HandlerCircuitOpenError,
+    HandlerRateLimitError,
 )
 
 __all__ = [
@@ -18,10 +33,29 @@ __all__ = [
     "BaseHandlerSettings",
     "RegexHandler",
     "RegexHandlerSettings",
+    "BaseHttpHandler",
+    "BaseHttpHandlerSettings",
     "OSDataHubHandlerSettings",
     "OSDataHubHttpHandler",
     "PostcodeIOHandlerSettings",
     "PostcodeIOHttpHandler",
+    "TokenBucket",
+    "FileTokenBucket",
+    "LocalDatasetHandler",
+    "LocalDatasetHandlerSettings",
+    "BaseWrapperHandler",
+    "WrapperHandlerSettings",
+    "SqliteCacheHandler",
+    "SqliteCacheHandlerSettings",
+    "CircuitBreaker",
+    "CircuitBreakerHandler",
+    "CircuitBreakerHandlerSettings",
+    "CircuitBreakerSnapshot",
+    "CircuitState",
+    "ChainHandler",
+    "ChainHandlerSettings",
+    "ChainTierSettings",
+    "ChainTierStats",
     "HandlerFactory",
     "HandlerError",
     "HandlerErrorCode",
@@ -30,4 +64,6 @@ __all__ = [
     "HandlerConnectionError",
     "HandlerAPIError",
     "HandlerNoResultsError",
+    "HandlerCircuitOpenError",
+    "HandlerRateLimitError",
 ]
@@ -1,11 +1,24 @@
+import time
 from abc import ABC, abstractmethod
+from typing import Union
 
 from pydantic import BaseModel, Field
 
 from .errors import HandlerError
-from ..postcode.model import Postcode
+from ..postcode.model import Postcode, PostcodeParts
 from ..postcode.errors import PostcodeError
 from ..error import log_and_raise, InternalError, Error
+from ..logging import error_summary, logger
+from ..metrics import HANDLER_BULK_LOOKUPS, HANDLER_BULK_SECONDS, HANDLER_SECONDS
+from ..tracing import current_tracer, start_as_current_span
+
+_lookup_metrics: dict[type, tuple] = {}
+
+
+def _register_lookup_metrics(cls: type) -> tuple:
+    """Return the (ok, error) latency histogram children for a handler class, creating them on first use."""
+    metrics = (HANDLER_SECONDS.labels(cls.__name__, "ok"), HANDLER_SECONDS.labels(cls.__name__, "error"))
+    return _lookup_metrics.setdefault(cls, metrics)
 
 
 class BaseHandlerSettings(BaseModel):
@@ -14,26 +27,201 @@ class BaseHandlerSettings(BaseModel):
     type: str = Field(
         description="Type of the handler, used for identification.",
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of concurrent lookups when parsing in bulk.",
+    )
 
 
 class BaseHandler(ABC):
     """Base class for postcode handlers."""
 
-    def handle(self, postcode: str) -> Postcode:
-        """Handle a postcode string and return a Postcode."""
+    _settings: BaseHandlerSettings
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of concurrent lookups for bulk parsing."""
+        return self._settings.max_workers
+
+    @property
+    def supports_bulk(self) -> bool:
+        """Return True if `handle_many` resolves several postcodes per upstream call."""
+        return False
+
+    @property
+    def bulk_size(self) -> int:
+        """Return the maximum number of postcodes passed to a single `handle_many` call."""
+        return 1
+
+    def handle(self, postcode: str, timed: bool = True) -> Postcode:
+        """
+        Handle a postcode string and return a Postcode, recording the lookup in the handler metrics and tracer.
+
+        Callers that already time the lookup, like `Service.parse_one`, pass `timed=False` to skip the handler metrics.
+        """
+        if not timed:
+            try:
+                return self._handle(postcode) if current_tracer() is None else self._traced_handle(postcode)
+            except Exception as e:
+                self._fail(postcode, e)
+
+        start, outcome = time.perf_counter(), 1
         try:
-            return self._handle(postcode)
+            value = self._handle(postcode) if current_tracer() is None else self._traced_handle(postcode)
+            outcome = 0
+            return value
 
-        except (PostcodeError, HandlerError, Error) as e:
-            log_and_raise(e)
+        except Exception as e:
+            self._fail(postcode, e)
+
+        finally:
+            metrics = _lookup_metrics.get(type(self)) or _register_lookup_metrics(type(self))
+            metrics[outcome].observe(time.perf_counter() - start)
+
+    def handle_parts(self, postcode: str) -> PostcodeParts:
+        """Handle a postcode string and return its (format, area, district, sector, unit) parts."""
+        try:
+            return self._handle_parts(postcode)
 
         except Exception as e:
-            log_and_raise(
-                InternalError(
-                    f"An unexpected error occurred while handling postcode '{postcode}': {str(e)}",
-                ),
-            )
+            self._fail(postcode, e)
+
+    def try_handle_parts(self, postcode: str) -> Union[PostcodeParts, Error]:
+        """
+        Handle a postcode string and return its parts, or the error instead of raising it.
+
+        Returned errors are not logged and carry no traceback. Handlers that can detect
+        failures without raising override `_try_handle_parts`.
+        """
+        start = time.perf_counter()
+        try:
+            outcome = self._try_handle_parts(postcode)
+        except Error as e:
+            outcome = e.with_traceback(None)
+        except Exception as e:
+            outcome = InternalError(f"An unexpected error occurred while handling postcode '{postcode}': {str(e)}")
+            logger.exception(str(outcome))
+
+        metrics = _lookup_metrics.get(type(self)) or _register_lookup_metrics(type(self))
+        metrics[isinstance(outcome, Error)].observe(time.perf_counter() - start)
+        return outcome
+
+    def handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """
+        Handle several postcode strings, returning a Postcode or an Error for each.
+
+        Failures are returned in place rather than raised, so one bad postcode does not
+        affect the others. Handlers with a bulk upstream API override `_handle_many`.
+        """
+        start = time.perf_counter()
+        try:
+            outcomes = self._handle_many(postcodes)
+        except Exception as e:
+            if isinstance(e, Error):
+                error = e
+            else:
+                error = InternalError(f"An unexpected error occurred while handling postcodes in bulk: {str(e)}")
+                logger.exception(str(error))
+            outcomes = [error] * len(postcodes)
+
+        failed = 0
+        for outcome in outcomes:
+            if isinstance(outcome, Error):
+                failed += 1
+                # Nested bulk handlers (chain tiers, wrappers) pass the same errors up; report each only once.
+                if not outcome._reported:
+                    outcome._reported = True
+                    error_summary.report(outcome)
+
+        name = type(self).__name__
+        HANDLER_BULK_SECONDS.labels(name).observe(time.perf_counter() - start)
+        HANDLER_BULK_LOOKUPS.labels(name, "ok").inc(len(outcomes) - failed)
+        HANDLER_BULK_LOOKUPS.labels(name, "error").inc(failed)
+        return outcomes
+
+    async def ahandle(self, postcode: str, timed: bool = True) -> Postcode:
+        """Handle a postcode string asynchronously and return a Postcode, recording the lookup in the handler metrics unless `timed` is False."""
+        if not timed:
+            try:
+                return await self._ahandle(postcode)
+            except Exception as e:
+                self._fail(postcode, e)
+
+        start, outcome = time.perf_counter(), 1
+        try:
+            value = await self._ahandle(postcode)
+            outcome = 0
+            return value
+
+        except Exception as e:
+            self._fail(postcode, e)
+
+        finally:
+            metrics = _lookup_metrics.get(type(self)) or _register_lookup_metrics(type(self))
+            metrics[outcome].observe(time.perf_counter() - start)
+
+    def _traced_handle(self, postcode: str) -> Postcode:
+        """Run `_handle` inside a span tagged with the handler type and the postcode format."""
+        with start_as_current_span("postcode.handle", attributes={"postcode.handler": type(self).__name__}) as span:
+            value = self._handle(postcode)
+            span.set_attribute("postcode.format", value.format.value)
+            return value
 
     @abstractmethod
     def _handle(self, postcode: str) -> Postcode:
         """Handle a postcode string and return a Postcode."""
+
+    def _handle_parts(self, postcode: str) -> PostcodeParts:
+        """
+        Handle a postcode string and return its parts.
+
+        Handlers that can produce the parts directly override this to skip building
+        a `Postcode` model per lookup.
+        """
+        return self._handle(postcode).parts
+
+    def _try_handle_parts(self, postcode: str) -> Union[PostcodeParts, Error]:
+        """Handle a postcode string and return its parts or an error; errors may also be raised."""
+        return self._handle_parts(postcode)
+
+    def _handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Handle several postcode strings one at a time."""
+        outcomes: list[Union[Postcode, Error]] = []
+        for postcode in postcodes:
+            try:
+                outcomes.append(self._handle(postcode))
+            except Error as e:
+                outcomes.append(e.with_traceback(None))
+            except Exception as e:
+                error = InternalError(f"An unexpected error occurred while handling postcode '{postcode}': {str(e)}")
+                logger.exception(str(error))
+                outcomes.append(error)
+        return outcomes
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """
+        Handle a postcode string without blocking the event loop.
+
+        Handlers that do no I/O run their synchronous implementation inline; handlers
+        backed by a remote service override this with a native non-blocking version.
+        """
+        return self._handle(postcode)
+
+    def close(self) -> None:
+        """Release any resources held by the handler, such as pooled connections."""
+
+    async def aclose(self) -> None:
+        """Release any resources held for asynchronous lookups."""
+
+    @staticmethod
+    def _fail(postcode: str, error: Exception) -> None:
+        """Log and re-raise a handler failure, wrapping unexpected errors."""
+        if isinstance(error, (PostcodeError, HandlerError, Error)):
+            log_and_raise(error)
+
+        log_and_raise(
+            InternalError(
+                f"An unexpected error occurred while handling postcode '{postcode}': {str(error)}",
+            ),
+        )
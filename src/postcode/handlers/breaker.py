@@ -0,0 +1,304 @@
+"""
+Circuit breaker for unreliable handlers.
+
+This module defines a handler that wraps another handler (typically one of the HTTP
+handlers) and stops calling it while it is failing, so a provider outage does not turn
+into a latency outage for callers.
+
+The breaker follows the usual three states:
+- CLOSED: calls pass through; outcomes are recorded in a rolling window of recent calls.
+- OPEN: once the failure rate in the window crosses the threshold, calls are rejected
+  immediately (or answered by the regex fallback) for `open_duration` seconds.
+- HALF_OPEN: after that, a limited number of probe calls are let through; if they all
+  succeed the breaker closes again, and any failure re-opens it.
+
+Only availability failures count against the breaker: timeouts, connection errors and
+5xx responses. A definitive "not found" answer (including a 404) means the upstream is
+healthy and counts as a success.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .errors import HandlerAPIError, HandlerCircuitOpenError, HandlerConnectionError, HandlerTimeoutError
+from .regex import RegexHandler
+from .types import HandlerType
+from .wrapper import BaseWrapperHandler, WrapperHandlerSettings
+from ..error import Error
+from ..logging import logger
+from ..postcode.model import Postcode
+
+FAILURE_ERRORS = (HandlerTimeoutError, HandlerConnectionError, HandlerAPIError)
+
+
+def is_failure(error: object) -> bool:
+    """Return True if the error means the upstream is unavailable: a timeout, a connection error or a 5xx status."""
+    if isinstance(error, HandlerAPIError):
+        return error.status_code >= 500
+    return isinstance(error, FAILURE_ERRORS)
+
+
+class CircuitState(str, Enum):
+    """Enumeration of circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerSnapshot(BaseModel):
+    """A point-in-time view of a circuit breaker, for monitoring."""
+
+    state: CircuitState = Field(..., description="Current state of the breaker.")
+    failure_rate: float = Field(..., description="Failure rate over the calls in the rolling window.")
+    calls_in_window: int = Field(..., description="Number of calls in the rolling window.")
+    rejected: int = Field(..., description="Calls rejected while the breaker was open.")
+    opened: int = Field(..., description="Number of times the breaker has opened.")
+    opened_at: Optional[float] = Field(None, description="Clock time at which the breaker last opened.")
+
+
+class CircuitBreaker:
+    """A thread-safe, count-based circuit breaker."""
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        open_duration: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._window: deque[bool] = deque(maxlen=window_size)
+        self._minimum_calls = minimum_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._open_duration = open_duration
+        self._half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving from OPEN to HALF_OPEN once the open period has elapsed."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed; every allowed call must be followed by a `record_*` or `release` call."""
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight < self._half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy upstream."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+                self._probe_successes += 1
+                if self._probe_successes >= self._half_open_probes:
+                    self._close()
+                return
+            self._window.append(True)
+
+    def record_failure(self) -> None:
+        """Record a call that failed because the upstream was unavailable."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+                self._open()
+                return
+            self._window.append(False)
+            if self._state is CircuitState.CLOSED and len(self._window) >= self._minimum_calls:
+                if self._failure_rate() >= self._failure_rate_threshold:
+                    self._open()
+
+    def release(self) -> None:
+        """Give back the permit of an allowed call that ended without an outcome, e.g. because it was cancelled."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def snapshot(self) -> CircuitBreakerSnapshot:
+        """Return the breaker state and counters."""
+        with self._lock:
+            self._refresh()
+            return CircuitBreakerSnapshot(
+                state=self._state,
+                failure_rate=self._failure_rate(),
+                calls_in_window=len(self._window),
+                rejected=self._rejected,
+                opened=self._opened,
+                opened_at=self._opened_at,
+            )
+
+    def reset(self) -> None:
+        """Force the breaker closed and clear the rolling window."""
+        with self._lock:
+            self._close()
+
+    def _failure_rate(self) -> float:
+        return self._window.count(False) / len(self._window) if self._window else 0.0
+
+    def _refresh(self) -> None:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self._open_duration:
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info("Circuit breaker half-open; probing upstream")
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._opened += 1
+        logger.warning("Circuit breaker opened (failure rate %.0f%%)", self._failure_rate() * 100)
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._window.clear()
+        self._opened_at = None
+        logger.info("Circuit breaker closed")
+
+
+class CircuitBreakerHandlerSettings(WrapperHandlerSettings):
+    """Settings for the circuit breaker handler."""
+
+    type: str = Field(
+        default=HandlerType.CIRCUIT_BREAKER.value,
+        description="Type of the handler, used for identification.",
+        init=False,
+    )
+
+    window_size: int = Field(default=20, ge=1, description="Number of recent calls used to compute the failure rate.")
+    minimum_calls: int = Field(default=10, ge=1, description="Calls required in the window before the breaker can open.")
+    failure_rate_threshold: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description="Failure rate at or above which the breaker opens.",
+    )
+    open_duration: float = Field(default=30.0, gt=0, description="Seconds the breaker stays open before probing.")
+    half_open_probes: int = Field(default=1, ge=1, description="Successful probe calls required to close the breaker.")
+    fallback_to_regex: bool = Field(
+        default=False,
+        description="Answer with the offline regex handler instead of failing while the upstream is unavailable.",
+    )
+
+
+class CircuitBreakerHandler(BaseWrapperHandler):
+    """Handler that guards another handler with a circuit breaker and an optional regex fallback."""
+
+    def __init__(self, settings: CircuitBreakerHandlerSettings, clock: Callable[[], float] = time.monotonic):
+        super().__init__(settings)
+        self._breaker = CircuitBreaker(
+            window_size=settings.window_size,
+            minimum_calls=settings.minimum_calls,
+            failure_rate_threshold=settings.failure_rate_threshold,
+            open_duration=settings.open_duration,
+            half_open_probes=settings.half_open_probes,
+            clock=clock,
+        )
+        self._fallback = RegexHandler.default() if settings.fallback_to_regex else None
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker, e.g. to read its state for monitoring."""
+        return self._breaker
+
+    @property
+    def supports_bulk(self) -> bool:
+        """Return True if the wrapped handler supports bulk lookups."""
+        return self._inner.supports_bulk
+
+    @property
+    def bulk_size(self) -> int:
+        """Return the wrapped handler's bulk size."""
+        return self._inner.bulk_size
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Call the wrapped handler unless the breaker is open."""
+        if not self._breaker.allow():
+            return self._degrade(postcode, HandlerCircuitOpenError(self._inner.__class__.__name__))
+
+        try:
+            value = self._inner.handle(postcode)
+        except Error as e:
+            if not is_failure(e):
+                self._breaker.record_success()
+                raise
+            self._breaker.record_failure()
+            return self._degrade(postcode, e)
+        except BaseException:
+            self._breaker.release()
+            raise
+
+        self._breaker.record_success()
+        return value
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """Await the wrapped handler unless the breaker is open."""
+        if not self._breaker.allow():
+            return self._degrade(postcode, HandlerCircuitOpenError(self._inner.__class__.__name__))
+
+        try:
+            value = await self._inner.ahandle(postcode)
+        except Error as e:
+            if not is_failure(e):
+                self._breaker.record_success()
+                raise
+            self._breaker.record_failure()
+            return self._degrade(postcode, e)
+        except BaseException:
+            self._breaker.release()
+            raise
+
+        self._breaker.record_success()
+        return value
+
+    def _handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Call the wrapped handler's bulk lookup unless the breaker is open; one chunk counts as one call."""
+        if not self._breaker.allow():
+            error = HandlerCircuitOpenError(self._inner.__class__.__name__)
+            return [self._degrade_value(p, error) for p in postcodes]
+
+        try:
+            outcomes = self._inner.handle_many(postcodes)
+        except BaseException:
+            self._breaker.release()
+            raise
+        if outcomes and all(is_failure(o) for o in outcomes):
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return [self._degrade_value(p, o) if is_failure(o) else o for p, o in zip(postcodes, outcomes)]
+
+    def _degrade(self, postcode: str, error: Error) -> Postcode:
+        """Answer with the regex fallback if enabled, otherwise raise the error."""
+        if self._fallback is None:
+            raise error
+        logger.debug("Falling back to regex for postcode '%s': %s", postcode, error)
+        return self._fallback.handle(postcode)
+
+    def _degrade_value(self, postcode: str, error: Error) -> Union[Postcode, Error]:
+        """Like `_degrade`, but returns errors instead of raising them."""
+        try:
+            return self._degrade(postcode, error)
+        except Error as e:
+            return e
@@ -0,0 +1,241 @@
+"""
+Tiered handler chain.
+
+This module defines a handler that tries several handlers in order, typically from the
+cheapest to the most expensive (local dataset, cache, Postcodes.io, OS Data Hub), and
+stops at the first tier that gives an authoritative answer.
+
+Each tier's outcome is classified as one of:
+- served: the tier returned a postcode; the chain stops.
+- invalid: the tier says the postcode does not exist. An authoritative tier ends the chain
+  with that answer; a non-authoritative tier (e.g. a partial local dataset) only records a
+  miss and the chain moves on.
+- unavailable: the tier failed (timeout, connection error, bad status, open circuit,
+  internal error); the chain moves on.
+
+If no tier serves the postcode, the chain raises the "not found" error when every tier
+answered, and the last availability error otherwise, so an outage is never reported as
+an invalid postcode. Per-tier counters show how much traffic each tier absorbs.
+"""
+
+import threading
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, Field, SerializeAsAny, field_validator
+
+from .base import BaseHandler, BaseHandlerSettings
+from .errors import HandlerNoResultsError
+from .types import HandlerType
+from ..error import Error
+from ..logging import logger
+from ..postcode.errors import PostcodeError
+from ..postcode.model import Postcode
+
+NEGATIVE_ERRORS = (PostcodeError, HandlerNoResultsError)
+
+
+class ChainTierSettings(BaseModel):
+    """Settings for one tier of a handler chain."""
+
+    handler: SerializeAsAny[BaseHandlerSettings] = Field(
+        ...,
+        description="Settings of the tier's handler, created through the HandlerFactory.",
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description="Name reported for the tier. Defaults to the handler type.",
+    )
+    authoritative: bool = Field(
+        default=True,
+        description="Treat a 'not found' answer from this tier as final instead of trying the next tier.",
+    )
+
+    @field_validator("handler", mode="before")
+    @classmethod
+    def _validate_handler(cls, value: Any) -> Any:
+        """Validate nested settings as the settings class of their handler type."""
+        from .factory import HandlerFactory
+
+        return HandlerFactory.settings(value)
+
+
+class ChainHandlerSettings(BaseHandlerSettings):
+    """Settings for the chain handler."""
+
+    type: str = Field(
+        default=HandlerType.CHAIN.value,
+        description="Type of the handler, used for identification.",
+        init=False,
+    )
+
+    tiers: list[ChainTierSettings] = Field(
+        ...,
+        min_length=1,
+        description="Tiers to try in order, cheapest first.",
+    )
+
+
+class ChainTierStats(BaseModel):
+    """Counters for one tier of a handler chain."""
+
+    name: str = Field(..., description="Name of the tier.")
+    served: int = Field(default=0, description="Lookups answered with a postcode by this tier.")
+    invalid: int = Field(default=0, description="Lookups this tier authoritatively reported as not found.")
+    missed: int = Field(default=0, description="Lookups a non-authoritative tier did not find, passed on to the next tier.")
+    unavailable: int = Field(default=0, description="Lookups passed on because the tier failed.")
+
+
+class _Tier:
+    """A handler in the chain with its settings and counters."""
+
+    __slots__ = ("name", "handler", "authoritative", "stats")
+
+    def __init__(self, name: str, handler: BaseHandler, authoritative: bool):
+        self.name = name
+        self.handler = handler
+        self.authoritative = authoritative
+        self.stats = ChainTierStats(name=name)
+
+
+class ChainHandler(BaseHandler):
+    """Handler that tries a list of handlers in order and reports which tier served each lookup."""
+
+    def __init__(self, settings: ChainHandlerSettings):
+        from .factory import HandlerFactory
+
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._tiers = [
+            _Tier(tier.name or tier.handler.type, HandlerFactory.create(tier.handler), tier.authoritative) for tier in settings.tiers
+        ]
+
+    @property
+    def tiers(self) -> list[BaseHandler]:
+        """Return the tier handlers, in the order they are tried."""
+        return [tier.handler for tier in self._tiers]
+
+    @property
+    def max_workers(self) -> int:
+        """Return the largest concurrency limit of the tiers."""
+        return max(tier.handler.max_workers for tier in self._tiers)
+
+    @property
+    def supports_bulk(self) -> bool:
+        """Return True if any tier supports bulk lookups."""
+        return any(tier.handler.supports_bulk for tier in self._tiers)
+
+    @property
+    def bulk_size(self) -> int:
+        """Return the largest bulk size of the tiers."""
+        return max(tier.handler.bulk_size for tier in self._tiers)
+
+    def resolve(self, postcode: str) -> tuple[Postcode, str]:
+        """Look the postcode up and return it with the name of the tier that served it."""
+        failure: Optional[Error] = None
+        for tier in self._tiers:
+            try:
+                value = tier.handler.handle(postcode)
+            except Error as e:
+                failure = self._classify(tier, postcode, e, failure)
+                continue
+            self._count(tier, "served")
+            return value, tier.name
+        raise failure
+
+    async def aresolve(self, postcode: str) -> tuple[Postcode, str]:
+        """Asynchronous counterpart of `resolve`."""
+        failure: Optional[Error] = None
+        for tier in self._tiers:
+            try:
+                value = await tier.handler.ahandle(postcode)
+            except Error as e:
+                failure = self._classify(tier, postcode, e, failure)
+                continue
+            self._count(tier, "served")
+            return value, tier.name
+        raise failure
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Return the answer of the first tier that serves the postcode."""
+        return self.resolve(postcode)[0]
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """Await the answer of the first tier that serves the postcode."""
+        return (await self.aresolve(postcode))[0]
+
+    def _handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Pass the postcodes no earlier tier could settle to each tier in turn, in bulk."""
+        outcomes: dict[str, Union[Postcode, Error]] = {}
+        failures: dict[str, Optional[Error]] = dict.fromkeys(postcodes)
+        pending = list(failures)
+        for tier in self._tiers:
+            if not pending:
+                break
+            unsettled: list[str] = []
+            unavailable: list[Error] = []
+            for postcode, outcome in zip(pending, tier.handler.handle_many(pending)):
+                if isinstance(outcome, Postcode):
+                    self._count(tier, "served")
+                    outcomes[postcode] = outcome
+                    continue
+                try:
+                    failures[postcode] = self._classify(tier, postcode, outcome, failures[postcode])
+                    unsettled.append(postcode)
+                except Error as e:
+                    outcomes[postcode] = e
+                    continue
+                if not isinstance(outcome, NEGATIVE_ERRORS):
+                    unavailable.append(outcome)
+            if unavailable:
+                logger.warning(
+                    "Tier '%s' is unavailable for %d of %d postcodes: %s", tier.name, len(unavailable), len(pending), unavailable[-1]
+                )
+            pending = unsettled
+
+        for postcode in pending:
+            outcomes[postcode] = failures[postcode]
+        return [outcomes[p] for p in postcodes]
+
+    def _classify(self, tier: _Tier, postcode: str, error: Error, failure: Optional[Error]) -> Error:
+        """
+        Record a tier's failure and return the error to report if no later tier serves the postcode.
+
+        Raises the error if the tier authoritatively reported the postcode as not found.
+        """
+        if isinstance(error, NEGATIVE_ERRORS):
+            if tier.authoritative:
+                self._count(tier, "invalid")
+                raise error
+            self._count(tier, "missed")
+            return failure if failure is not None and not isinstance(failure, NEGATIVE_ERRORS) else error
+
+        # The error itself was already reported through `error_summary` by the tier's handler;
+        # bulk calls log one warning per tier in `_handle_many` rather than one per postcode.
+        self._count(tier, "unavailable")
+        logger.debug("Tier '%s' is unavailable for postcode '%s': %s", tier.name, postcode, error)
+        return error
+
+    def _count(self, tier: _Tier, outcome: str) -> None:
+        with self._lock:
+            setattr(tier.stats, outcome, getattr(tier.stats, outcome) + 1)
+
+    def stats(self) -> list[ChainTierStats]:
+        """Return a copy of the counters of each tier, in order."""
+        with self._lock:
+            return [tier.stats.model_copy() for tier in self._tiers]
+
+    def reset_stats(self) -> None:
+        """Reset the counters of every tier."""
+        with self._lock:
+            for tier in self._tiers:
+                tier.stats = ChainTierStats(name=tier.name)
+
+    def close(self) -> None:
+        """Release the resources of every tier."""
+        for tier in self._tiers:
+            tier.handler.close()
+
+    async def aclose(self) -> None:
+        """Release the async resources of every tier."""
+        for tier in self._tiers:
+            await tier.handler.aclose()
@@ -0,0 +1,118 @@
+"""
+Local dataset-backed postcode handler.
+
+This module defines a handler that answers from a local snapshot of an open postcode
+directory, such as the ONS Postcode Directory (ONSPD) or Code-Point Open, instead of an
+HTTP API. Unlike the regex handler it checks that a postcode exists, not just its shape.
+
+The handler reads the compact binary format from `postcode.directory`. The file is
+memory-mapped read-only, so opening it costs almost nothing, lookups are a binary search
+over the mapped pages, and the pages are shared by every process on the machine through
+the OS page cache. A CSV can be given instead; it is compiled into a directory file next
+to it on first use and whenever the CSV changes.
+"""
+
+import pathlib
+from typing import Optional, Union
+
+from pydantic import Field
+
+from .base import BaseHandler, BaseHandlerSettings
+from .regex import try_parse_parts
+from .types import HandlerType
+from ..directory import PostcodeDirectory, PostcodeHierarchy, build_directory
+from ..error import Error, InternalError, log_and_raise
+from ..postcode.errors import PostcodeNotFoundError
+from ..postcode.model import Postcode, PostcodeParts
+from ..suggest import PostcodeSuggester
+
+
+class LocalDatasetHandlerSettings(BaseHandlerSettings):
+    """Settings for the local dataset handler."""
+
+    type: str = Field(
+        default=HandlerType.LOCAL_DATASET.value,
+        description="Type of the handler, used for identification.",
+        init=False,
+    )
+
+    path: str = Field(
+        ...,
+        description="Path to a directory file built by `postcode.directory`, or to a postcode CSV such as an ONSPD extract.",
+    )
+    column: str = Field(default="pcds", description="Name of the CSV column holding the postcode.")
+    directory_path: Optional[str] = Field(
+        default=None,
+        description="Path of the directory file compiled from a CSV. Defaults to the CSV path with a `.pcdir` suffix.",
+    )
+    rebuild: bool = Field(
+        default=True,
+        description="Rebuild the directory file when it is missing or older than the CSV.",
+    )
+    verify: bool = Field(
+        default=True,
+        description="Check the directory file's checksum when opening it.",
+    )
+
+
+class LocalDatasetHandler(BaseHandler):
+    """Handler that checks postcodes against a local, memory-mapped postcode directory."""
+
+    def __init__(self, settings: LocalDatasetHandlerSettings):
+        self._settings = settings
+        self._directory = PostcodeDirectory(self._prepare_directory(), verify=settings.verify)
+        self._hierarchy = PostcodeHierarchy(self._directory)
+        self._suggester: Optional[PostcodeSuggester] = None
+
+    @property
+    def directory(self) -> PostcodeDirectory:
+        """Return the postcode directory."""
+        return self._directory
+
+    @property
+    def hierarchy(self) -> PostcodeHierarchy:
+        """Return area, district, sector and unit queries over the directory."""
+        return self._hierarchy
+
+    @property
+    def suggester(self) -> PostcodeSuggester:
+        """Return typo-correction suggestions over the directory, loading its keys on first use."""
+        if self._suggester is None:
+            self._suggester = PostcodeSuggester.from_directory(self._directory)
+        return self._suggester
+
+    def _prepare_directory(self) -> str:
+        """Return the path of an up-to-date directory file, building it from the CSV if needed."""
+        source = pathlib.Path(self._settings.path)
+        if source.suffix.lower() != ".csv":
+            return str(source)
+
+        target = pathlib.Path(self._settings.directory_path or source.with_suffix(".pcdir"))
+        stale = not target.exists() or (source.exists() and source.stat().st_mtime > target.stat().st_mtime)
+        if stale:
+            if not self._settings.rebuild or not source.exists():
+                log_and_raise(InternalError(f"Postcode directory '{target}' is missing or out of date."))
+            build_directory(str(source), str(target), self._settings.column)
+        return str(target)
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Return the postcode if it exists in the directory."""
+        return Postcode.from_parts(self._handle_parts(postcode))
+
+    def _handle_parts(self, postcode: str) -> PostcodeParts:
+        """Return the parts of the postcode if it exists in the directory."""
+        parsed = self._try_handle_parts(postcode)
+        if isinstance(parsed, Error):
+            raise parsed
+        return parsed
+
+    def _try_handle_parts(self, postcode: str) -> Union[PostcodeParts, Error]:
+        """Return the parts of the postcode, or a not-found error if it is not in the directory."""
+        position = self._directory.find(postcode)
+        if position is None:
+            return PostcodeNotFoundError(postcode)
+        return try_parse_parts(self._directory.postcode_at(position))
+
+    def close(self) -> None:
+        """Unmap the postcode directory."""
+        self._directory.close()
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any, Optional
 
 from ..error import Error
 
@@ -12,6 +13,8 @@ class HandlerErrorCode(Enum):
     HANDLER_CONNECTION_ERROR = "HANDLER_CONNECTION_ERROR"
     HANDLER_API_ERROR = "HANDLER_API_ERROR"
     HANDLER_RESULTS_ERROR = "HANDLER_NO_RESULTS_ERROR"
+    HANDLER_CIRCUIT_OPEN_ERROR = "HANDLER_CIRCUIT_OPEN_ERROR"
+    HANDLER_RATE_LIMIT_ERROR = "HANDLER_RATE_LIMIT_ERROR"
 
 
 class HandlerError(Error):
@@ -22,9 +25,10 @@ class HandlerError(Error):
         handler: str,
         message: str = "Handler error.",
         code: str = HandlerErrorCode.HANDLER_ERROR.value,
+        params: Optional[dict[str, Any]] = None,
     ) -> None:
         self.handler = handler
-        super().__init__(code, message)
+        super().__init__(code, message, params)
 
     def __str__(self):
         return f"[{self.code}] [{self.handler}] {self.message}"
@@ -36,8 +40,9 @@ class HandlerTimeoutError(HandlerError):
     def __init__(self, handler: str, timeout: int) -> None:
         super().__init__(
             handler,
-            f"{handler} timed out after {timeout} seconds.",
+            "{handler} timed out after {timeout} seconds.",
             HandlerErrorCode.HANDLER_TIMEOUT_ERROR.value,
+            {"handler": handler, "timeout": timeout},
         )
 
 
@@ -47,8 +52,9 @@ class HandlerNotFoundError(HandlerError):
     def __init__(self, handler: str) -> None:
         super().__init__(
             handler=handler,
-            message=f"No handler registered for type '{handler}'.",
+            message="No handler registered for type '{handler}'.",
             code=HandlerErrorCode.HANDLER_NOT_FOUND_ERROR.value,
+            params={"handler": handler},
         )
 
 
@@ -58,8 +64,9 @@ class HandlerConnectionError(HandlerError):
     def __init__(self, handler: str):
         super().__init__(
             handler=handler,
-            message=f"{handler} failed to connect. Please check your network or API endpoint.",
+            message="{handler} failed to connect. Please check your network or API endpoint.",
             code=HandlerErrorCode.HANDLER_CONNECTION_ERROR.value,
+            params={"handler": handler},
         )
 
 
@@ -67,10 +74,13 @@ class HandlerAPIError(HandlerError):
     """Raised when a handler API returns a bad HTTP status."""
 
     def __init__(self, handler: str, status_code: int, message: str = None):
+        self.status_code = status_code
         super().__init__(
             handler=handler,
-            message=message or f"{handler} returned unexpected status code {status_code}.",
+            message=message or "{handler} returned unexpected status code {status_code}.",
             code=HandlerErrorCode.HANDLER_API_ERROR.value,
+            # An explicit message comes from upstream and is used as is, never as a template.
+            params=None if message else {"handler": handler, "status_code": status_code},
         )
 
 
@@ -80,6 +90,32 @@ class HandlerNoResultsError(HandlerError):
     def __init__(self, handler: str, query: str):
         super().__init__(
             handler=handler,
-            message=f"{handler} returned no results for query '{query}'.",
+            message="{handler} returned no results for query '{query}'.",
             code=HandlerErrorCode.HANDLER_RESULTS_ERROR.value,
+            params={"handler": handler, "query": query},
+        )
+
+
+class HandlerCircuitOpenError(HandlerError):
+    """Raised when a circuit breaker rejects a call because the handler is failing."""
+
+    def __init__(self, handler: str):
+        super().__init__(
+            handler=handler,
+            message="{handler} is unavailable; the circuit breaker is open.",
+            code=HandlerErrorCode.HANDLER_CIRCUIT_OPEN_ERROR.value,
+            params={"handler": handler},
+        )
+
+
+class HandlerRateLimitError(HandlerError):
+    """Raised when a handler API keeps answering 429 Too Many Requests after retrying."""
+
+    def __init__(self, handler: str, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            handler=handler,
+            message="{handler} is rate limited; retry after {retry_after:g} seconds.",
+            code=HandlerErrorCode.HANDLER_RATE_LIMIT_ERROR.value,
+            params={"handler": handler, "retry_after": retry_after},
         )
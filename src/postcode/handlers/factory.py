@@ -1,7 +1,13 @@
+from typing import Any
+
 from .base import BaseHandler, BaseHandlerSettings
-from .http.osdatahub import OSDataHubHttpHandler
-from .http.postcode_io import PostcodeIOHttpHandler
-from .regex import RegexHandler
+from .breaker import CircuitBreakerHandler, CircuitBreakerHandlerSettings
+from .chain import ChainHandler, ChainHandlerSettings
+from .dataset import LocalDatasetHandler, LocalDatasetHandlerSettings
+from .http.osdatahub import OSDataHubHandlerSettings, OSDataHubHttpHandler
+from .http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from .regex import RegexHandler, RegexHandlerSettings
+from .sqlite_cache import SqliteCacheHandler, SqliteCacheHandlerSettings
 from .types import HandlerType
 from .errors import HandlerNotFoundError
 from ..error import log_and_raise
@@ -14,6 +20,20 @@ class HandlerFactory:
         HandlerType.REGEX: RegexHandler,
         HandlerType.HTTP_POSTCODES_IO: PostcodeIOHttpHandler,
         HandlerType.HTTP_OSDATAHUB: OSDataHubHttpHandler,
+        HandlerType.SQLITE_CACHE: SqliteCacheHandler,
+        HandlerType.CIRCUIT_BREAKER: CircuitBreakerHandler,
+        HandlerType.CHAIN: ChainHandler,
+        HandlerType.LOCAL_DATASET: LocalDatasetHandler,
+    }
+
+    SETTINGS: dict[HandlerType, type[BaseHandlerSettings]] = {
+        HandlerType.REGEX: RegexHandlerSettings,
+        HandlerType.HTTP_POSTCODES_IO: PostcodeIOHandlerSettings,
+        HandlerType.HTTP_OSDATAHUB: OSDataHubHandlerSettings,
+        HandlerType.SQLITE_CACHE: SqliteCacheHandlerSettings,
+        HandlerType.CIRCUIT_BREAKER: CircuitBreakerHandlerSettings,
+        HandlerType.CHAIN: ChainHandlerSettings,
+        HandlerType.LOCAL_DATASET: LocalDatasetHandlerSettings,
     }
 
     @staticmethod
@@ -23,3 +43,14 @@ class HandlerFactory:
         if not constructor:
             log_and_raise(HandlerNotFoundError(settings.type))
         return constructor(settings)
+
+    @staticmethod
+    def settings(value: Any) -> Any:
+        """
+        Validate raw settings (e.g. a dict loaded from JSON) as the settings class registered for their `type`.
+
+        Settings objects are returned unchanged; unregistered types fall back to `BaseHandlerSettings`.
+        """
+        if isinstance(value, BaseHandlerSettings) or not isinstance(value, dict):
+            return value
+        return HandlerFactory.SETTINGS.get(value.get("type"), BaseHandlerSettings).model_validate(value)
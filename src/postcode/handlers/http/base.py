@@ -0,0 +1,358 @@
+import asyncio
+import threading
+import time
+from abc import abstractmethod
+from typing import Any, Optional, Union
+
+import requests
+from pydantic import Field
+from requests.adapters import HTTPAdapter
+
+from ..base import BaseHandler, BaseHandlerSettings
+from .ratelimit import FileTokenBucket, TokenBucket, aacquire, acquire, parse_retry_after
+from ..errors import HandlerTimeoutError, HandlerConnectionError, HandlerRateLimitError
+from ..regex import RegexHandler
+from ..singleflight import AsyncSingleFlight, SingleFlight
+from ...error import InternalError, log_and_raise
+from ...logging import logger
+from ...metrics import HTTP_SECONDS
+from ...tracing import Span, current_tracer, start_as_current_span
+from ...postcode.errors import PostcodeNotFoundError
+from ...postcode.model import Postcode
+
+
+class BaseHttpHandlerSettings(BaseHandlerSettings):
+    """Base class for settings of handlers backed by an HTTP API."""
+
+    timeout: float = Field(
+        default=0.5,
+        description="Timeout for API requests in seconds",
+    )
+    max_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of concurrent API requests when parsing in bulk.",
+    )
+    coalesce: bool = Field(
+        default=True,
+        description="Share a single API request between concurrent lookups of the same postcode.",
+    )
+    pool_size: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of pooled connections kept open to the API host.",
+    )
+    keep_alive: bool = Field(
+        default=True,
+        description="Reuse connections between requests instead of reconnecting for each one.",
+    )
+    connect_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout for establishing a connection in seconds. Defaults to `timeout`.",
+    )
+    read_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout for reading a response in seconds. Defaults to `timeout`.",
+    )
+    prefilter: bool = Field(
+        default=True,
+        description="Reject postcodes the offline regex rules cannot match without calling the API.",
+    )
+    rate_limit: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum requests per second sent to the API; set it just under the provider's quota. None disables pacing.",
+    )
+    rate_limit_burst: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of requests that may be sent back to back before pacing applies. Defaults to one second's worth.",
+    )
+    rate_limit_file: Optional[str] = Field(
+        default=None,
+        description="Path of a file holding the rate limiter state, to share one quota between processes.",
+    )
+    max_retries: int = Field(
+        default=2,
+        ge=0,
+        description="Number of times a request answered with 429 Too Many Requests is retried.",
+    )
+    max_retry_after: float = Field(
+        default=30.0,
+        ge=0,
+        description="Longest `Retry-After` wait in seconds honoured before failing with a rate limit error.",
+    )
+
+
+class BaseHttpHandler(BaseHandler):
+    """
+    Base class for handlers that look postcodes up through an HTTP API.
+
+    Subclasses describe the request with `_url`/`_params` and interpret the response
+    in `_parse`. The request itself is issued either with `requests` (blocking) or with
+    an `httpx.AsyncClient` (non-blocking), so both transports share the same parsing
+    and error mapping. Concurrent lookups of the same postcode are coalesced into one
+    request unless `coalesce` is disabled.
+
+    Each handler owns a pooled keep-alive session that is safe to share between threads,
+    so repeated lookups skip the TCP and TLS handshakes. Call `close()` (or close the
+    owning `Service`) to release the pooled connections.
+
+    Unless `prefilter` is disabled, postcodes that are structurally impossible according
+    to the offline regex rules are rejected with `PostcodeNotFoundError` before any request.
+
+    When `rate_limit` is set, requests are paced by a token bucket shared by every thread
+    (and, with `rate_limit_file`, every process) using the handler. Responses with status
+    429 are retried after the `Retry-After` delay, during which the bucket hands out no tokens.
+    """
+
+    def __init__(self, settings: BaseHttpHandlerSettings):
+        super().__init__()
+        self._settings = settings
+        self._async_client = None
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._single_flight = SingleFlight()
+        self._async_single_flight = AsyncSingleFlight()
+        self._rate_limiter = self._create_rate_limiter()
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout setting for the API requests."""
+        return self._settings.timeout
+
+    @property
+    def connect_timeout(self) -> float:
+        """Return the connection timeout in seconds."""
+        return self._settings.connect_timeout or self.timeout
+
+    @property
+    def read_timeout(self) -> float:
+        """Return the read timeout in seconds."""
+        return self._settings.read_timeout or self.timeout
+
+    @property
+    def rate_limiter(self) -> Optional[Union[TokenBucket, FileTokenBucket]]:
+        """Return the token bucket pacing this handler's requests, if rate limiting is enabled."""
+        return self._rate_limiter
+
+    @property
+    def name(self) -> str:
+        """Return the handler name used in error messages."""
+        return self.__class__.__name__
+
+    @abstractmethod
+    def _url(self, postcode: str) -> str:
+        """Return the URL to query for the postcode."""
+
+    def _params(self, postcode: str) -> Optional[dict[str, Any]]:
+        """Return the query parameters to send for the postcode."""
+        return None
+
+    @abstractmethod
+    def _parse(self, response: Any, postcode: str) -> Postcode:
+        """Turn an HTTP response (requests or httpx) into a Postcode."""
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Handle the postcode string and return a Postcode object."""
+        self._prefilter(postcode)
+        if self._settings.coalesce:
+            return self._single_flight.do(postcode, lambda: self._fetch(postcode))
+        return self._fetch(postcode)
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """Handle the postcode string without blocking the event loop."""
+        self._prefilter(postcode)
+        if self._settings.coalesce:
+            return await self._async_single_flight.do(postcode, lambda: self._afetch(postcode))
+        return await self._afetch(postcode)
+
+    def _plausible(self, postcode: str) -> bool:
+        """Return True if the postcode may exist, i.e. prefiltering is off or a regex rule matches it."""
+        return not self._settings.prefilter or any(rule.match_parts(postcode) for rule in RegexHandler.RULES)
+
+    def _prefilter(self, postcode: str) -> None:
+        """Raise `PostcodeNotFoundError` for a postcode the API cannot know, without a request."""
+        if not self._plausible(postcode):
+            raise PostcodeNotFoundError(postcode)
+
+    def _fetch(self, postcode: str) -> Postcode:
+        """Request the postcode from the API and parse the response."""
+        response = self._request("GET", self._url(postcode), params=self._params(postcode))
+        return self._decode(response, postcode)
+
+    async def _afetch(self, postcode: str) -> Postcode:
+        """Request the postcode from the API without blocking and parse the response."""
+        response = await self._arequest("GET", self._url(postcode), params=self._params(postcode))
+        return self._decode(response, postcode)
+
+    def _decode(self, response: Any, postcode: str) -> Postcode:
+        """Parse the response, inside a span covering JSON decoding if tracing is enabled."""
+        if current_tracer() is None:
+            return self._parse(response, postcode)
+        with start_as_current_span("postcode.http.parse", attributes={"postcode.handler": self.name}):
+            return self._parse(response, postcode)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a paced request, retrying on 429 and mapping transport failures to handler errors."""
+        for attempt in range(self._settings.max_retries + 1):
+            if self._rate_limiter is not None:
+                if current_tracer() is None:
+                    acquire(self._rate_limiter)
+                else:
+                    with start_as_current_span("postcode.http.rate_limit", attributes={"postcode.handler": self.name}):
+                        acquire(self._rate_limiter)
+            response = self._send(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+            wait = self._throttled(response, attempt)
+            if self._rate_limiter is None:
+                time.sleep(wait)
+
+    async def _arequest(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a paced request without blocking, retrying on 429."""
+        for attempt in range(self._settings.max_retries + 1):
+            if self._rate_limiter is not None:
+                if current_tracer() is None:
+                    await aacquire(self._rate_limiter)
+                else:
+                    with start_as_current_span("postcode.http.rate_limit", attributes={"postcode.handler": self.name}):
+                        await aacquire(self._rate_limiter)
+            response = await self._asend(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+            wait = self._throttled(response, attempt)
+            if self._rate_limiter is None:
+                await asyncio.sleep(wait)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a single request, inside a span if tracing is enabled."""
+        if current_tracer() is None:
+            return self._transmit(method, url, None, **kwargs)
+        with start_as_current_span("postcode.http.request", attributes=self._span_attributes(method, url)) as span:
+            return self._transmit(method, url, span, **kwargs)
+
+    async def _asend(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a single request without blocking, inside a span if tracing is enabled."""
+        if current_tracer() is None:
+            return await self._atransmit(method, url, None, **kwargs)
+        with start_as_current_span("postcode.http.request", attributes=self._span_attributes(method, url)) as span:
+            return await self._atransmit(method, url, span, **kwargs)
+
+    def _transmit(self, method: str, url: str, span: Optional[Span], **kwargs: Any) -> requests.Response:
+        """Send a single request, mapping transport failures to handler errors and recording its latency."""
+        start, status = time.perf_counter(), "error"
+        try:
+            response = self._get_session().request(method, url, timeout=(self.connect_timeout, self.read_timeout), **kwargs)
+            status = str(response.status_code)
+            if span is not None:
+                # Time from sending the request to parsing the response headers, i.e. excluding the body download.
+                span.set_attribute("http.response_time", response.elapsed.total_seconds())
+            return response
+
+        except requests.Timeout as e:
+            status = "timeout"
+            raise HandlerTimeoutError(self.name, self.timeout) from e
+
+        except requests.ConnectionError as e:
+            status = "connection_error"
+            raise HandlerConnectionError(self.name) from e
+
+        finally:
+            self._observe(start, status, span)
+
+    async def _atransmit(self, method: str, url: str, span: Optional[Span], **kwargs: Any) -> Any:
+        """Send a single request without blocking, mapping transport failures to handler errors and recording its latency."""
+        client = self._get_async_client()
+        import httpx
+
+        start, status = time.perf_counter(), "error"
+        try:
+            response = await client.request(method, url, **kwargs)
+            status = str(response.status_code)
+            return response
+
+        except httpx.TimeoutException as e:
+            status = "timeout"
+            raise HandlerTimeoutError(self.name, self.timeout) from e
+
+        except httpx.TransportError as e:
+            status = "connection_error"
+            raise HandlerConnectionError(self.name) from e
+
+        finally:
+            self._observe(start, status, span)
+
+    def _span_attributes(self, method: str, url: str) -> dict[str, Any]:
+        """Return the attributes of a request span; query parameters (which may hold API keys) are left out."""
+        return {"postcode.handler": self.name, "http.method": method, "http.url": url}
+
+    def _observe(self, start: float, status: str, span: Optional[Span] = None) -> None:
+        """Record a request that started at `start` (a `perf_counter` reading) and ended with `status`."""
+        HTTP_SECONDS.labels(self.name, status).observe(time.perf_counter() - start)
+        if span is not None:
+            span.set_attribute("http.status_code", status)
+
+    def _throttled(self, response: Any, attempt: int) -> float:
+        """Handle a 429 response: return the seconds to wait, or raise once retries are exhausted."""
+        wait = parse_retry_after(response.headers.get("Retry-After"))
+        if attempt >= self._settings.max_retries or wait > self._settings.max_retry_after:
+            raise HandlerRateLimitError(self.name, wait)
+
+        logger.warning("%s was rate limited; retrying in %.2f seconds", self.name, wait)
+        if self._rate_limiter is not None:
+            self._rate_limiter.pause(wait)
+        return wait
+
+    def _create_rate_limiter(self) -> Optional[Union[TokenBucket, FileTokenBucket]]:
+        """Create the token bucket described by the settings, if rate limiting is enabled."""
+        if self._settings.rate_limit is None:
+            return None
+        if self._settings.rate_limit_file is not None:
+            return FileTokenBucket(self._settings.rate_limit_file, self._settings.rate_limit, self._settings.rate_limit_burst)
+        return TokenBucket(self._settings.rate_limit, self._settings.rate_limit_burst)
+
+    def _get_session(self) -> requests.Session:
+        """Return the handler's pooled session, creating it on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._settings.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    if not self._settings.keep_alive:
+                        session.headers["Connection"] = "close"
+                    self._session = session
+        return self._session
+
+    def _get_async_client(self):
+        """Return the handler's `httpx.AsyncClient`, creating it on first use."""
+        if self._async_client is None:
+            try:
+                import httpx
+            except ImportError:
+                log_and_raise(InternalError("Async HTTP lookups require httpx. Install it with 'pip install postcode[async]'."))
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self._settings.pool_size,
+                    max_keepalive_connections=self._settings.pool_size if self._settings.keep_alive else 0,
+                ),
+            )
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the pooled session, if one was created."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -1,19 +1,21 @@
-import requests
+from typing import Any, Union
+
 from pydantic import Field
 
+from ...error import Error, InternalError
+from ...logging import logger
+from ...postcode.errors import PostcodeNotFoundError
 from ...postcode.model import Postcode
-from ..base import BaseHandler, BaseHandlerSettings
-from ..regex import RegexHandler
+from .base import BaseHttpHandler, BaseHttpHandlerSettings
+from ..regex import parse_parts
 from ..types import HandlerType
 from ..errors import (
-    HandlerTimeoutError,
-    HandlerConnectionError,
     HandlerAPIError,
     HandlerNoResultsError,
 )
 
 
-class PostcodeIOHandlerSettings(BaseHandlerSettings):
+class PostcodeIOHandlerSettings(BaseHttpHandlerSettings):
     """Settings for the Postcodes.io API handler."""
 
     type: str = Field(
@@ -21,46 +23,87 @@ class PostcodeIOHandlerSettings(BaseHandlerSettings):
         description="Type of the handler, used for identification.",
         init=False,
     )
-
-    timeout: float = Field(
-        default=0.5,
-        description="Timeout for API requests in seconds",
+    bulk_size: int = Field(
+        default=100,
+        ge=1,
+        le=100,
+        description="Number of postcodes sent per bulk lookup request (the API accepts at most 100).",
     )
 
 
-class PostcodeIOHttpHandler(BaseHandler):
+class PostcodeIOHttpHandler(BaseHttpHandler):
     """Handler for parsing UK postcodes using the Postcodes.io API."""
 
     def __init__(self, settings: PostcodeIOHandlerSettings):
-        super().__init__()
-        self._settings = settings
+        super().__init__(settings)
         self._endpoint = "https://api.postcodes.io/postcodes"
 
     @property
-    def timeout(self) -> float:
-        """Return the timeout setting for the API requests."""
-        return self._settings.timeout
-
-    def _handle(self, postcode: str) -> Postcode:
-        """Handle the postcode string and return a Postcode object."""
-        try:
-            response = requests.get(
-                f"{self._endpoint}/{postcode}",
-                timeout=self.timeout,
-            )
+    def supports_bulk(self) -> bool:
+        """Return True; Postcodes.io resolves up to 100 postcodes per request."""
+        return True
 
-        except requests.Timeout:
-            raise HandlerTimeoutError(self.__class__.__name__, self.timeout)
+    @property
+    def bulk_size(self) -> int:
+        """Return the number of postcodes sent per bulk lookup request."""
+        return self._settings.bulk_size
+
+    def _url(self, postcode: str) -> str:
+        return f"{self._endpoint}/{postcode}"
 
-        except requests.ConnectionError:
-            raise HandlerConnectionError(self.__class__.__name__)
+    def _parse(self, response: Any, postcode: str) -> Postcode:
+        """Turn a Postcodes.io response into a Postcode object; a 404 means the postcode is unknown."""
+        if response.status_code == 404:
+            raise HandlerNoResultsError(self.name, postcode)
 
         if response.status_code != 200:
-            raise HandlerAPIError(self.__class__.__name__, response.status_code)
+            raise HandlerAPIError(self.name, response.status_code)
 
         data = response.json()
         if not data.get("result"):
-            raise HandlerNoResultsError(self.__class__.__name__, postcode)
+            raise HandlerNoResultsError(self.name, postcode)
 
         result = data["result"]
-        return RegexHandler.default().handle(result["postcode"])
+        return Postcode.from_parts(parse_parts(result["postcode"]))
+
+    def _handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Resolve plausible postcodes through the bulk lookup endpoint, `bulk_size` at a time."""
+        outcomes: dict[str, Union[Postcode, Error]] = {p: PostcodeNotFoundError(p) for p in postcodes if not self._plausible(p)}
+        candidates = [p for p in postcodes if p not in outcomes]
+        for start in range(0, len(candidates), self.bulk_size):
+            chunk = candidates[start : start + self.bulk_size]
+            try:
+                response = self._request("POST", self._endpoint, json={"postcodes": chunk})
+                outcomes.update(zip(chunk, self._parse_bulk(response, chunk)))
+            except Error as e:
+                outcomes.update((p, e) for p in chunk)
+            except Exception as e:
+                error = InternalError(f"An unexpected error occurred while handling postcodes in bulk: {str(e)}")
+                logger.exception(str(error))
+                outcomes.update((p, error) for p in chunk)
+        return [outcomes[p] for p in postcodes]
+
+    def _parse_bulk(self, response: Any, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Turn a Postcodes.io bulk response into a Postcode or Error per query, in order."""
+        if response.status_code != 200:
+            raise HandlerAPIError(self.name, response.status_code)
+
+        items = response.json().get("result") or []
+        if len(items) != len(postcodes):
+            raise HandlerAPIError(
+                self.name,
+                response.status_code,
+                f"{self.name} returned {len(items)} bulk results for {len(postcodes)} postcodes.",
+            )
+
+        outcomes: list[Union[Postcode, Error]] = []
+        for postcode, item in zip(postcodes, items):
+            result = item.get("result")
+            if not result:
+                outcomes.append(HandlerNoResultsError(self.name, postcode))
+                continue
+            try:
+                outcomes.append(Postcode.from_parts(parse_parts(result["postcode"])))
+            except Error as e:
+                outcomes.append(e)
+        return outcomes
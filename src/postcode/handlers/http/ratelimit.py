@@ -0,0 +1,165 @@
+"""
+Client-side rate limiting for the HTTP handlers.
+
+A token bucket paces outgoing requests to a configured rate with a bounded burst. The
+in-memory `TokenBucket` is shared by every thread using a handler; `FileTokenBucket`
+keeps its state in a small locked file so several processes on the same machine draw
+from one quota.
+
+Both buckets can also be paused, which the handlers use to honour `Retry-After`
+when an API answers 429 Too Many Requests.
+"""
+
+import contextlib
+import email.utils
+import os
+import pathlib
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional
+
+
+class TokenBucket:
+    """A thread-safe token bucket refilled at `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available and return 0, otherwise return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            tokens, wait = _take(self.rate, self.capacity, self._tokens, self._updated, self._paused_until, now)
+            self._tokens, self._updated = tokens, now
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = 0.0
+
+
+class FileTokenBucket:
+    """
+    A token bucket whose state lives in a locked file, shared by every process using the same path.
+
+    The file holds three doubles (tokens, last update, paused until) based on wall-clock time.
+    """
+
+    _STATE = struct.Struct("<ddd")
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.time):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._path = pathlib.Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available and return 0, otherwise return the seconds to wait."""
+        with self._state() as state:
+            now = self._clock()
+            tokens, updated, paused_until = state
+            tokens, wait = _take(self.rate, self.capacity, tokens, updated, paused_until, now)
+            state[:] = [tokens, now, paused_until]
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens, in every process, for the given number of seconds."""
+        with self._state() as state:
+            state[0] = 0.0
+            state[2] = max(state[2], self._clock() + seconds)
+
+    @contextlib.contextmanager
+    def _state(self) -> Iterator[list[float]]:
+        """Yield the bucket state under an exclusive lock and write it back afterwards."""
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_file(fd)
+                raw = os.read(fd, self._STATE.size)
+                state = list(self._STATE.unpack(raw)) if len(raw) == self._STATE.size else [self.capacity, self._clock(), 0.0]
+                yield state
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self._STATE.pack(*state))
+            finally:
+                _unlock_file(fd)
+                os.close(fd)
+
+
+def acquire(bucket, sleep: Callable[[float], None] = time.sleep) -> None:
+    """Block until the bucket hands out a token."""
+    while True:
+        wait = bucket.try_acquire()
+        if wait <= 0:
+            return
+        sleep(wait)
+
+
+async def aacquire(bucket) -> None:
+    """Wait without blocking the event loop until the bucket hands out a token."""
+    import asyncio
+
+    while True:
+        wait = bucket.try_acquire()
+        if wait <= 0:
+            return
+        await asyncio.sleep(wait)
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _take(rate: float, capacity: float, tokens: float, updated: float, paused_until: float, now: float) -> tuple[float, float]:
+    """Refill and take a token; return the new token count and the wait (0 if a token was taken)."""
+    if now < paused_until:
+        return 0.0, paused_until - now
+    tokens = min(capacity, tokens + max(0.0, now - max(updated, paused_until)) * rate)
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (1.0 - tokens) / rate
+
+
+if os.name == "nt":  # pragma: no cover - exercised on Windows only
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -15,21 +15,35 @@ are informed by examples documented here:
   https://en.wikipedia.org/wiki/Postcodes_in_the_United_Kingdom#Special_cases
 """
 
+import logging
 import re
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pydantic import Field
 
 from .base import BaseHandler, BaseHandlerSettings
+from .standard import parse_standard
 from .types import HandlerType
 
 from ..logging import logger
+from ..tracing import current_tracer, start_as_current_span
 from ..postcode.errors import PostcodeNotFoundError
-from ..postcode.model import Postcode, PostcodeFormat
+from ..postcode.model import Postcode, PostcodeFormat, PostcodeParts
+
+_GROUP = re.compile(r"\(\?P<(\w+)>")
+_FIELDS = ("area", "district", "sector", "unit")
+_MISSING = "_missing"
 
 
 class RegexRule:
-    """A rule that matches one or more regex patterns for a given postcode type."""
+    """
+    A rule that matches one or more regex patterns for a given postcode type.
+
+    The patterns are also compiled into a single alternation, with each pattern wrapped in
+    a named group, so a value is matched in one pass and the pattern that matched is read
+    from `lastindex`. Alternatives are tried in order, so the first matching pattern wins
+    exactly as if the patterns were tried one by one.
+    """
 
     def __init__(
         self,
@@ -38,25 +52,34 @@ class RegexRule:
     ):
         self.type = type
         self.patterns = [re.compile(p) for p in patterns]
+        # The trailing group can never match, so it stands in for fields a pattern lacks and
+        # reads as None, letting `match_parts` fetch all four fields in one `group()` call.
+        alternatives = [self._alternative(i, p) for i, p in enumerate(patterns)]
+        self.combined = re.compile("|".join(alternatives + [f"(?P<{_MISSING}>(?!))"]))
+        index = self.combined.groupindex
+        self._fields = {
+            index[f"_{i}"]: tuple(index.get(f"_{i}_{field}", index[_MISSING]) for field in _FIELDS) for i in range(len(patterns))
+        }
 
     def match(self, value: str) -> Optional[Postcode]:
         """Match the value against the regex patterns and return a Postcode object if matched."""
-        logger.debug("Matching value '%s' against patterns for type '%s'", value, self.type)
-        for regex in self.patterns:
-            match = regex.match(value)
-            if match:
-                logger.debug("Matched value '%s' with regex '%s'", value, regex.pattern)
-                groups = match.groupdict()
-                return Postcode(
-                    format=self.type,
-                    area=groups.get("area"),
-                    district=groups.get("district"),
-                    sector=groups.get("sector"),
-                    unit=groups.get("unit"),
-                )
-
-        logger.debug("No match found for value '%s' with type '%s'", value, self.type)
-        return None
+        parts = self.match_parts(value)
+        return Postcode.from_parts(parts) if parts else None
+
+    def match_parts(self, value: str) -> Optional[PostcodeParts]:
+        """Match the value against the regex patterns and return the postcode parts if matched."""
+        match = self.combined.match(value)
+        if match is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No match found for value '%s' with type '%s'", value, self.type)
+            return None
+
+        return (self.type, *match.group(*self._fields[match.lastindex]))
+
+    @staticmethod
+    def _alternative(index: int, pattern: str) -> str:
+        """Wrap a pattern in a group named after its index, prefixing its own group names to keep them unique."""
+        return f"(?P<_{index}>" + _GROUP.sub(lambda m: f"(?P<_{index}_{m.group(1)}>", pattern) + ")"
 
 
 class RegexHandlerSettings(BaseHandlerSettings):
@@ -68,6 +91,14 @@ class RegexHandlerSettings(BaseHandlerSettings):
         init=False,
     )
 
+    fast_path: bool = Field(
+        default=False,
+        description=(
+            "Parse standard UK postcodes and GIR 0AA by position, using the regex rules only for other shapes. "
+            "Faster when most inputs are standard postcodes, slower for special and invalid inputs."
+        ),
+    )
+
 
 class RegexHandler(BaseHandler):
     """Handler for postcodes using regular expressions."""
@@ -108,16 +139,63 @@ class RegexHandler(BaseHandler):
 
     def __init__(self, settings: RegexHandlerSettings):
         self._settings = settings
+        self._fast_path = settings.fast_path
 
     def _handle(self, postcode: str) -> Postcode:
         """Handle the postcode string and return a Postcode object."""
+        return Postcode.from_parts(self._handle_parts(postcode))
+
+    def _handle_parts(self, postcode: str) -> PostcodeParts:
+        """Handle the postcode string and return its parts without building a model."""
+        parsed = self._try_handle_parts(postcode)
+        if isinstance(parsed, PostcodeNotFoundError):
+            raise parsed
+        return parsed
+
+    def _try_handle_parts(self, postcode: str) -> Union[PostcodeParts, PostcodeNotFoundError]:
+        """Return the parts of the postcode, or a not-found error if no rule matches."""
+        if current_tracer() is not None:
+            return self._traced_match(postcode)
+        return self._match(postcode)
+
+    def _traced_match(self, postcode: str) -> Union[PostcodeParts, PostcodeNotFoundError]:
+        """Run `_match` inside a span tagged with whether the fast path or a rule matched."""
+        with start_as_current_span("postcode.regex", attributes={"postcode.regex.fast_path": self._fast_path}) as span:
+            parsed = self._match(postcode)
+            span.set_attribute("postcode.regex.matched", not isinstance(parsed, PostcodeNotFoundError))
+            return parsed
+
+    def _match(self, postcode: str) -> Union[PostcodeParts, PostcodeNotFoundError]:
+        """Match the postcode with the fast path, then the rules."""
+        if self._fast_path:
+            parsed = parse_standard(postcode)
+            if parsed:
+                return parsed
         for rule in self.RULES:
-            parsed = rule.match(postcode)
+            parsed = rule.match_parts(postcode)
             if parsed:
                 return parsed
-        raise PostcodeNotFoundError(postcode)
+        return PostcodeNotFoundError(postcode)
 
     @classmethod
     def default(cls) -> "RegexHandler":
         """Create a default RegexHandler."""
         return cls(RegexHandlerSettings())
+
+
+_DEFAULT = RegexHandler.default()
+
+
+def parse_parts(postcode: str) -> PostcodeParts:
+    """
+    Parse a postcode with the default rules, raising `PostcodeNotFoundError` if none matches.
+
+    Used by other handlers to re-parse the postcodes their upstream returns; unlike
+    `RegexHandler.handle_parts`, it records no handler lookup and logs nothing.
+    """
+    return _DEFAULT._handle_parts(postcode)
+
+
+def try_parse_parts(postcode: str) -> Union[PostcodeParts, PostcodeNotFoundError]:
+    """Parse a postcode with the default rules, returning the not-found error instead of raising it."""
+    return _DEFAULT._try_handle_parts(postcode)
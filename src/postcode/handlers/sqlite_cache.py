@@ -0,0 +1,270 @@
+"""
+SQLite-backed persistent lookup cache.
+
+This module defines a handler that wraps any other handler and remembers its answers
+in a local SQLite database, so knowledge gained from the online handlers survives
+restarts and is shared between worker processes on the same machine.
+
+The database runs in WAL mode, which allows many concurrent readers alongside a single
+writer across processes; writers wait up to `busy_timeout` seconds for the lock.
+Postcodes are stored in the compact encoding from `postcode.codec` rather than as JSON.
+"""
+
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Optional, Union
+
+from pydantic import Field
+
+from .types import HandlerType
+from .wrapper import BaseWrapperHandler, WrapperHandlerSettings
+from .errors import HandlerErrorCode, HandlerNoResultsError
+from ..error import Error
+from ..logging import logger
+from ..postcode.codec import decode_parts, encode_parts
+from ..postcode.errors import PostcodeNotFoundError
+from ..postcode.model import Postcode, PostcodeParts
+
+
+class SqliteCacheHandlerSettings(WrapperHandlerSettings):
+    """Settings for the SQLite cache handler."""
+
+    type: str = Field(
+        default=HandlerType.SQLITE_CACHE.value,
+        description="Type of the handler, used for identification.",
+        init=False,
+    )
+
+    path: str = Field(..., description="Path to the SQLite database file; created if missing.")
+    ttl: Optional[float] = Field(
+        default=30 * 24 * 3600,
+        gt=0,
+        description="Seconds a successful lookup stays cached. None keeps entries until pruned.",
+    )
+    negative_ttl: Optional[float] = Field(
+        default=24 * 3600,
+        ge=0,
+        description="Seconds a 'not found' outcome stays cached. 0 disables negative caching.",
+    )
+    max_entries: Optional[int] = Field(
+        default=5_000_000,
+        ge=1,
+        description="Maximum number of cached postcodes; the oldest entries are pruned first.",
+    )
+    prune_interval: int = Field(
+        default=10_000,
+        ge=1,
+        description="Number of writes between automatic prunes.",
+    )
+    busy_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for a lock held by another process or thread.",
+    )
+
+
+class SqliteCacheHandler(BaseWrapperHandler):
+    """Handler that caches the outcomes of another handler in a local SQLite database."""
+
+    def __init__(self, settings: SqliteCacheHandlerSettings):
+        super().__init__(settings)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        path = pathlib.Path(settings.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    def _initialize(self) -> None:
+        """
+        Switch the database to WAL mode and create the schema, retrying while another process holds a lock.
+
+        After `busy_timeout` seconds the failure is logged and skipped: another process that
+        holds the lock for that long has already set the database up.
+        """
+        connection = self._connection()
+        deadline = time.monotonic() + self._settings.busy_timeout
+        for statement in (
+            "PRAGMA journal_mode=WAL",
+            "CREATE TABLE IF NOT EXISTS postcodes ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT,"
+            " error TEXT,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL"
+            ") WITHOUT ROWID",
+            "CREATE INDEX IF NOT EXISTS postcodes_stored_at ON postcodes (stored_at)",
+        ):
+            while True:
+                try:
+                    with connection:
+                        connection.execute(statement)
+                    break
+                except sqlite3.OperationalError as e:
+                    if time.monotonic() >= deadline:
+                        logger.warning("Could not set up the SQLite cache at '%s': %s", self._settings.path, e)
+                        break
+                    time.sleep(0.05)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._settings.path, timeout=self._settings.busy_timeout, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Return the cached outcome for the postcode, or look it up and cache it."""
+        cached = self.get(postcode)
+        if cached is not None:
+            return Postcode.from_parts(cached)
+
+        try:
+            value = self._inner.handle(postcode)
+        except (PostcodeNotFoundError, HandlerNoResultsError) as e:
+            self._store(postcode, None, e.code)
+            raise
+
+        self._store(postcode, encode_parts(value.parts), None)
+        return value
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """Return the cached outcome, awaiting the wrapped handler on a miss."""
+        cached = self.get(postcode)
+        if cached is not None:
+            return Postcode.from_parts(cached)
+
+        try:
+            value = await self._inner.ahandle(postcode)
+        except (PostcodeNotFoundError, HandlerNoResultsError) as e:
+            self._store(postcode, None, e.code)
+            raise
+
+        self._store(postcode, encode_parts(value.parts), None)
+        return value
+
+    @property
+    def supports_bulk(self) -> bool:
+        """Return True if the wrapped handler supports bulk lookups."""
+        return self._inner.supports_bulk
+
+    @property
+    def bulk_size(self) -> int:
+        """Return the wrapped handler's bulk size."""
+        return self._inner.bulk_size
+
+    def _handle_many(self, postcodes: list[str]) -> list[Union[Postcode, Error]]:
+        """Answer cached postcodes locally and send only the misses to the wrapped handler in bulk."""
+        outcomes: dict[str, Union[Postcode, Error]] = {}
+        for postcode in postcodes:
+            try:
+                cached = self.get(postcode)
+            except Error as e:
+                outcomes[postcode] = e
+                continue
+            if cached is not None:
+                outcomes[postcode] = Postcode.from_parts(cached)
+
+        misses = list(dict.fromkeys(p for p in postcodes if p not in outcomes))
+        if misses:
+            for postcode, outcome in zip(misses, self._inner.handle_many(misses)):
+                outcomes[postcode] = outcome
+                if isinstance(outcome, Postcode):
+                    self._store(postcode, encode_parts(outcome.parts), None)
+                elif isinstance(outcome, (PostcodeNotFoundError, HandlerNoResultsError)):
+                    self._store(postcode, None, outcome.code)
+        return [outcomes[p] for p in postcodes]
+
+    def get(self, postcode: str) -> Optional[PostcodeParts]:
+        """
+        Return the cached parts for a normalized postcode, or None if it is not cached.
+
+        Raises the original error type if a negative outcome is cached. A read that cannot
+        take the lock is logged and treated as a miss, so the wrapped handler still answers.
+        """
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, error FROM postcodes WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (postcode, time.time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning("Could not read postcode '%s' from the SQLite cache: %s", postcode, e)
+            return None
+        if row is None:
+            return None
+
+        value, error = row
+        if error == HandlerErrorCode.HANDLER_RESULTS_ERROR.value:
+            raise HandlerNoResultsError(self._inner.__class__.__name__, postcode)
+        if error is not None:
+            raise PostcodeNotFoundError(postcode)
+        return decode_parts(value)
+
+    def _store(self, postcode: str, value: Optional[str], error: Optional[str]) -> None:
+        """Write an outcome to the database, pruning periodically."""
+        ttl = self._settings.ttl if error is None else self._settings.negative_ttl
+        if ttl == 0:
+            return
+
+        now = time.time()
+        connection = self._connection()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO postcodes (key, value, error, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (postcode, value, error, now, now + ttl if ttl is not None else None),
+                )
+        except sqlite3.OperationalError as e:
+            logger.warning("Could not write postcode '%s' to the SQLite cache: %s", postcode, e)
+            return
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self._settings.prune_interval == 0
+        if due:
+            try:
+                self.prune()
+            except sqlite3.OperationalError as e:
+                logger.warning("Could not prune the SQLite cache at '%s': %s", self._settings.path, e)
+
+    def prune(self) -> int:
+        """Delete expired entries and the oldest entries beyond `max_entries`; return the number removed."""
+        connection = self._connection()
+        with connection:
+            removed = connection.execute("DELETE FROM postcodes WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)).rowcount
+            if self._settings.max_entries is not None:
+                (count,) = connection.execute("SELECT COUNT(*) FROM postcodes").fetchone()
+                excess = count - self._settings.max_entries
+                if excess > 0:
+                    removed += connection.execute(
+                        "DELETE FROM postcodes WHERE key IN (SELECT key FROM postcodes ORDER BY stored_at LIMIT ?)",
+                        (excess,),
+                    ).rowcount
+        logger.debug("Pruned %d entries from the SQLite cache at '%s'", removed, self._settings.path)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM postcodes")
+
+    def close(self) -> None:
+        """Close every database connection opened by this handler, then the wrapped handler."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+        super().close()
@@ -0,0 +1,52 @@
+"""
+Hand-written parser for standard UK postcodes.
+
+Most inputs are ordinary BS7666 postcodes such as `SW1A 1AA`. This module splits them
+into area, district, sector and unit by position instead of going through the regex
+engine. It accepts exactly the values the first (standard) pattern of
+`RegexHandler.RULES` accepts, plus `GIR 0AA`, and returns the same parts. Anything else
+yields None and is left to the regex rules.
+
+Parsing is a single `str.translate` that replaces every character with its character
+class (`L` letter, `U` letter allowed in the unit, `9` digit, space; anything else `?`),
+followed by one dict lookup of the resulting shape, e.g. `UU9L 9UU`. The 72 standard
+shapes are enumerated up front, each with the position where its area and district end.
+A shape fixes the split, except that the standard pattern reads a leading `BF1` as the
+area, so those values are left to the regex rules.
+"""
+
+import string
+from itertools import product
+from typing import Optional
+
+from ..postcode.model import PostcodeFormat, PostcodeParts
+
+_UNIT_LETTERS = "ABDEFGHJLNPQRSTUWXYZ"
+
+_CLASSES = {i: "?" for i in range(128)}
+_CLASSES.update({ord(c): "U" if c in _UNIT_LETTERS else "L" for c in string.ascii_uppercase})
+_CLASSES.update({ord(c): "9" for c in string.digits})
+_CLASSES[ord(" ")] = " "
+
+_SHAPES = {
+    "".join(area) + district + space + "9UU": (len(area), len(area) + len(district))
+    for size in (1, 2)
+    for area in product("LU", repeat=size)
+    for district in ("9", "99", "9L", "9U", "99L", "99U")
+    for space in ("", " ")
+}
+
+_GIR = {"GIR 0AA", "GIR0AA"}
+_UK = PostcodeFormat.UK
+_GIR_PARTS = (_UK, "GIR", None, "0", "AA")
+
+
+def parse_standard(value: str) -> Optional[PostcodeParts]:
+    """Return the parts of a standard UK postcode or `GIR 0AA`, or None if the value has another shape."""
+    split = _SHAPES.get(value.translate(_CLASSES))
+    if split is None:
+        return _GIR_PARTS if value in _GIR else None
+    area, district = split
+    if area == 2 and value[:3] == "BF1":
+        return None
+    return _UK, value[:area], value[area:district], value[-3], value[-2:]
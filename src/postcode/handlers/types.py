@@ -7,3 +7,7 @@ class HandlerType(str, Enum):
     REGEX = "regex"
     HTTP_POSTCODES_IO = "http_postcodes_io"
     HTTP_OSDATAHUB = "http_osdatahub"
+    SQLITE_CACHE = "sqlite_cache"
+    CIRCUIT_BREAKER = "circuit_breaker"
+    CHAIN = "chain"
+    LOCAL_DATASET = "local_dataset"
@@ -0,0 +1,65 @@
+from typing import Any
+
+from pydantic import Field, SerializeAsAny, field_validator
+
+from .base import BaseHandler, BaseHandlerSettings
+from ..postcode.model import Postcode
+
+
+class WrapperHandlerSettings(BaseHandlerSettings):
+    """Base class for settings of handlers that wrap another handler."""
+
+    handler: SerializeAsAny[BaseHandlerSettings] = Field(
+        ...,
+        description="Settings of the wrapped handler, created through the HandlerFactory.",
+    )
+
+    @field_validator("handler", mode="before")
+    @classmethod
+    def _validate_handler(cls, value: Any) -> Any:
+        """Validate nested settings as the settings class of their handler type."""
+        from .factory import HandlerFactory
+
+        return HandlerFactory.settings(value)
+
+
+class BaseWrapperHandler(BaseHandler):
+    """
+    Base class for handlers that add behaviour around another handler.
+
+    The wrapped handler is created from `settings.handler` through the `HandlerFactory`,
+    so any registered handler type can be wrapped. Lookups are forwarded unchanged
+    unless a subclass overrides `_handle`.
+    """
+
+    def __init__(self, settings: WrapperHandlerSettings):
+        from .factory import HandlerFactory
+
+        self._settings = settings
+        self._inner = HandlerFactory.create(settings.handler)
+
+    @property
+    def inner(self) -> BaseHandler:
+        """Return the wrapped handler."""
+        return self._inner
+
+    @property
+    def max_workers(self) -> int:
+        """Return the wrapped handler's concurrency limit for bulk parsing."""
+        return self._inner.max_workers
+
+    def _handle(self, postcode: str) -> Postcode:
+        """Forward the postcode to the wrapped handler."""
+        return self._inner.handle(postcode)
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        """Forward the postcode to the wrapped handler without blocking."""
+        return await self._inner.ahandle(postcode)
+
+    def close(self) -> None:
+        """Release the wrapped handler's resources."""
+        self._inner.close()
+
+    async def aclose(self) -> None:
+        """Release the wrapped handler's async resources."""
+        await self._inner.aclose()
@@ -1,43 +1,219 @@
+import atexit
+import json
 import logging
 import pathlib
-from typing import Optional
+import queue
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
 
 
 from . import PACKAGE_NAME, PACKAGE_VERSION
 
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 logger = logging.getLogger(f"{PACKAGE_NAME}-{PACKAGE_VERSION}")
 logger.addHandler(logging.NullHandler())  # Avoid "No handlers could be found" warning
 
 
+class ErrorSummary:
+    """
+    Aggregated logging of errors by code.
+
+    Logging one ERROR line per invalid postcode floods the log and costs a `LogRecord`
+    per input. Instead, the first error of each code in a window is logged in full and
+    later ones are only counted. The first error after the window has elapsed emits one
+    summary line with the counts, e.g.
+    `Errors in the last 60s: POSTCODE_NOT_FOUND_ERROR=1234 (1233 not logged)`.
+
+    An interval of 0 logs every error, as before aggregation was added.
+    """
+
+    def __init__(self, interval: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window: dict[str, int] = {}
+        self._totals: dict[str, int] = {}
+        self._started = clock()
+
+    @property
+    def interval(self) -> float:
+        """Return the length of a summary window in seconds."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: float) -> None:
+        self.flush()
+        self._interval = interval
+
+    def totals(self) -> dict[str, int]:
+        """Return the number of errors reported per code since the process started."""
+        with self._lock:
+            return dict(self._totals)
+
+    def report(self, error, stacklevel: int = 1) -> None:
+        """Count an error, logging it if it is the first of its code in the current window."""
+        code = error.code
+        with self._lock:
+            self._totals[code] = self._totals.get(code, 0) + 1
+            summary = self._rotate() if self._clock() - self._started >= self._interval else None
+            seen = self._window.get(code, 0)
+            self._window[code] = seen + 1
+
+        if summary:
+            logger.warning(summary)
+        if (seen == 0 or not self._interval) and logger.isEnabledFor(logging.ERROR):
+            logger.error(str(error), stacklevel=stacklevel + 1)
+
+    def flush(self) -> None:
+        """Log the summary of the current window now, if any error went unlogged."""
+        with self._lock:
+            summary = self._rotate()
+        if summary:
+            logger.warning(summary)
+
+    def _rotate(self) -> Optional[str]:
+        """Start a new window, returning the summary line of the old one if it suppressed anything."""
+        window, elapsed = self._window, self._clock() - self._started
+        self._window, self._started = {}, self._clock()
+        if not self._interval or all(count == 1 for count in window.values()):
+            return None
+        counts = ", ".join(f"{code}={count} ({count - 1} not logged)" for code, count in sorted(window.items()))
+        return f"Errors in the last {elapsed:.0f}s: {counts}"
+
+
+error_summary = ErrorSummary()
+
+
+class DropPolicy(str, Enum):
+    """Enumeration of what a full log queue does with a new record."""
+
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    A `QueueHandler` over a bounded queue with a policy for when it is full.
+
+    The new record is dropped (`drop_new`), the oldest queued record is dropped to make
+    room (`drop_oldest`), or, with `block`, the caller waits for the listener to catch up.
+    Only `block` can stall the logging thread. Dropped records are counted in `dropped`.
+    """
+
+    def __init__(self, queue: queue.Queue, policy: DropPolicy = DropPolicy.DROP_NEW):
+        super().__init__(queue)
+        self.policy = DropPolicy(policy)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy is DropPolicy.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.policy is DropPolicy.DROP_OLDEST:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(record)
+                except (queue.Empty, queue.Full):
+                    pass
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+_listener: Optional[QueueListener] = None
+
+
+def shutdown_logger() -> None:
+    """
+    Flush the error summary and stop the queue listener, if any, writing out every queued record.
+
+    Runs automatically at interpreter exit and whenever `configure_logger` is called again.
+    """
+    global _listener
+    error_summary.flush()
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logger)
+
+
 def configure_logger(
     level: str = "INFO",
     to_console: bool = True,
     to_file: Optional[str] = None,
+    error_summary_interval: float = 60.0,
+    queued: bool = False,
+    queue_size: int = 10_000,
+    drop_policy: DropPolicy = DropPolicy.DROP_NEW,
+    json_lines: bool = False,
 ) -> None:
     """
     Configure the internal logger for the postcode package.
 
+    With `queued`, log calls only put the record on a bounded in-memory queue, and a
+    background listener thread does the console and file I/O (including rotation), so
+    logging never blocks a lookup. Queued records are written out by `shutdown_logger`,
+    which also runs at exit.
+
     Args:
         level (str): Logging level, e.g. 'INFO', 'DEBUG', 'WARNING'.
         to_console (bool): Whether to output logs to the console.
         to_file (Optional[str]): File path to log to. If None, file logging is disabled.
+        error_summary_interval (float): Seconds between summary lines for repeated errors
+            of the same code; only the first of each code per interval is logged in full.
+            0 logs every error.
+        queued (bool): Hand records to a background thread instead of writing them inline.
+        queue_size (int): Maximum number of records waiting in the queue.
+        drop_policy (DropPolicy): What to do when the queue is full: drop the new record,
+            drop the oldest queued record, or block until there is room.
+        json_lines (bool): Write each record as a JSON object on its own line.
     """
+    shutdown_logger()
+    error_summary.interval = error_summary_interval
     logger.setLevel(level.upper())
     logger.handlers.clear()
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if json_lines:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
+    handlers: list[logging.Handler] = []
     if to_console:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
         stream_handler.setLevel(level)
-        logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
     if to_file:
         log_path = pathlib.Path(to_file)
@@ -45,4 +221,15 @@ def configure_logger(
         file_handler = RotatingFileHandler(log_path, maxBytes=10 * 1024 * 1024, backupCount=3)
         file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if not queued:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return
+
+    global _listener
+    records: queue.Queue = queue.Queue(maxsize=queue_size)
+    logger.addHandler(BoundedQueueHandler(records, drop_policy))
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
@@ -0,0 +1,340 @@
+import bisect
+import math
+from abc import ABC, abstractmethod
+import pathlib
+import threading
+from typing import Callable, Optional, Union
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric(ABC):
+    """
+    Base class for metrics: a named family of children, one per combination of label values.
+
+    `labels(...)` returns the child for the given label values, creating it on first use.
+    Callers on a hot path keep the child rather than looking it up on every update.
+    """
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **labels: str):
+        """Return the child for the given label values (strings), by position or by name."""
+        if labels:
+            if set(labels) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+            values = tuple(labels[name] for name in self.labelnames)
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}.")
+            key = tuple(str(value) for value in values)
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._child()
+        return child
+
+    def snapshot(self) -> dict[LabelValues, object]:
+        """Return the current value of every child, keyed by its label values."""
+        with self._lock:
+            children = list(self._children.items())
+        return {key: child.get() for key, child in children}
+
+    def reset(self) -> None:
+        """Set every child back to zero; children already handed out stay valid."""
+        with self._lock:
+            children = list(self._children.values())
+        for child in children:
+            child.reset()
+
+    @abstractmethod
+    def _child(self):
+        """Create the child holding the value of one combination of label values."""
+
+    def _samples(self) -> list[tuple[str, LabelValues, tuple[str, ...], float]]:
+        """Return (suffix, label values, extra label pair, value) tuples for the text exposition."""
+        return [("", key, (), value) for key, value in self.snapshot().items()]
+
+
+class _Value:
+    """A single thread-safe number."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._lock.acquire()
+        self._value += amount
+        self._lock.release()
+
+    def get(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0.0
+
+
+class _GaugeValue(_Value):
+    """A single thread-safe number that may go down or be computed on demand."""
+
+    __slots__ = ("_function",)
+
+    def __init__(self):
+        super().__init__()
+        self._function: Optional[Callable[[], float]] = None
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def get(self) -> float:
+        return self._function() if self._function is not None else self._value
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, e.g. lookups or errors."""
+
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add `amount` to the child for the given labels."""
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        self.labels(**labels).inc(amount)
+
+    def _child(self) -> _Value:
+        return _Value()
+
+
+class Gauge(_Metric):
+    """A value that can go up and down, e.g. a queue length or a cache hit ratio."""
+
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the child for the given labels to `value`."""
+        self.labels(**labels).set(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add `amount` to the child for the given labels."""
+        self.labels(**labels).inc(amount)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Subtract `amount` from the child for the given labels."""
+        self.labels(**labels).dec(amount)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Compute the child for the given labels by calling `function` whenever it is read."""
+        self.labels(**labels).set_function(function)
+
+    def _child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+
+class _HistogramValue:
+    """Thread-safe bucket counts of observed values."""
+
+    __slots__ = ("_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        self._lock.acquire()
+        self._counts[index] += 1
+        self._sum += value
+        self._lock.release()
+
+    def get(self) -> dict[str, object]:
+        """Return cumulative `buckets` keyed by upper bound, the `sum` and the `count`."""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self._bounds + (math.inf,), counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"buckets": buckets, "sum": total, "count": cumulative}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self._sum = 0.0
+
+
+class Histogram(_Metric):
+    """
+    Observations counted into fixed buckets, e.g. latencies in seconds.
+
+    Bucket bounds are upper bounds; an implicit `+Inf` bucket catches everything larger.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bound for bound in buckets if bound != math.inf))
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Count `value` into the child for the given labels."""
+        self.labels(**labels).observe(value)
+
+    def _child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def _samples(self):
+        samples = []
+        for key, state in self.snapshot().items():
+            for bound, count in state["buckets"].items():
+                samples.append(("_bucket", key, ("le", _format_value(bound)), count))
+            samples.append(("_sum", key, (), state["sum"]))
+            samples.append(("_count", key, (), state["count"]))
+        return samples
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """
+    A collection of metrics with snapshot, reset and Prometheus text export.
+
+    Metrics are registered once by name; asking for an existing name returns the
+    registered metric, so modules can declare the metrics they update at import time.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Return the counter with this name, registering it if needed."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Return the gauge with this name, registering it if needed."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Return the histogram with this name, registering it if needed."""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Return the metric registered under this name, if any."""
+        return self._metrics.get(name)
+
+    def snapshot(self) -> dict[str, dict[LabelValues, object]]:
+        """Return the current value of every metric, keyed by name and then by label values."""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def reset(self) -> None:
+        """Reset every metric to zero; registrations are kept."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, help_text=True)}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for suffix, key, extra, value in metric._samples():
+                pairs = [f'{name}="{_escape(value)}"' for name, value in zip(metric.labelnames, key)]
+                if extra:
+                    pairs.append(f'{extra[0]}="{extra[1]}"')
+                labels = "{" + ",".join(pairs) + "}" if pairs else ""
+                lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path: Union[str, pathlib.Path]) -> None:
+        """
+        Write the Prometheus text exposition to a file, e.g. for the node exporter's textfile collector.
+
+        The file is replaced atomically so a scraper never reads a partial export.
+        """
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        tmp.replace(path)
+
+    def _register(self, cls: type, name: str, documentation: str, labelnames: tuple[str, ...], **kwargs) -> Metric:
+        """Return the metric registered under `name`, creating it as `cls` if it does not exist."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.TYPE} with labels {metric.labelnames}.")
+            return metric
+
+
+def _escape(value: str, help_text: bool = False) -> str:
+    """Escape a label value (or HELP text) for the text exposition format."""
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value if help_text else value.replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects, e.g. `+Inf` and `3` rather than `3.0`."""
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+registry = MetricsRegistry()
+
+PARSE_SECONDS = registry.histogram(
+    "postcode_parse_seconds", "Latency of Service.parse_one and AsyncService.parse_one in seconds, by outcome.", ("outcome",)
+)
+BATCH_SECONDS = registry.histogram(
+    "postcode_batch_seconds", "Latency of bulk Service calls (parse_many, validate_many, ...) in seconds, by method.", ("method",)
+)
+BATCH_POSTCODES = registry.counter(
+    "postcode_batch_postcodes_total", "Postcodes processed by bulk Service calls, by method and outcome.", ("method", "outcome")
+)
+ERRORS = registry.counter("postcode_errors_total", "Failed parses by error code, from single and bulk calls.", ("code",))
+CACHE_LOOKUPS = registry.counter("postcode_cache_lookups_total", "Result cache lookups by Service, by result.", ("result",))
+HANDLER_SECONDS = registry.histogram(
+    "postcode_handler_lookup_seconds",
+    "Latency of single-postcode handler lookups (handle, try_handle_parts, ahandle) outside parse_one in seconds, by handler and outcome.",
+    ("handler", "outcome"),
+)
+HANDLER_BULK_SECONDS = registry.histogram(
+    "postcode_handler_bulk_seconds", "Latency of BaseHandler.handle_many calls in seconds, by handler.", ("handler",)
+)
+HANDLER_BULK_LOOKUPS = registry.counter(
+    "postcode_handler_bulk_lookups_total", "Postcodes resolved by BaseHandler.handle_many, by handler and outcome.", ("handler", "outcome")
+)
+HTTP_SECONDS = registry.histogram(
+    "postcode_http_request_seconds", "Latency of HTTP requests sent by the HTTP handlers in seconds, by status.", ("handler", "status")
+)
@@ -1,4 +1,5 @@
 from .model import Postcode
+from .value import PostcodeValue
 from .errors import (
     PostcodeErrorCode,
     PostcodeError,
@@ -10,6 +11,7 @@ from .errors import (
 
 __all__ = [
     "Postcode",
+    "PostcodeValue",
     "PostcodeErrorCode",
     "PostcodeError",
     "PostcodeFormatError",
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from .format import PostcodeFormat
+from .model import PostcodeParts
+
+SEPARATOR = "|"
+
+
+def encode_parts(parts: PostcodeParts) -> str:
+    """
+    Encode postcode parts as a compact string, e.g. 'UK|SW|1W|0|NY'.
+
+    Missing components are encoded as empty fields. Components only ever contain
+    A-Z and 0-9, so the separator never needs escaping.
+    """
+    format, area, district, sector, unit = parts
+    return SEPARATOR.join((format.value, area or "", district or "", sector or "", unit or ""))
+
+
+def decode_parts(value: str) -> PostcodeParts:
+    """Decode a string produced by `encode_parts` back into postcode parts."""
+    format, area, district, sector, unit = value.split(SEPARATOR)
+    return (PostcodeFormat(format), _field(area), _field(district), _field(sector), _field(unit))
+
+
+def _field(value: str) -> Optional[str]:
+    return value or None
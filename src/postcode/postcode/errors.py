@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any, Optional
 
 from ..error import Error
 
@@ -21,9 +22,10 @@ class PostcodeError(Error):
         postcode: str,
         message: str = "Postcode error.",
         code: str = PostcodeErrorCode.POSTCODE_ERROR.value,
+        params: Optional[dict[str, Any]] = None,
     ) -> None:
         self.postcode = postcode
-        super().__init__(code, message)
+        super().__init__(code, message, params)
 
     def __str__(self):
         return f"[{self.code}] [{self.postcode}] {self.message}"
@@ -35,20 +37,23 @@ class PostcodeTypeError(PostcodeError):
     def __init__(self, postcode: str) -> None:
         super().__init__(
             postcode,
-            f"Postcode '{postcode}' must be a string.",
+            "Postcode '{postcode}' must be a string.",
             PostcodeErrorCode.POSTCODE_TYPE_ERROR.value,
+            {"postcode": postcode},
         )
 
 
 class PostcodeFormatError(PostcodeError):
     """Error for invalid postcode format."""
 
-    def __init__(self, postcode: str, message: str = None) -> None:
-        message = message or f"Postcode '{postcode}' has an invalid format."
+    def __init__(self, postcode: str, message: str = None, params: Optional[dict[str, Any]] = None) -> None:
+        if message is None:
+            message, params = "Postcode '{postcode}' has an invalid format.", {"postcode": postcode}
         super().__init__(
             postcode,
             message,
             PostcodeErrorCode.POSTCODE_FORMAT_ERROR.value,
+            params,
         )
 
 
@@ -58,8 +63,9 @@ class PostcodeLengthError(PostcodeError):
     def __init__(self, postcode: str, min_length: int, max_length: int) -> None:
         super().__init__(
             postcode,
-            f"Postcode '{postcode}' must be between {min_length} and {max_length} characters long.",
+            "Postcode '{postcode}' must be between {min_length} and {max_length} characters long.",
             PostcodeErrorCode.POSTCODE_LENGTH_ERROR.value,
+            {"postcode": postcode, "min_length": min_length, "max_length": max_length},
         )
 
 
@@ -69,6 +75,7 @@ class PostcodeNotFoundError(PostcodeError):
     def __init__(self, postcode: str) -> None:
         super().__init__(
             postcode,
-            f"Postcode '{postcode}' not found.",
+            "Postcode '{postcode}' not found.",
             PostcodeErrorCode.POSTCODE_NOT_FOUND_ERROR.value,
+            {"postcode": postcode},
         )
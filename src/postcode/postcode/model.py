@@ -4,6 +4,9 @@ from pydantic import BaseModel, Field
 
 from .format import PostcodeFormat
 
+PostcodeParts = tuple[PostcodeFormat, Optional[str], Optional[str], Optional[str], Optional[str]]
+"""Plain-tuple form of a postcode: (format, area, district, sector, unit)."""
+
 
 class Postcode(BaseModel):
     """A model representing a postcode."""
@@ -29,6 +32,17 @@ class Postcode(BaseModel):
         description="The unit of the postcode, e.g., 'AA'.",
     )
 
+    @property
+    def parts(self) -> PostcodeParts:
+        """Return the postcode as a plain (format, area, district, sector, unit) tuple."""
+        return (self.format, self.area, self.district, self.sector, self.unit)
+
+    @classmethod
+    def from_parts(cls, parts: PostcodeParts) -> "Postcode":
+        """Construct a Postcode from a (format, area, district, sector, unit) tuple."""
+        format, area, district, sector, unit = parts
+        return cls(format=format, area=area, district=district, sector=sector, unit=unit)
+
     @property
     def full(self) -> str:
         """Return the full postcode (outward + inward)."""
@@ -1,6 +1,8 @@
 import re
+from typing import Optional
 
 from .errors import (
+    PostcodeError,
     PostcodeFormatError,
     PostcodeLengthError,
     PostcodeTypeError,
@@ -8,7 +10,6 @@ from .errors import (
 from .normalize import strip_postcode
 from ..error import log_and_raise
 
-
 MIN_POSTCODE_LENGTH = 4
 MAX_POSTCODE_LENGTH = 9
 VALID_POSTCODE_CHARS = re.compile(r"^[A-Z0-9 \-]+$", re.IGNORECASE)
@@ -57,7 +58,29 @@ def validate_postcode_length(postcode: str) -> None:
 
 def validate_postcode(postcode: str) -> None:
     """Validate the postcode by checking type, content, length, and characters."""
-    validate_postcode_type(postcode)
-    validate_postcode_not_empty(postcode)
-    validate_postcode_length(postcode)
-    validate_postcode_chars(postcode)
+    error = check_postcode(postcode)
+    if error is not None:
+        log_and_raise(error)
+
+
+def check_postcode(postcode: object) -> Optional[PostcodeError]:
+    """
+    Run the same checks as `validate_postcode`, returning the first failure instead of raising it.
+
+    The error is neither logged nor raised, so it carries no traceback, and its message
+    is only formatted if it is read. Returns None if the postcode passes every check.
+    """
+    if not isinstance(postcode, str):
+        return PostcodeTypeError(postcode=str(postcode))
+    stripped = strip_postcode(postcode)
+    if stripped == "":
+        return PostcodeFormatError(postcode, "Postcode '{postcode}' cannot be empty or whitespace.", {"postcode": postcode})
+    if not (MIN_POSTCODE_LENGTH <= len(stripped) <= MAX_POSTCODE_LENGTH):
+        return PostcodeLengthError(postcode=postcode, min_length=MIN_POSTCODE_LENGTH, max_length=MAX_POSTCODE_LENGTH)
+    if not VALID_POSTCODE_CHARS.match(postcode):
+        return PostcodeFormatError(
+            postcode,
+            "Postcode '{postcode}' contains invalid characters. Only A-Z, 0-9, space, and hyphen are allowed.",
+            {"postcode": postcode},
+        )
+    return None
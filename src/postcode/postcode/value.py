@@ -0,0 +1,134 @@
+from typing import TYPE_CHECKING, Optional
+
+from .format import PostcodeFormat
+from .model import Postcode, PostcodeParts
+
+if TYPE_CHECKING:
+    from ..result import Result
+
+
+class PostcodeValue:
+    """
+    A lightweight, immutable postcode.
+
+    Holds the same components as the `Postcode` model in a slotted object, without
+    validation on construction. The derived `outcode`, `incode` and `full` strings are
+    computed on first access and cached. Values are hashable and compare equal when
+    their components are equal, so they can be used as dict keys or in sets.
+
+    Use it where many postcodes are created or held at once, and convert with
+    `to_postcode()` or `to_result()` where the pydantic models are needed.
+
+    ### Examples:
+        value = PostcodeValue(PostcodeFormat.UK, "SW", "1A", "1", "AA")
+        value.full           # 'SW1A 1AA'
+        value.to_postcode()  # Postcode(format='UK', area='SW', ...)
+    """
+
+    __slots__ = ("format", "area", "district", "sector", "unit", "_outcode", "_incode", "_full")
+
+    format: PostcodeFormat
+    area: Optional[str]
+    district: Optional[str]
+    sector: Optional[str]
+    unit: Optional[str]
+
+    def __init__(
+        self,
+        format: PostcodeFormat,
+        area: Optional[str] = None,
+        district: Optional[str] = None,
+        sector: Optional[str] = None,
+        unit: Optional[str] = None,
+    ):
+        _set_format(self, format)
+        _set_area(self, area)
+        _set_district(self, district)
+        _set_sector(self, sector)
+        _set_unit(self, unit)
+
+    @classmethod
+    def from_parts(cls, parts: PostcodeParts) -> "PostcodeValue":
+        """Construct a value from a (format, area, district, sector, unit) tuple."""
+        return cls(*parts)
+
+    @classmethod
+    def from_postcode(cls, postcode: Postcode) -> "PostcodeValue":
+        """Construct a value from a `Postcode` model."""
+        return cls(postcode.format, postcode.area, postcode.district, postcode.sector, postcode.unit)
+
+    @property
+    def parts(self) -> PostcodeParts:
+        """Return the postcode as a plain (format, area, district, sector, unit) tuple."""
+        return (self.format, self.area, self.district, self.sector, self.unit)
+
+    @property
+    def outcode(self) -> str:
+        """Return the outward code (area + district)."""
+        try:
+            return self._outcode
+        except AttributeError:
+            return _cache(self, "_outcode", f"{self.area or ''}{self.district or ''}")
+
+    @property
+    def incode(self) -> str:
+        """Return the inward code (sector + unit)."""
+        try:
+            return self._incode
+        except AttributeError:
+            return _cache(self, "_incode", f"{self.sector or ''}{self.unit or ''}")
+
+    @property
+    def full(self) -> str:
+        """Return the full postcode (outward + inward)."""
+        try:
+            return self._full
+        except AttributeError:
+            return _cache(self, "_full", f"{self.outcode} {self.incode}")
+
+    def to_postcode(self) -> Postcode:
+        """Materialize the value as a `Postcode` model."""
+        return Postcode.from_parts(self.parts)
+
+    def to_result(self) -> "Result":
+        """Materialize the value as a successful `Result`."""
+        from ..result import Result
+
+        return Result.success(self.to_postcode())
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PostcodeValue):
+            return NotImplemented
+        return self.parts == other.parts
+
+    def __hash__(self) -> int:
+        return hash(self.parts)
+
+    def __reduce__(self):
+        return (PostcodeValue, self.parts)
+
+    def __repr__(self) -> str:
+        return (
+            f"PostcodeValue(format={self.format}, area={self.area!r}, district={self.district!r}, "
+            f"sector={self.sector!r}, unit={self.unit!r})"
+        )
+
+
+# Slot descriptors write past the immutable `__setattr__`, and faster than `object.__setattr__`.
+_set_format = PostcodeValue.format.__set__
+_set_area = PostcodeValue.area.__set__
+_set_district = PostcodeValue.district.__set__
+_set_sector = PostcodeValue.sector.__set__
+_set_unit = PostcodeValue.unit.__set__
+
+
+def _cache(value: PostcodeValue, name: str, derived: str) -> str:
+    """Store a derived field on a value and return it."""
+    getattr(PostcodeValue, name).__set__(value, derived)
+    return derived
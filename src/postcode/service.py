@@ -1,15 +1,40 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
+
 from .handlers.base import BaseHandler, BaseHandlerSettings
+from .handlers.chain import ChainHandler
+from .handlers.dataset import LocalDatasetHandler
+from .handlers.wrapper import BaseWrapperHandler
 from .handlers.factory import HandlerFactory
 from .handlers.regex import RegexHandlerSettings
 from .handlers.http.postcode_io import PostcodeIOHandlerSettings
 from .handlers.http.osdatahub import OSDataHubHandlerSettings
 from .handlers.errors import HandlerError
 from .postcode.normalize import normalize_postcode
-from .postcode.validation import validate_postcode
+from .postcode.validation import check_postcode, validate_postcode
 from .postcode.errors import PostcodeError
+from .postcode.model import Postcode, PostcodeParts
+from .postcode.value import PostcodeValue
 from .result import Result
-from .error import Error, InternalError
+from .batch import PostcodeColumns
+from .cache import CacheSettings, ResultCache
+from .directory import PostcodeHierarchy
+from .suggest import Suggestion
+from .error import Error, InternalError, log_and_raise
 from .logging import logger
+from .metrics import BATCH_POSTCODES, BATCH_SECONDS, CACHE_LOOKUPS, ERRORS, PARSE_SECONDS
+from .tracing import current_tracer, start_as_current_span
+
+_PARSED, _PARSE_FAILED = PARSE_SECONDS.labels("ok"), PARSE_SECONDS.labels("error")
+_CACHE_HITS, _CACHE_MISSES = CACHE_LOOKUPS.labels("hit"), CACHE_LOOKUPS.labels("miss")
+
+# Lookups submitted ahead of the consumer per worker thread in `parse_columns` and `parse_values`.
+_WINDOW_PER_WORKER = 4
+
+T = TypeVar("T")
 
 
 class Service:
@@ -20,6 +45,8 @@ class Service:
     and extract postcode components like area, district, sector, and unit.
 
     Handlers can be swapped for offline (regex) or online (Postcode.io, OS Data Hub) lookups.
+    An optional `ResultCache` answers repeated lookups of the same normalized postcode
+    without calling the handler again.
 
     Example:
         service = Service.using_regex()
@@ -29,18 +56,54 @@ class Service:
 
     ### Core Methods
     - parse_one(postcode): Parse and validate a single postcode.
-    - parse_many(postcodes): Bulk parse multiple postcodes.
+    - parse_many(postcodes): Bulk parse multiple postcodes, concurrently for online handlers.
+    - parse_iter(postcodes): Lazily parse any iterable of postcodes.
+    - parse_file(path): Lazily parse a file with one postcode per line.
+    - parse_columns(postcodes): Bulk parse into a columnar `PostcodeColumns` container.
+    - parse_values(postcodes): Bulk parse into lightweight `PostcodeValue` objects.
     - validate_one(postcode): Check if a postcode is valid.
     - validate_many(postcodes): Bulk validation.
 
+    ### Directory Methods
+    These require a local dataset handler, on its own or inside a wrapper or chain.
+    - count_postcodes(prefix): Number of postcodes in an area, district or sector.
+    - children(prefix): The districts of an area, sectors of a district or units of a sector, with counts.
+    - enumerate_postcodes(prefix): Every postcode under a prefix, in sorted order.
+    - suggest(postcode, k): The known postcodes nearest to a mistyped one.
+
+    ### Lifecycle
+    - close(): Release pooled connections held by the handler. A `Service` can
+      also be used as a context manager (`with Service.using_postcode_io() as service:`).
+
     ### Factory Methods
     - using_regex(): Use built-in regex validation (offline).
     - using_postcode_io(): Use Postcode.io API (online).
     - using_osdatahub(): Use OS Data Hub API (online).
     """
 
-    def __init__(self, handler: BaseHandler):
+    def __init__(self, handler: BaseHandler, cache: Optional[ResultCache] = None):
         self._handler = handler
+        self._cache = cache
+
+    @property
+    def handler(self) -> BaseHandler:
+        """Return the handler used for lookups."""
+        return self._handler
+
+    @property
+    def cache(self) -> Optional[ResultCache]:
+        """Return the result cache, if caching is enabled."""
+        return self._cache
+
+    def close(self) -> None:
+        """Release resources held by the handler, such as pooled HTTP connections."""
+        self._handler.close()
+
+    def __enter__(self) -> "Service":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Parsing Methods
@@ -53,15 +116,293 @@ class Service:
         This will normalize and validate the input, then return a `Result` containing either
         the parsed `Postcode` model or a structured `Error`.
 
+        The call is counted by outcome and error code, and timed, in `postcode.metrics.registry`.
+        If a tracer is installed with `postcode.tracing.set_tracer`, the call and each of its
+        stages are reported as spans.
+
         Args:
             postcode (str): The raw postcode string (can be lowercased, spaced, etc.).
 
         Returns:
             Result: Contains the parsed postcode or an error.
         """
+        start = time.perf_counter()
+        if current_tracer() is None:
+            result = self._parse_one(postcode)
+        else:
+            result = self._traced_parse_one(postcode)
+        if result.error is None:
+            _PARSED.observe(time.perf_counter() - start)
+        else:
+            _PARSE_FAILED.observe(time.perf_counter() - start)
+            ERRORS.labels(result.error.code).inc()
+        return result
+
+    def parse_many(self, postcodes: list[str], max_workers: Optional[int] = None) -> list[Result]:
+        """
+        Validate and parse a list of postcodes.
+
+        Lookups are dispatched to a bounded pool of worker threads when more than one
+        worker is allowed, which hides the round-trip latency of the online handlers.
+        Results are always returned in input order, and a failure for one postcode is
+        captured in its own `Result` exactly as in `parse_one`, but as an error value that
+        was never raised or logged, so invalid inputs stay cheap. Repeated inputs are only
+        looked up once and share the same `Result`. Handlers with a bulk upstream API
+        (e.g. Postcodes.io) receive the postcodes in chunks instead of one at a time.
+        Unlike `parse_one`, bulk calls open no tracing spans; they are covered by metrics only.
+
+        Args:
+            postcodes (list[str]): A list of postcode strings.
+            max_workers (Optional[int]): Maximum number of lookups in flight at once.
+                Defaults to the handler's `max_workers` setting. Values below 1 raise `ValueError`.
+
+        Returns:
+            list[Result]: A list of results, one for each postcode.
+        """
+        start = time.perf_counter()
+        outcomes = self._parse_outcomes(postcodes, max_workers)
+        parsed = {p: self._result(outcome) for p, outcome in outcomes.items()}
+        self._record_batch("parse_many", start, (outcomes[p] for p in postcodes if isinstance(p, str)))
+        return [parsed[p] if isinstance(p, str) else self.parse_one(p) for p in postcodes]
+
+    def parse_iter(self, postcodes: Iterable[str], prefetch: int = 0) -> Iterator[Result]:
+        """
+        Lazily validate and parse postcodes from any iterable.
+
+        Results are yielded in input order and only `prefetch` results are held at any
+        time, so memory use is constant regardless of the input size. With a look-ahead
+        window, upcoming postcodes are looked up on background threads (bounded by the
+        handler's `max_workers`) while the consumer processes earlier results.
+
+        Args:
+            postcodes (Iterable[str]): Any iterable of postcode strings, including generators.
+            prefetch (int): Number of postcodes to look up ahead of the consumer. 0 disables look-ahead.
+
+        Yields:
+            Result: The result for each postcode, in input order.
+        """
+        if prefetch <= 0:
+            for postcode in postcodes:
+                yield self.parse_one(postcode)
+            return
+
+        workers = max(1, min(prefetch, self._handler.max_workers))
+        yield from self._map_bounded(self.parse_one, postcodes, workers, prefetch)
+
+    def parse_file(self, path: Union[str, os.PathLike], prefetch: int = 0, encoding: str = "utf-8") -> Iterator[Result]:
+        """
+        Lazily validate and parse a text file containing one postcode per line.
+
+        Line endings are removed before parsing; every line, including blank ones,
+        produces exactly one result so results can be matched back to line numbers.
+
+        Args:
+            path (Union[str, os.PathLike]): Path to the file.
+            prefetch (int): Number of postcodes to look up ahead of the consumer.
+            encoding (str): Text encoding of the file.
+
+        Yields:
+            Result: The result for each line, in file order.
+        """
+        with open(path, encoding=encoding) as file:
+            yield from self.parse_iter((line.rstrip("\r\n") for line in file), prefetch=prefetch)
+
+    def parse_columns(self, postcodes: Iterable[str], max_workers: Optional[int] = None) -> PostcodeColumns:
+        """
+        Validate and parse postcodes into a column-oriented container.
+
+        No `Result` or `Postcode` model is built per row: components are appended to
+        parallel lists, and row views only materialize models when asked.
+
+        Args:
+            postcodes (Iterable[str]): Any iterable of postcode strings.
+            max_workers (Optional[int]): Maximum number of lookups in flight at once.
+                Defaults to the handler's `max_workers` setting. Values below 1 raise `ValueError`.
+
+        Returns:
+            PostcodeColumns: Components, validity mask and error codes, one entry per input.
+        """
+        start = time.perf_counter()
+        columns = PostcodeColumns()
+        workers = self._workers(max_workers)
+        if workers <= 1:
+            self._append_columns(columns, map(self._parse_parts, postcodes))
+        else:
+            self._append_columns(columns, self._map_bounded(self._parse_parts, postcodes, workers, workers * _WINDOW_PER_WORKER))
+        self._record_batch("parse_columns", start, columns.errors)
+        return columns
+
+    def parse_values(self, postcodes: Iterable[str], max_workers: Optional[int] = None) -> list[Union[PostcodeValue, Error]]:
+        """
+        Validate and parse postcodes into lightweight `PostcodeValue` objects.
+
+        Suited to holding very many parsed postcodes: a `PostcodeValue` is a fraction of
+        the size of a `Postcode` model and much cheaper to create, and converts to one
+        with `to_postcode()` when needed.
+
+        Args:
+            postcodes (Iterable[str]): Any iterable of postcode strings.
+            max_workers (Optional[int]): Maximum number of lookups in flight at once.
+                Defaults to the handler's `max_workers` setting. Values below 1 raise `ValueError`.
+
+        Returns:
+            list[Union[PostcodeValue, Error]]: The parsed value, or the error, for each postcode in input order.
+        """
+        start = time.perf_counter()
+        workers = self._workers(max_workers)
+        if workers <= 1:
+            outcomes = list(map(self._parse_parts, postcodes))
+        else:
+            outcomes = list(self._map_bounded(self._parse_parts, postcodes, workers, workers * _WINDOW_PER_WORKER))
+        self._record_batch("parse_values", start, outcomes)
+        return [outcome if isinstance(outcome, Error) else PostcodeValue(*outcome) for outcome in outcomes]
+
+    def _parse_outcomes(self, postcodes: list[str], max_workers: Optional[int]) -> dict[str, Union[Postcode, PostcodeParts, Error]]:
+        """Parse the distinct string postcodes of a list without raising, keyed by input."""
+        max_workers = self._workers(max_workers)
+        unique = list(dict.fromkeys(p for p in postcodes if isinstance(p, str)))
+        workers = min(max_workers, len(unique))
+        if self._handler.supports_bulk:
+            return self._parse_bulk(unique, max_workers)
+        if workers <= 1:
+            return dict(zip(unique, map(self._parse_parts, unique)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="postcode") as executor:
+            return dict(zip(unique, executor.map(self._parse_parts, unique)))
+
+    @staticmethod
+    def _map_bounded(function: Callable[[str], T], postcodes: Iterable[str], workers: int, window: int) -> Iterator[T]:
+        """
+        Apply `function` to each postcode on `workers` threads, yielding the outcomes in input order.
+
+        At most `window` calls are submitted ahead of the consumer, so the input is read and
+        held incrementally rather than all at once. Calls still pending when the consumer
+        stops are cancelled.
+        """
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="postcode") as executor:
+            try:
+                for postcode in postcodes:
+                    pending.append(executor.submit(function, postcode))
+                    if len(pending) > window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _workers(self, max_workers: Optional[int]) -> int:
+        """Return the number of lookups a bulk call may run at once, defaulting to the handler's `max_workers`."""
+        if max_workers is None:
+            return self._handler.max_workers
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        return max_workers
+
+    @staticmethod
+    def _result(outcome: Union[Postcode, PostcodeParts, Error]) -> Result:
+        """Wrap a parse outcome in a `Result`."""
+        if isinstance(outcome, Error):
+            return Result.failure(outcome)
+        return Result.success(outcome if isinstance(outcome, Postcode) else Postcode.from_parts(outcome))
+
+    def _parse_parts(self, postcode: str) -> Union[PostcodeParts, Error]:
+        """
+        Validate and parse a single postcode into its parts, returning the error on failure.
+
+        Validation and handler failures are returned as error values rather than raised
+        and caught, so invalid inputs cost little more than valid ones.
+        """
         try:
-            validate_postcode(postcode)
-            return Result.success(self._handler.handle(normalize_postcode(postcode)))
+            error = check_postcode(postcode)
+            if error is not None:
+                return error
+            if self._cache is None:
+                return self._handler.try_handle_parts(normalize_postcode(postcode))
+            outcome = self._lookup(normalize_postcode(postcode))
+            return outcome if isinstance(outcome, Error) else outcome.parts
+        except (PostcodeError, HandlerError, InternalError, Error) as e:
+            return e.with_traceback(None)
+        except Exception as e:
+            error = InternalError(f"An unexpected error occurred while parsing postcode '{postcode}': {str(e)}")
+            logger.exception(str(error))
+            return error
+
+    @staticmethod
+    def _record_batch(method: str, start: float, outcomes: Iterable[object]) -> None:
+        """Record a bulk call's latency and its per-postcode outcomes and error codes in the metrics."""
+        succeeded, codes = 0, {}
+        for outcome in outcomes:
+            if isinstance(outcome, Error):
+                codes[outcome.code] = codes.get(outcome.code, 0) + 1
+            else:
+                succeeded += 1
+        BATCH_SECONDS.labels(method).observe(time.perf_counter() - start)
+        BATCH_POSTCODES.labels(method, "ok").inc(succeeded)
+        BATCH_POSTCODES.labels(method, "error").inc(sum(codes.values()))
+        for code, count in codes.items():
+            ERRORS.labels(code).inc(count)
+
+    @staticmethod
+    def _append_columns(columns: PostcodeColumns, outcomes: Iterable[Union[PostcodeParts, Error]]) -> None:
+        """Append parse outcomes to a columnar container."""
+        for outcome in outcomes:
+            if isinstance(outcome, Error):
+                columns.append_error(outcome)
+            else:
+                columns.append_parts(outcome)
+
+    def _parse_bulk(self, postcodes: list[str], max_workers: int) -> dict[str, Union[Postcode, Error]]:
+        """Validate and parse distinct postcodes through the handler's bulk lookup."""
+        normalized: dict[str, Union[str, Error]] = {}
+        for postcode in postcodes:
+            error = check_postcode(postcode)
+            normalized[postcode] = normalize_postcode(postcode) if error is None else error
+
+        lookups = list(dict.fromkeys(v for v in normalized.values() if isinstance(v, str)))
+        outcomes = dict(zip(lookups, self._lookup_many(lookups, max_workers)))
+        return {postcode: outcomes[value] if isinstance(value, str) else value for postcode, value in normalized.items()}
+
+    def _lookup_many(self, postcodes: list[str], max_workers: int) -> list[Union[Postcode, Error]]:
+        """Look normalized postcodes up through the cache and the handler's bulk lookup, in chunks."""
+        outcomes: dict[str, Union[Postcode, Error, None]] = dict.fromkeys(postcodes)
+        if self._cache is not None:
+            for postcode in postcodes:
+                outcomes[postcode] = self._cache.get(postcode)
+
+        pending = [p for p, outcome in outcomes.items() if outcome is None]
+        if self._cache is not None:
+            _CACHE_HITS.inc(len(outcomes) - len(pending))
+            _CACHE_MISSES.inc(len(pending))
+        size = self._handler.bulk_size
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+        workers = min(max_workers, len(chunks))
+        if workers <= 1:
+            resolved = list(map(self._handler.handle_many, chunks))
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="postcode") as executor:
+                resolved = list(executor.map(self._handler.handle_many, chunks))
+
+        for chunk, chunk_outcomes in zip(chunks, resolved):
+            for postcode, outcome in zip(chunk, chunk_outcomes):
+                outcomes[postcode] = outcome
+                if self._cache is not None:
+                    self._cache.put(postcode, outcome)
+        return [outcomes[p] for p in postcodes]
+
+    def _parse_one(self, postcode: str, traced: bool = False) -> Result:
+        """Validate, normalize and look up a single postcode, returning any failure as a `Result`."""
+        try:
+            if traced:
+                with start_as_current_span("postcode.validate"):
+                    validate_postcode(postcode)
+                with start_as_current_span("postcode.normalize"):
+                    normalized = normalize_postcode(postcode)
+            else:
+                validate_postcode(postcode)
+                normalized = normalize_postcode(postcode)
+            outcome = self._lookup(normalized, timed=False)
+            return Result.failure(outcome) if isinstance(outcome, Error) else Result.success(outcome)
         except (PostcodeError, HandlerError, InternalError, Error) as e:
             return Result.failure(e)
         except Exception as e:
@@ -69,17 +410,44 @@ class Service:
             logger.exception(str(error))
             return Result.failure(error)
 
-    def parse_many(self, postcodes: list[str]) -> list[Result]:
+    def _traced_parse_one(self, postcode: str) -> Result:
+        """Run `_parse_one` with a span for the call and for each stage."""
+        with start_as_current_span("postcode.parse", attributes={"postcode.handler": type(self._handler).__name__}) as span:
+            result = self._parse_one(postcode, traced=True)
+            span.set_attribute("postcode.valid", result.valid)
+            if result.valid:
+                span.set_attribute("postcode.format", result.value.format.value)
+            else:
+                span.set_attribute("error.code", result.error.code)
+            return result
+
+    def _lookup(self, postcode: str, timed: bool = True) -> Union[Postcode, Error]:
         """
-        Validate and parse a list of postcodes.
-
-        Args:
-            postcodes (list[str]): A list of postcode strings.
+        Look a normalized postcode up through the cache and the handler.
 
-        Returns:
-            list[Result]: A list of results, one for each postcode.
+        Definitive misses are returned as (cached) error values rather than raised,
+        so a cached error is never re-raised with a growing traceback. Any other
+        handler error propagates to the caller. `timed` is passed on to the handler,
+        so `parse_one`, which records its own timing, does not time the lookup twice.
         """
-        return [self.parse_one(p) for p in postcodes]
+        if self._cache is None:
+            return self._handler.handle(postcode, timed)
+
+        cached = self._cache.get(postcode)
+        if cached is not None:
+            _CACHE_HITS.inc()
+            return cached
+
+        _CACHE_MISSES.inc()
+        try:
+            value = self._handler.handle(postcode, timed)
+        except ResultCache.NEGATIVE_ERRORS as e:
+            error = e.with_traceback(None)
+            self._cache.put(postcode, error)
+            return error
+
+        self._cache.put(postcode, value)
+        return value
 
     # ------------------------------------------------------------------
     # Validation Methods
@@ -100,34 +468,115 @@ class Service:
         """
         return self.parse_one(postcode).valid
 
-    def validate_many(self, postcodes: list[str]) -> list[bool]:
+    def validate_many(self, postcodes: list[str], max_workers: Optional[int] = None) -> list[bool]:
         """
         Validate multiple postcodes.
 
         Args:
             postcodes (list[str]): A list of postcode strings.
+            max_workers (Optional[int]): Maximum number of lookups in flight at once.
+                Defaults to the handler's `max_workers` setting. Values below 1 raise `ValueError`.
 
         Returns:
             list[bool]: List of booleans representing the validity of each postcode.
         """
-        return [self.validate_one(p) for p in postcodes]
+        start = time.perf_counter()
+        outcomes = self._parse_outcomes(postcodes, max_workers)
+        self._record_batch("validate_many", start, (outcomes[p] for p in postcodes if isinstance(p, str)))
+        return [isinstance(p, str) and not isinstance(outcomes[p], Error) for p in postcodes]
+
+    # ------------------------------------------------------------------
+    # Directory Methods
+    # ------------------------------------------------------------------
+
+    def count_postcodes(self, prefix: str = "") -> int:
+        """
+        Count the postcodes under an area, district, sector or unit.
+
+        Args:
+            prefix (str): An area (`SW`), district (`SW1A`), sector (`SW1A 1`) or unit.
+                An empty prefix counts every postcode in the directory.
+
+        Returns:
+            int: The number of postcodes in the local directory under the prefix.
+        """
+        return self._hierarchy().count(prefix)
+
+    def children(self, prefix: str = "") -> dict[str, int]:
+        """
+        List the entries one level below a prefix with their postcode counts.
+
+        Args:
+            prefix (str): An empty prefix lists areas, an area lists its districts, a district
+                its sectors (e.g. `SW1A 1`) and a sector its units.
+
+        Returns:
+            dict[str, int]: Child names mapped to the number of postcodes under each, in sorted order.
+        """
+        return self._hierarchy().children(prefix)
+
+    def enumerate_postcodes(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily list the postcodes under an area, district, sector or unit.
+
+        Args:
+            prefix (str): An area, district, sector or unit.
+
+        Returns:
+            Iterator[str]: The postcodes in `OUTCODE INCODE` form, in sorted order.
+        """
+        return self._hierarchy().postcodes(prefix)
+
+    def suggest(self, postcode: str, k: int = 5) -> list[Suggestion]:
+        """
+        Suggest known postcodes close to a mistyped one.
+
+        Candidates are ranked by a weighted edit distance in which look-alike characters
+        (O/0, I/1, S/5, Z/2, B/8) and transposed neighbours cost less than other edits.
+
+        Args:
+            postcode (str): The postcode that was not found.
+            k (int): The maximum number of suggestions to return.
+
+        Returns:
+            list[Suggestion]: Up to `k` postcodes from the local directory, closest first.
+        """
+        return self._dataset().suggester.suggest(postcode, k)
+
+    def _hierarchy(self) -> PostcodeHierarchy:
+        """Return the hierarchy of the first local dataset handler reachable from the service's handler."""
+        return self._dataset().hierarchy
+
+    def _dataset(self) -> LocalDatasetHandler:
+        """Return the first local dataset handler reachable from the service's handler."""
+        pending = [self._handler]
+        while pending:
+            handler = pending.pop(0)
+            if isinstance(handler, LocalDatasetHandler):
+                return handler
+            if isinstance(handler, BaseWrapperHandler):
+                pending.append(handler.inner)
+            elif isinstance(handler, ChainHandler):
+                pending.extend(handler.tiers)
+        log_and_raise(InternalError("Directory queries require a local dataset handler."))
 
     # ------------------------------------------------------------------
     # Factory Methods
     # ------------------------------------------------------------------
 
     @classmethod
-    def create(cls, settings: BaseHandlerSettings) -> "Service":
+    def create(cls, settings: BaseHandlerSettings, cache: Optional[CacheSettings] = None) -> "Service":
         """
         Create a Service instance using the provided handler settings.
 
         Args:
             settings (BaseHandlerSettings): Configuration for the handler.
+            cache (Optional[CacheSettings]): Enables the in-process result cache when given.
 
         Returns:
             Service: A fully constructed service instance.
         """
-        return cls(HandlerFactory.create(settings))
+        return cls(HandlerFactory.create(settings), ResultCache(cache) if cache else None)
 
     @classmethod
     def using_regex(cls) -> "Service":
@@ -142,28 +591,38 @@ class Service:
         return cls.create(RegexHandlerSettings())
 
     @classmethod
-    def using_postcode_io(cls, timeout: float = 5) -> "Service":
+    def using_postcode_io(cls, timeout: float = 5, max_workers: int = 8, cache: Optional[CacheSettings] = None) -> "Service":
         """
         Create a Service using the Postcode.io API handler.
 
         Args:
             timeout (float): Timeout for HTTP requests in seconds.
+            max_workers (int): Maximum number of concurrent requests for bulk parsing.
+            cache (Optional[CacheSettings]): Enables the in-process result cache when given.
 
         Returns:
             Service: Postcode.io-backed postcode service.
         """
-        return cls.create(PostcodeIOHandlerSettings(timeout=timeout))
+        return cls.create(PostcodeIOHandlerSettings(timeout=timeout, max_workers=max_workers), cache)
 
     @classmethod
-    def using_osdatahub(cls, api_key: str, timeout: float = 5) -> "Service":
+    def using_osdatahub(
+        cls,
+        api_key: str,
+        timeout: float = 5,
+        max_workers: int = 8,
+        cache: Optional[CacheSettings] = None,
+    ) -> "Service":
         """
         Create a Service using the OS Data Hub API handler.
 
         Args:
             api_key (str): API key for OS Data Hub.
             timeout (float): Timeout for HTTP requests in seconds.
+            max_workers (int): Maximum number of concurrent requests for bulk parsing.
+            cache (Optional[CacheSettings]): Enables the in-process result cache when given.
 
         Returns:
             Service: OS Data Hub-backed postcode service.
         """
-        return cls.create(OSDataHubHandlerSettings(api_key=api_key, timeout=timeout))
+        return cls.create(OSDataHubHandlerSettings(api_key=api_key, timeout=timeout, max_workers=max_workers), cache)
@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Optional, Protocol
+
+from .error import Error
+
+Attributes = dict[str, Any]
+
+
+class Span(Protocol):
+    """The part of an OpenTelemetry `Span` the package uses."""
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+
+class Tracer(Protocol):
+    """
+    The part of an OpenTelemetry `Tracer` the package uses.
+
+    An `opentelemetry.trace.Tracer` satisfies it as is, so the package can report to
+    any OpenTelemetry pipeline: `set_tracer(trace.get_tracer("postcode"))`.
+    """
+
+    def start_as_current_span(self, name: str, attributes: Optional[Attributes] = None) -> ContextManager[Span]: ...
+
+
+class NoOpSpan:
+    """A span that records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> "NoOpSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class NoOpTracer:
+    """A tracer whose spans record nothing."""
+
+    _SPAN = NoOpSpan()
+
+    def start_as_current_span(self, name: str, attributes: Optional[Attributes] = None) -> NoOpSpan:
+        return self._SPAN
+
+
+_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """
+    Install the tracer that `Service` and the handlers report their stages to.
+
+    Pass None to disable tracing again. While no tracer is installed, instrumented code
+    checks one module global per call and opens no spans at all. Only single lookups
+    (`Service.parse_one` and the handler calls it makes) are traced; the bulk calls
+    open no spans.
+    """
+    global _tracer
+    _tracer = None if isinstance(tracer, NoOpTracer) else tracer
+
+
+def get_tracer() -> Tracer:
+    """Return the installed tracer, or a no-op tracer if tracing is disabled."""
+    return _tracer or NoOpTracer()
+
+
+def current_tracer() -> Optional[Tracer]:
+    """Return the installed tracer, or None if tracing is disabled; hot paths branch on this."""
+    return _tracer
+
+
+@contextmanager
+def start_as_current_span(name: str, attributes: Optional[Attributes] = None) -> Iterator[Span]:
+    """
+    Open a span on the installed tracer, tagging it with `error.code` if an `Error` escapes it.
+
+    Opens a no-op span if tracing is disabled.
+    """
+    with get_tracer().start_as_current_span(name, attributes=attributes) as span:
+        try:
+            yield span
+        except Error as e:
+            span.set_attribute("error.code", e.code)
+            raise
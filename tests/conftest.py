@@ -0,0 +1,71 @@
+import pytest
+from src.postcode.handlers.base import BaseHandler, BaseHandlerSettings
+from src.postcode.handlers.errors import HandlerTimeoutError
+from src.postcode.handlers.factory import HandlerFactory
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.postcode.model import Postcode
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test sets `now`."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    """Stand-in for a `requests` or `httpx` response, answering a single Postcodes.io lookup by default."""
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = {"status": 200, "result": {"postcode": "L1 8JQ"}} if payload is None else payload
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+class CountingHandler(BaseHandler):
+    """Regex-backed handler that counts calls and times out for one postcode."""
+
+    calls = 0
+
+    def __init__(self, settings: BaseHandlerSettings = None):
+        self._settings = settings or BaseHandlerSettings(type="counting")
+
+    def _handle(self, postcode: str) -> Postcode:
+        CountingHandler.calls += 1
+        if postcode == "M1 1AE":
+            raise HandlerTimeoutError("CountingHandler", 1)
+        return RegexHandler.default().handle(postcode)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def counting_handler(monkeypatch):
+    """Register `CountingHandler` as the "counting" handler type and reset its call count."""
+    monkeypatch.setitem(HandlerFactory.HANDLERS, "counting", CountingHandler)
+    CountingHandler.calls = 0
+    return CountingHandler
+
+
+@pytest.fixture
+def postcode_io_handler():
+    """Return a factory for Postcodes.io handlers built from settings keywords, closing them after the test."""
+    handlers = []
+
+    def create(**settings) -> PostcodeIOHttpHandler:
+        handlers.append(PostcodeIOHttpHandler(PostcodeIOHandlerSettings(**settings)))
+        return handlers[-1]
+
+    yield create
+    for handler in handlers:
+        handler.close()
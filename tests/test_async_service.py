@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from src.postcode.async_service import AsyncService
+from src.postcode.handlers.base import BaseHandler, BaseHandlerSettings
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.handlers.errors import HandlerAPIError, HandlerConnectionError, HandlerNoResultsError
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from src.postcode.postcode.model import Postcode
+
+
+class SleepingHandler(BaseHandler):
+    """Handler whose async path awaits instead of blocking, tracking concurrency."""
+
+    def __init__(self):
+        self._settings = BaseHandlerSettings(type="sleeping")
+        self.in_flight = 0
+        self.peak = 0
+
+    def _handle(self, postcode: str) -> Postcode:
+        return RegexHandler.default().handle(postcode)
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self._handle(postcode)
+        finally:
+            self.in_flight -= 1
+
+
+def test_async_parse_one_with_regex():
+    result = asyncio.run(AsyncService.using_regex().parse_one(" sw1w 0ny "))
+    assert result.valid
+    assert result.value.full == "SW1W 0NY"
+
+
+def test_async_validate_many_keeps_order():
+    validities = asyncio.run(AsyncService.using_regex().validate_many(["INVALID", "L1 8JQ", "M1 1AE", ""]))
+    assert validities == [False, True, True, False]
+
+
+def test_async_parse_many_bounds_concurrency():
+    handler = SleepingHandler()
+    results = asyncio.run(AsyncService(handler).parse_many([f"L{i} 8JQ" for i in range(1, 51)], max_concurrency=10))
+    assert all(r.valid for r in results)
+    assert 1 < handler.peak <= 10
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_async_parse_many_rejects_max_concurrency_below_one(max_concurrency):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(AsyncService.using_regex().parse_many(["L1 8JQ"], max_concurrency=max_concurrency))
+
+
+def test_async_postcode_io_handler_uses_non_blocking_client():
+    httpx = pytest.importorskip("httpx")
+
+    def respond(request):
+        postcode = request.url.path.rsplit("/", 1)[-1]
+        if postcode == "L1 8JQ":
+            return httpx.Response(200, json={"status": 200, "result": {"postcode": "L1 8JQ"}})
+        if postcode == "M1 1AE":
+            return httpx.Response(200, json={"status": 200, "result": None})
+        if postcode == "W1A 0AX":
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(500)
+
+    async def run():
+        handler = PostcodeIOHttpHandler(PostcodeIOHandlerSettings())
+        handler._async_client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        async with AsyncService(handler) as service:
+            return await service.parse_many(["L1 8JQ", "M1 1AE", "W1A 0AX", "B33 8TH"])
+
+    results = asyncio.run(run())
+    assert results[0].value.full == "L1 8JQ"
+    assert isinstance(results[1].error, HandlerNoResultsError)
+    assert isinstance(results[2].error, HandlerConnectionError)
+    assert isinstance(results[3].error, HandlerAPIError)
+
+
+def test_async_http_handler_coalesces_duplicate_lookups():
+    httpx = pytest.importorskip("httpx")
+    requests_seen = []
+
+    async def respond(request):
+        requests_seen.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"status": 200, "result": {"postcode": "L1 8JQ"}})
+
+    async def run():
+        handler = PostcodeIOHttpHandler(PostcodeIOHandlerSettings())
+        handler._async_client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        async with AsyncService(handler) as service:
+            return await asyncio.gather(*(service.parse_one("l1 8jq") for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert all(r.value.full == "L1 8JQ" for r in results)
+    assert len(requests_seen) == 1
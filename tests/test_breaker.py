@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+import requests
+from src.postcode.service import Service
+from src.postcode.handlers.base import BaseHandler, BaseHandlerSettings
+from src.postcode.handlers.breaker import CircuitBreakerHandler, CircuitBreakerHandlerSettings, CircuitState
+from src.postcode.handlers.factory import HandlerFactory
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.handlers.errors import HandlerAPIError, HandlerCircuitOpenError, HandlerConnectionError, HandlerNoResultsError
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings
+from src.postcode.postcode.errors import PostcodeNotFoundError
+from src.postcode.postcode.model import Postcode
+
+from .conftest import FakeResponse
+
+
+class FlakyHandler(BaseHandler):
+    """Regex-backed handler that fails with connection errors while `down` is set."""
+
+    down = False
+    delay = 0.0
+    calls = 0
+
+    def __init__(self, settings: BaseHandlerSettings):
+        self._settings = settings
+
+    def _handle(self, postcode: str) -> Postcode:
+        FlakyHandler.calls += 1
+        if FlakyHandler.down:
+            raise HandlerConnectionError("FlakyHandler")
+        return RegexHandler.default().handle(postcode)
+
+    async def _ahandle(self, postcode: str) -> Postcode:
+        await asyncio.sleep(FlakyHandler.delay)
+        return self._handle(postcode)
+
+
+@pytest.fixture(autouse=True)
+def flaky_handler_type(monkeypatch):
+    monkeypatch.setitem(HandlerFactory.HANDLERS, "flaky", FlakyHandler)
+    FlakyHandler.down = False
+    FlakyHandler.delay = 0.0
+    FlakyHandler.calls = 0
+
+
+@pytest.fixture
+def breaker_handler(clock):
+    """Return a factory for circuit breakers around `FlakyHandler` that open after four failed calls."""
+
+    def create(**settings) -> CircuitBreakerHandler:
+        settings = CircuitBreakerHandlerSettings(
+            handler=BaseHandlerSettings(type="flaky"),
+            window_size=4,
+            minimum_calls=4,
+            open_duration=10,
+            **settings,
+        )
+        return CircuitBreakerHandler(settings, clock=clock)
+
+    return create
+
+
+def test_breaker_opens_and_fails_fast(clock, breaker_handler):
+    handler = breaker_handler()
+    service = Service(handler)
+    FlakyHandler.down = True
+
+    for _ in range(4):
+        assert isinstance(service.parse_one("L1 8JQ").error, HandlerConnectionError)
+    assert handler.breaker.state is CircuitState.OPEN
+
+    result = service.parse_one("L1 8JQ")
+    assert isinstance(result.error, HandlerCircuitOpenError)
+    assert FlakyHandler.calls == 4
+    assert handler.breaker.snapshot().rejected == 1
+
+
+def test_breaker_half_open_probe_closes_on_success(clock, breaker_handler):
+    handler = breaker_handler()
+    FlakyHandler.down = True
+    for _ in range(4):
+        Service(handler).parse_one("L1 8JQ")
+
+    clock.now = 11
+    assert handler.breaker.state is CircuitState.HALF_OPEN
+    FlakyHandler.down = False
+    assert Service(handler).parse_one("L1 8JQ").valid
+    assert handler.breaker.state is CircuitState.CLOSED
+
+
+def test_breaker_half_open_probe_reopens_on_failure(clock, breaker_handler):
+    handler = breaker_handler()
+    FlakyHandler.down = True
+    for _ in range(4):
+        Service(handler).parse_one("L1 8JQ")
+
+    clock.now = 11
+    Service(handler).parse_one("L1 8JQ")
+    snapshot = handler.breaker.snapshot()
+    assert snapshot.state is CircuitState.OPEN
+    assert snapshot.opened == 2
+
+
+def test_cancelled_probe_does_not_close_the_breaker(clock, breaker_handler):
+    handler = breaker_handler()
+    FlakyHandler.down = True
+    for _ in range(4):
+        Service(handler).parse_one("L1 8JQ")
+    clock.now = 11
+    FlakyHandler.down = False
+    FlakyHandler.delay = 1.0
+
+    async def cancel_probe():
+        probe = asyncio.create_task(handler.ahandle("L1 8JQ"))
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+    assert handler.breaker.state is CircuitState.HALF_OPEN
+
+    FlakyHandler.delay = 0.0
+    assert asyncio.run(handler.ahandle("L1 8JQ")).full == "L1 8JQ"
+    assert handler.breaker.state is CircuitState.CLOSED
+
+
+def test_not_found_counts_as_healthy(clock, breaker_handler):
+    handler = breaker_handler()
+    for _ in range(8):
+        assert isinstance(Service(handler).parse_one("ZZZZZZ").error, PostcodeNotFoundError)
+    assert handler.breaker.state is CircuitState.CLOSED
+
+
+def test_breaker_falls_back_to_regex(clock, breaker_handler):
+    handler = breaker_handler(fallback_to_regex=True)
+    service = Service(handler)
+    FlakyHandler.down = True
+
+    results = [service.parse_one("L1 8JQ") for _ in range(6)]
+    assert all(r.valid for r in results)
+    assert FlakyHandler.calls == 4
+    assert isinstance(service.parse_one("ZZZZZZ").error, PostcodeNotFoundError)
+
+
+def _postcode_io_breaker(clock, monkeypatch, status_code):
+    error = "Postcode not found" if status_code == 404 else "Service unavailable"
+    response = FakeResponse(status_code, {"status": status_code, "error": error})
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: response)
+    settings = CircuitBreakerHandlerSettings(handler=PostcodeIOHandlerSettings(), window_size=4, minimum_calls=4, open_duration=10)
+    return CircuitBreakerHandler(settings, clock=clock)
+
+
+def test_postcode_io_404_counts_as_healthy(clock, monkeypatch):
+    handler = _postcode_io_breaker(clock, monkeypatch, 404)
+    service = Service(handler)
+    for postcode in ["L1 8JQ", "M1 1AE", "W1A 0AX", "B33 8TH", "SW1A 1AA"]:
+        assert isinstance(service.parse_one(postcode).error, HandlerNoResultsError)
+
+    snapshot = handler.breaker.snapshot()
+    assert snapshot.state is CircuitState.CLOSED
+    assert snapshot.failure_rate == 0
+
+
+def test_postcode_io_5xx_opens_the_breaker(clock, monkeypatch):
+    handler = _postcode_io_breaker(clock, monkeypatch, 503)
+    service = Service(handler)
+    for postcode in ["L1 8JQ", "M1 1AE", "W1A 0AX", "B33 8TH"]:
+        assert isinstance(service.parse_one(postcode).error, HandlerAPIError)
+
+    assert handler.breaker.state is CircuitState.OPEN
+    assert isinstance(service.parse_one("SW1A 1AA").error, HandlerCircuitOpenError)
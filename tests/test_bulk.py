@@ -0,0 +1,116 @@
+import pytest
+import requests
+from src.postcode.service import Service
+from src.postcode.cache import CacheSettings, ResultCache
+from src.postcode.handlers.base import BaseHandlerSettings
+from src.postcode.handlers.errors import HandlerNoResultsError, HandlerTimeoutError
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings
+from src.postcode.handlers.sqlite_cache import SqliteCacheHandlerSettings
+
+from .conftest import FakeResponse
+
+
+class MalformedResponse(FakeResponse):
+    def json(self):
+        raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+
+class FakeBulkApi:
+    """Stand-in for the Postcodes.io bulk endpoint."""
+
+    KNOWN = {"SW1W 0NY", "L1 8JQ", "PO16 7GZ", "M1 1AE"}
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, method, url, timeout=None, json=None, **kwargs):
+        if method != "POST":
+            raise AssertionError("single lookups must not be used for batches")
+        queries = json["postcodes"]
+        self.calls.append(queries)
+        if "EC1A 1BB" in queries:
+            raise requests.Timeout()
+        if "W1A 0AX" in queries:
+            return MalformedResponse(200)
+        return FakeResponse(
+            200,
+            {
+                "status": 200,
+                "result": [{"query": q, "result": {"postcode": q} if q in self.KNOWN else None} for q in queries],
+            },
+        )
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeBulkApi()
+    monkeypatch.setattr(requests.Session, "request", lambda session, *args, **kwargs: fake(*args, **kwargs))
+    return fake
+
+
+def test_parse_many_uses_bulk_endpoint_in_chunks(api, postcode_io_handler):
+    postcodes = ["sw1w 0ny", "L1 8JQ", "ZZ1 1ZZ", "INVALID!", "PO16 7GZ", "L1 8JQ"]
+    results = Service(postcode_io_handler(bulk_size=2, max_workers=1)).parse_many(postcodes)
+
+    assert api.calls == [["SW1W 0NY", "L1 8JQ"], ["ZZ1 1ZZ", "PO16 7GZ"]]
+    assert [r.valid for r in results] == [True, True, False, False, True, True]
+    assert results[0].value.full == "SW1W 0NY"
+    assert isinstance(results[2].error, HandlerNoResultsError)
+    assert results[3].error.code == "POSTCODE_FORMAT_ERROR"
+
+
+def test_bulk_chunk_failure_only_affects_its_chunk(api, postcode_io_handler):
+    results = Service(postcode_io_handler(bulk_size=2)).parse_many(["L1 8JQ", "EC1A 1BB", "M1 1AE"])
+
+    assert isinstance(results[0].error, HandlerTimeoutError)
+    assert isinstance(results[1].error, HandlerTimeoutError)
+    assert results[2].valid
+
+
+def test_bulk_malformed_chunk_only_affects_its_chunk(api, postcode_io_handler):
+    outcomes = postcode_io_handler(bulk_size=2).handle_many(["L1 8JQ", "W1A 0AX", "M1 1AE"])
+
+    assert [outcome.code for outcome in outcomes[:2]] == ["INTERNAL_ERROR", "INTERNAL_ERROR"]
+    assert "Expecting value" in outcomes[0].message
+    assert outcomes[2].full == "M1 1AE"
+
+
+def test_bulk_lookups_go_through_result_cache(api, postcode_io_handler):
+    service = Service(postcode_io_handler(), ResultCache(CacheSettings()))
+
+    service.parse_many(["L1 8JQ", "ZZ1 1ZZ"])
+    results = service.parse_many(["L1 8JQ", "ZZ1 1ZZ", "M1 1AE"])
+
+    assert api.calls[1] == ["M1 1AE"]
+    assert [r.valid for r in results] == [True, False, True]
+    assert service.cache.stats().hits == 2
+
+
+def test_bulk_lookups_through_sqlite_cache(api, tmp_path):
+    settings = SqliteCacheHandlerSettings(path=str(tmp_path / "cache.db"), handler=PostcodeIOHandlerSettings())
+    service = Service.create(settings)
+
+    first = service.parse_many(["L1 8JQ", "ZZ1 1ZZ"])
+    second = service.parse_many(["L1 8JQ", "ZZ1 1ZZ", "M1 1AE"])
+
+    assert api.calls == [["L1 8JQ", "ZZ1 1ZZ"], ["M1 1AE"]]
+    assert [r.valid for r in first] == [True, False]
+    assert [r.valid for r in second] == [True, False, True]
+
+
+def test_handle_many_default_falls_back_to_single_lookups():
+    from src.postcode.handlers.regex import RegexHandler
+
+    outcomes = RegexHandler.default().handle_many(["L1 8JQ", "ZZZZZZ"])
+    assert outcomes[0].full == "L1 8JQ"
+    assert outcomes[1].code == "POSTCODE_NOT_FOUND_ERROR"
+    assert BaseHandlerSettings(type="x").max_workers == 1
+
+
+def test_structurally_impossible_postcodes_are_not_sent(api):
+    with Service.using_postcode_io() as service:
+        results = service.parse_many(["SW1W 0NY", "12345", "L1 8JQ"])
+
+    assert api.calls == [["SW1W 0NY", "L1 8JQ"]]
+    assert [r.valid for r in results] == [True, False, True]
+    assert results[1].error.code == "POSTCODE_NOT_FOUND_ERROR"
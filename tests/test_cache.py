@@ -0,0 +1,101 @@
+import pytest
+import requests
+from src.postcode.cache import CacheSettings, ResultCache
+from src.postcode.service import Service
+from src.postcode.handlers.errors import HandlerNoResultsError, HandlerTimeoutError
+from src.postcode.postcode.errors import PostcodeNotFoundError
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture
+def handler(counting_handler):
+    return counting_handler()
+
+
+def _service(handler, clock, **settings):
+    return Service(handler, ResultCache(CacheSettings(**settings), clock=clock))
+
+
+def test_cache_hits_on_normalized_postcode(handler, clock):
+    service = _service(handler, clock)
+
+    assert service.parse_one("sw1w 0ny").valid
+    assert service.parse_one(" SW1W 0NY ").value.full == "SW1W 0NY"
+    assert handler.calls == 1
+
+    stats = service.cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_ratio == 0.5
+
+
+def test_cache_negative_entries_use_their_own_ttl(handler, clock):
+    service = _service(handler, clock, ttl=100, negative_ttl=10)
+
+    service.parse_one("ZZZZZZ")
+    service.parse_one("ZZZZZZ")
+    assert handler.calls == 1
+    assert isinstance(service.parse_one("ZZZZZZ").error, PostcodeNotFoundError)
+
+    clock.now = 11
+    service.parse_one("ZZZZZZ")
+    assert handler.calls == 2
+    assert service.cache.stats().expirations == 1
+
+
+def test_cache_negative_caches_postcode_io_misses(clock, monkeypatch, postcode_io_handler):
+    response = FakeResponse(404, {"status": 404, "error": "Postcode not found"})
+    calls = []
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: calls.append(a) or response)
+    service = _service(postcode_io_handler(), clock, ttl=100, negative_ttl=10)
+
+    for _ in range(3):
+        assert isinstance(service.parse_one("SW1A 1ZZ").error, HandlerNoResultsError)
+    assert len(calls) == 1
+    assert service.cache.stats().size == 1
+
+    clock.now = 11
+    service.parse_one("SW1A 1ZZ")
+    assert len(calls) == 2
+
+
+def test_cache_skips_transient_errors(handler, clock):
+    service = _service(handler, clock)
+
+    service.parse_one("M1 1AE")
+    result = service.parse_one("M1 1AE")
+    assert isinstance(result.error, HandlerTimeoutError)
+    assert handler.calls == 2
+    assert len(service.cache) == 0
+
+
+def test_cache_negative_caching_can_be_disabled(handler, clock):
+    service = _service(handler, clock, negative_ttl=0)
+
+    service.parse_one("ZZZZZZ")
+    service.parse_one("ZZZZZZ")
+    assert handler.calls == 2
+
+
+def test_cache_evicts_least_recently_used(handler, clock):
+    service = _service(handler, clock, max_size=2)
+
+    service.parse_one("L1 8JQ")
+    service.parse_one("SW1W 0NY")
+    service.parse_one("L1 8JQ")
+    service.parse_one("PO16 7GZ")
+
+    assert service.cache.stats().evictions == 1
+    calls = handler.calls
+    service.parse_one("L1 8JQ")
+    assert handler.calls == calls
+    service.parse_one("SW1W 0NY")
+    assert handler.calls == calls + 1
+
+
+def test_cache_is_used_by_parse_columns(handler, clock):
+    service = _service(handler, clock)
+
+    columns = service.parse_columns(["L1 8JQ", "L1 8JQ", "ZZZZZZ", "ZZZZZZ"])
+    assert columns.valid == [True, True, False, False]
+    assert handler.calls == 2
@@ -0,0 +1,165 @@
+import asyncio
+import pytest
+from src.postcode.service import Service
+from src.postcode.handlers.base import BaseHandler, BaseHandlerSettings
+from src.postcode.handlers.chain import ChainHandler, ChainHandlerSettings, ChainTierSettings
+from src.postcode.handlers.factory import HandlerFactory
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings
+from src.postcode.handlers.regex import RegexHandler, RegexHandlerSettings
+from src.postcode.handlers.errors import HandlerConnectionError
+from src.postcode.postcode.errors import PostcodeNotFoundError
+from src.postcode.postcode.model import Postcode
+
+
+class LocalHandler(BaseHandler):
+    """Handler that only knows a few postcodes."""
+
+    KNOWN = {"SW1W 0NY", "L1 8JQ"}
+
+    def __init__(self, settings: BaseHandlerSettings):
+        self._settings = settings
+
+    def _handle(self, postcode: str) -> Postcode:
+        if postcode not in self.KNOWN:
+            raise PostcodeNotFoundError(postcode)
+        return RegexHandler.default().handle(postcode)
+
+
+class RemoteHandler(BaseHandler):
+    """Handler that knows every well-formed postcode, unless it is down."""
+
+    down = False
+    calls: list[str] = []
+
+    def __init__(self, settings: BaseHandlerSettings):
+        self._settings = settings
+
+    def _handle(self, postcode: str) -> Postcode:
+        RemoteHandler.calls.append(postcode)
+        if RemoteHandler.down:
+            raise HandlerConnectionError("RemoteHandler")
+        if postcode == "ZZ9 9ZZ":
+            raise PostcodeNotFoundError(postcode)
+        return RegexHandler.default().handle(postcode)
+
+
+@pytest.fixture(autouse=True)
+def handler_types(monkeypatch):
+    monkeypatch.setitem(HandlerFactory.HANDLERS, "local", LocalHandler)
+    monkeypatch.setitem(HandlerFactory.HANDLERS, "remote", RemoteHandler)
+    RemoteHandler.down = False
+    RemoteHandler.calls = []
+
+
+def _chain(*tiers):
+    return ChainHandler(ChainHandlerSettings(tiers=list(tiers)))
+
+
+def _local(authoritative=False):
+    return ChainTierSettings(handler=BaseHandlerSettings(type="local"), name="local", authoritative=authoritative)
+
+
+def _remote(name="remote"):
+    return ChainTierSettings(handler=BaseHandlerSettings(type="remote"), name=name)
+
+
+def test_cheap_tier_serves_known_postcodes():
+    handler = _chain(_local(), _remote())
+
+    assert handler.resolve("SW1W 0NY")[1] == "local"
+    assert handler.resolve("PO16 7GZ")[1] == "remote"
+    assert RemoteHandler.calls == ["PO16 7GZ"]
+
+    stats = {s.name: s for s in handler.stats()}
+    assert (stats["local"].served, stats["local"].missed) == (1, 1)
+    assert stats["remote"].served == 1
+
+
+def test_authoritative_not_found_stops_the_chain():
+    handler = _chain(_local(authoritative=True), _remote())
+
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("PO16 7GZ")
+    assert RemoteHandler.calls == []
+    assert handler.stats()[0].invalid == 1
+
+
+def test_unavailable_tier_falls_through_to_the_next():
+    RemoteHandler.down = True
+    handler = _chain(_remote("primary"), ChainTierSettings(handler=RegexHandlerSettings(), name="regex"))
+
+    assert handler.resolve("PO16 7GZ")[1] == "regex"
+    assert handler.stats()[0].unavailable == 1
+
+
+def test_bulk_outage_logs_one_warning_per_tier(caplog):
+    RemoteHandler.down = True
+    handler = _chain(_remote("primary"), ChainTierSettings(handler=RegexHandlerSettings(), name="regex"))
+
+    with caplog.at_level("WARNING"):
+        outcomes = handler.handle_many(["PO16 7GZ", "L1 8JQ", "SW1W 0NY"])
+
+    assert all(isinstance(outcome, Postcode) for outcome in outcomes)
+    warnings = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Tier")]
+    assert len(warnings) == 1
+    assert warnings[0].startswith("Tier 'primary' is unavailable for 3 of 3 postcodes: [HANDLER_CONNECTION_ERROR]")
+
+
+def test_outage_is_not_reported_as_invalid():
+    RemoteHandler.down = True
+    handler = _chain(_local(), _remote())
+
+    with pytest.raises(HandlerConnectionError):
+        handler.handle("PO16 7GZ")
+
+
+def test_not_found_after_non_authoritative_miss():
+    handler = _chain(_local(), _remote())
+
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("ZZ9 9ZZ")
+    assert handler.stats()[1].invalid == 1
+
+
+def test_chain_is_created_by_the_factory_and_parses_in_bulk():
+    with Service.create(ChainHandlerSettings(tiers=[_local(), _remote()])) as service:
+        results = service.parse_many(["SW1W 0NY", "PO16 7GZ", "ZZ9 9ZZ", "L1 8JQ"])
+        stats = service.handler.stats()
+
+    assert [r.valid for r in results] == [True, True, False, True]
+    assert sorted(RemoteHandler.calls) == ["PO16 7GZ", "ZZ9 9ZZ"]
+    assert (stats[0].served, stats[1].served, stats[1].invalid) == (2, 1, 1)
+
+
+def test_bulk_outcomes_distinguish_outages():
+    RemoteHandler.down = True
+    handler = _chain(_local(), _remote())
+
+    outcomes = handler.handle_many(["L1 8JQ", "PO16 7GZ"])
+
+    assert isinstance(outcomes[0], Postcode)
+    assert isinstance(outcomes[1], HandlerConnectionError)
+
+
+def test_async_resolve():
+    handler = _chain(_local(), _remote())
+
+    value, tier = asyncio.run(handler.aresolve("PO16 7GZ"))
+
+    assert (value.full, tier) == ("PO16 7GZ", "remote")
+
+
+def test_chain_settings_load_from_json():
+    settings = ChainHandlerSettings(
+        tiers=[
+            ChainTierSettings(handler=RegexHandlerSettings(fast_path=True), name="offline"),
+            ChainTierSettings(handler=PostcodeIOHandlerSettings(rate_limit=5, bulk_size=50)),
+        ]
+    )
+    loaded = ChainHandlerSettings.model_validate_json(settings.model_dump_json())
+
+    assert loaded == settings
+    assert isinstance(loaded.tiers[1].handler, PostcodeIOHandlerSettings)
+    handler = HandlerFactory.create(loaded)
+    assert handler.tiers[1].bulk_size == 50
+    assert handler.resolve("SW1W 0NY")[1] == "offline"
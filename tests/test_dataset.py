@@ -0,0 +1,63 @@
+import os
+import pathlib
+import shutil
+import pytest
+from src.postcode.service import Service
+from src.postcode.error import InternalError
+from src.postcode.handlers.dataset import LocalDatasetHandler, LocalDatasetHandlerSettings
+from src.postcode.postcode.errors import PostcodeNotFoundError
+
+DIRECTORY = pathlib.Path(__file__).parent / "data" / "directory.csv"
+
+
+@pytest.fixture
+def directory(tmp_path):
+    path = tmp_path / "directory.csv"
+    shutil.copy(DIRECTORY, path)
+    return path
+
+
+def test_handler_answers_existence(directory):
+    handler = LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory)))
+
+    assert handler.handle("SW1W 0NY").full == "SW1W 0NY"
+    assert handler.handle("L18JQ").full == "L1 8JQ"
+    assert handler.handle_parts("DN55 1PT")[1:] == ("DN", "55", "1", "PT")
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("SW1W 0NZ")
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("AA1 1AA")
+    handler.close()
+
+
+def test_directory_is_reused_and_rebuilt_when_stale(directory):
+    LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory))).close()
+    index = directory.with_suffix(".pcdir")
+    built = index.stat().st_mtime_ns
+
+    LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory))).close()
+    assert index.stat().st_mtime_ns == built
+
+    with open(directory, "a") as f:
+        f.write("ZE1 0AA,ZE1 0AA,,60.15,-1.14\n")
+    os.utime(directory, ns=(built + 10**9, built + 10**9))
+
+    handler = LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory), column="pcd"))
+    assert len(handler.directory) == 12
+    assert handler.handle("ZE1 0AA").full == "ZE1 0AA"
+    handler.close()
+
+
+def test_missing_directory_without_rebuild_fails(directory):
+    with pytest.raises(InternalError):
+        LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory), rebuild=False))
+
+
+def test_missing_column_fails(directory):
+    with pytest.raises(InternalError):
+        LocalDatasetHandler(LocalDatasetHandlerSettings(path=str(directory), column="postcode"))
+
+
+def test_service_with_local_dataset(directory):
+    with Service.create(LocalDatasetHandlerSettings(path=str(directory))) as service:
+        assert service.validate_many(["sw1a 1aa", "SW1A 1AB", "B33 8TH"]) == [True, False, True]
@@ -0,0 +1,98 @@
+import json
+import pathlib
+import random
+import pytest
+from src.postcode.directory import (
+    DirectoryColumn,
+    PostcodeDirectory,
+    build_directory,
+    main,
+    pack_key,
+    unpack_key,
+)
+from src.postcode.error import InternalError
+
+DIRECTORY = pathlib.Path(__file__).parent / "data" / "directory.csv"
+ATTRIBUTES = [DirectoryColumn(name="lat", width=10), DirectoryColumn(name="long", width=10)]
+
+
+def test_keys_round_trip_and_preserve_order():
+    postcodes = ["A1 1AA", "B33 8TH", "L1 8JQ", "M1 1AE", "SW1A 1AA", "SW1W 0NY", "W1A 0AX", "ZE1 0AA"]
+    keys = [pack_key(p) for p in postcodes]
+
+    assert all(len(k) == 5 for k in keys)
+    assert keys == sorted(keys)
+    assert [unpack_key(k) for k in keys] == postcodes
+    assert pack_key("sw1w0ny") == pack_key(" SW1W 0NY ")
+    assert pack_key("BFPO 1234") is None
+    assert pack_key("AI-2640") is None
+
+
+def test_build_and_read(tmp_path):
+    target = tmp_path / "directory.pcdir"
+
+    header = build_directory(str(DIRECTORY), str(target), attributes=ATTRIBUTES)
+    directory = PostcodeDirectory(str(target))
+
+    assert header.count == len(directory) == 11
+    assert target.stat().st_size == 28 + 2 * 34 + 11 * (5 + 10 + 10)
+    assert [directory.postcode_at(i) for i in range(3)] == ["B33 8TH", "BS7 8NE", "CR2 6XH"]
+    assert "l1 8jq" in directory
+    assert "L1 8JR" not in directory
+    assert directory.attributes(directory.find("SW1W 0NY")) == {"lat": "51.49284", "long": "-0.147812"}
+    directory.close()
+
+
+def test_external_sort_matches_in_memory_sort(tmp_path):
+    rows = [f"{random.choice('ABCDEFGHJKLMNOPRSTUWYZ')}{random.randint(1, 99)} {random.randint(0, 9)}AB" for _ in range(500)]
+    source = tmp_path / "random.csv"
+    source.write_text("pcds,n\n" + "".join(f"{p},{i}\n" for i, p in enumerate(rows)))
+
+    build_directory(str(source), str(tmp_path / "memory.pcdir"), attributes=[DirectoryColumn(name="n", width=3)])
+    build_directory(str(source), str(tmp_path / "external.pcdir"), attributes=[DirectoryColumn(name="n", width=3)], chunk_size=37)
+
+    assert (tmp_path / "memory.pcdir").read_bytes() == (tmp_path / "external.pcdir").read_bytes()
+    directory = PostcodeDirectory(str(tmp_path / "external.pcdir"))
+    first = {}
+    for i, p in enumerate(rows):
+        first.setdefault(p, i)
+    assert len(directory) == len(first)
+    assert all(directory.attribute(directory.find(p), "n") == str(i) for p, i in first.items())
+    directory.close()
+
+
+def test_reader_rejects_corrupt_files(tmp_path):
+    target = tmp_path / "directory.pcdir"
+    build_directory(str(DIRECTORY), str(target))
+    data = bytearray(target.read_bytes())
+
+    data[-1] ^= 0xFF
+    target.write_bytes(data)
+    with pytest.raises(InternalError, match="checksum"):
+        PostcodeDirectory(str(target))
+    PostcodeDirectory(str(target), verify=False).close()
+
+    target.write_bytes(data[:-1])
+    with pytest.raises(InternalError, match="expected"):
+        PostcodeDirectory(str(target))
+
+    target.write_bytes(b"pcds\nSW1W 0NY\n" * 4)
+    with pytest.raises(InternalError, match="not a postcode directory"):
+        PostcodeDirectory(str(target))
+
+
+def test_values_wider_than_the_column_are_rejected(tmp_path):
+    with pytest.raises(InternalError):
+        build_directory(str(DIRECTORY), str(tmp_path / "directory.pcdir"), attributes=[DirectoryColumn(name="lat", width=4)])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_builds_and_inspects(tmp_path, capsys):
+    target = tmp_path / "directory.pcdir"
+
+    assert main(["build", str(DIRECTORY), str(target), "--attribute", "lat:10", "--chunk-size", "4"]) == 0
+    assert json.loads(capsys.readouterr().out)["count"] == 11
+
+    assert main(["info", str(target)]) == 0
+    info = json.loads(capsys.readouterr().out)
+    assert info["columns"] == [{"name": "lat", "width": 10}]
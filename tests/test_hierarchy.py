@@ -0,0 +1,100 @@
+import pytest
+from src.postcode.service import Service
+from src.postcode.error import InternalError
+from src.postcode.directory import HierarchyLevel, PostcodeDirectory, PostcodeHierarchy, build_directory
+from src.postcode.handlers.chain import ChainHandlerSettings, ChainTierSettings
+from src.postcode.handlers.dataset import LocalDatasetHandlerSettings
+from src.postcode.handlers.regex import RegexHandlerSettings
+from src.postcode.postcode.errors import PostcodeFormatError
+
+POSTCODES = [
+    "S1 1AA",
+    "S1 1AB",
+    "S10 2AA",
+    "SW1A 1AA",
+    "SW1A 1AB",
+    "SW1A 2AA",
+    "SW1W 0NY",
+    "SW11 1AA",
+    "W1A 0AX",
+]
+
+
+@pytest.fixture
+def directory_path(tmp_path):
+    source = tmp_path / "directory.csv"
+    source.write_text("pcds\n" + "\n".join(POSTCODES) + "\n")
+    target = tmp_path / "directory.pcdir"
+    build_directory(str(source), str(target))
+    return target
+
+
+@pytest.fixture
+def hierarchy(directory_path):
+    directory = PostcodeDirectory(str(directory_path))
+    yield PostcodeHierarchy(directory)
+    directory.close()
+
+
+@pytest.mark.parametrize(
+    "prefix, level",
+    [
+        ("", HierarchyLevel.ROOT),
+        ("sw", HierarchyLevel.AREA),
+        ("SW1A", HierarchyLevel.DISTRICT),
+        ("SW1A 1", HierarchyLevel.SECTOR),
+        ("SW1A1AA", HierarchyLevel.UNIT),
+        ("L18JQ", HierarchyLevel.UNIT),
+    ],
+)
+def test_level(prefix, level):
+    assert PostcodeHierarchy.level(prefix) == level
+
+
+def test_invalid_prefix():
+    with pytest.raises(PostcodeFormatError):
+        PostcodeHierarchy.level("SW1A 1A")
+
+
+def test_counts(hierarchy):
+    assert hierarchy.count() == 9
+    assert hierarchy.count("S") == 3
+    assert hierarchy.count("SW") == 5
+    assert hierarchy.count("SW1A") == 3
+    assert hierarchy.count("SW1A 1") == 2
+    assert hierarchy.count("SW1A 1AA") == 1
+    assert hierarchy.count("SW1A 1AZ") == 0
+    assert hierarchy.count("E") == 0
+
+
+def test_children(hierarchy):
+    assert hierarchy.children() == {"S": 3, "SW": 5, "W": 1}
+    assert hierarchy.children("S") == {"S1": 2, "S10": 1}
+    assert hierarchy.children("SW") == {"SW1A": 3, "SW1W": 1, "SW11": 1}
+    assert hierarchy.children("SW1A") == {"SW1A 1": 2, "SW1A 2": 1}
+    assert hierarchy.children("SW1A 1") == {"SW1A 1AA": 1, "SW1A 1AB": 1}
+    assert hierarchy.children("SW1A 1AA") == {"SW1A 1AA": 1}
+
+
+def test_enumerate(hierarchy):
+    assert list(hierarchy.postcodes("S1")) == ["S1 1AA", "S1 1AB"]
+    assert list(hierarchy.postcodes("SW1A")) == ["SW1A 1AA", "SW1A 1AB", "SW1A 2AA"]
+    assert list(hierarchy.postcodes()) == sorted(POSTCODES, key=lambda p: p.split(" ")[0].ljust(4) + p.split(" ")[1])
+
+
+def test_service_finds_dataset_inside_a_chain(directory_path):
+    settings = ChainHandlerSettings(
+        tiers=[
+            ChainTierSettings(handler=LocalDatasetHandlerSettings(path=str(directory_path)), authoritative=False),
+            ChainTierSettings(handler=RegexHandlerSettings()),
+        ]
+    )
+    with Service.create(settings) as service:
+        assert service.count_postcodes("SW1A") == 3
+        assert service.children("SW1A") == {"SW1A 1": 2, "SW1A 2": 1}
+        assert list(service.enumerate_postcodes("W1A 0")) == ["W1A 0AX"]
+
+
+def test_service_without_dataset_fails():
+    with pytest.raises(InternalError):
+        Service.using_regex().count_postcodes("SW")
@@ -0,0 +1,46 @@
+import requests
+from src.postcode.service import Service
+
+from .conftest import FakeResponse
+
+
+def test_handler_reuses_one_pooled_session(monkeypatch, postcode_io_handler):
+    sessions = []
+    timeouts = []
+
+    def request(session, method, url, timeout=None, **kwargs):
+        sessions.append(session)
+        timeouts.append(timeout)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    handler = postcode_io_handler(timeout=2, connect_timeout=0.5, pool_size=4)
+
+    with Service(handler) as service:
+        assert all(service.validate_one(postcode) for postcode in ["L1 8JQ", "SW1W 0NY", "PO16 7GZ"])
+        adapter = sessions[0].get_adapter("https://api.postcodes.io")
+
+    assert len(set(map(id, sessions))) == 1
+    assert timeouts == [(0.5, 2), (0.5, 2), (0.5, 2)]
+    assert adapter._pool_maxsize == 4
+    assert handler._session is None
+
+
+def test_keep_alive_can_be_disabled(postcode_io_handler):
+    handler = postcode_io_handler(keep_alive=False)
+    assert handler._get_session().headers["Connection"] == "close"
+    handler.close()
+
+
+def test_prefilter_rejects_impossible_postcodes_without_a_request(monkeypatch, postcode_io_handler):
+    calls = []
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: calls.append(a) or FakeResponse())
+
+    with Service(postcode_io_handler()) as service:
+        assert not service.validate_one("12345")
+        assert service.validate_one("L1 8JQ")
+    assert len(calls) == 1
+
+    with Service(postcode_io_handler(prefilter=False)) as service:
+        service.validate_one("12345")
+    assert len(calls) == 2
@@ -0,0 +1,153 @@
+import json
+import logging
+import queue
+import sys
+
+import pytest
+from src.postcode import error as error_module
+from src.postcode.error import InternalError, log_and_raise
+from src.postcode.handlers import base as base_module
+from src.postcode.handlers.chain import ChainHandler, ChainHandlerSettings, ChainTierSettings
+from src.postcode.handlers.regex import RegexHandlerSettings
+from src.postcode.logging import (
+    BoundedQueueHandler,
+    DropPolicy,
+    ErrorSummary,
+    JsonFormatter,
+    configure_logger,
+    logger,
+    shutdown_logger,
+)
+from src.postcode.postcode.errors import PostcodeLengthError, PostcodeNotFoundError
+from src.postcode.service import Service
+
+
+@pytest.fixture
+def summary(clock, monkeypatch):
+    summary = ErrorSummary(interval=60, clock=clock)
+    monkeypatch.setattr(error_module, "error_summary", summary)
+    return summary
+
+
+def _errors(caplog):
+    return [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+
+
+def test_repeated_codes_are_counted_then_summarized(summary, clock, caplog):
+    with caplog.at_level("DEBUG"):
+        for postcode in ["AAA", "BBB", "CCC"]:
+            summary.report(PostcodeNotFoundError(postcode))
+        summary.report(PostcodeLengthError("A", 4, 9))
+        clock.now = 61
+        summary.report(PostcodeNotFoundError("DDD"))
+
+    assert _errors(caplog) == [
+        "[POSTCODE_NOT_FOUND_ERROR] [AAA] Postcode 'AAA' not found.",
+        "[POSTCODE_LENGTH_ERROR] [A] Postcode 'A' must be between 4 and 9 characters long.",
+        "[POSTCODE_NOT_FOUND_ERROR] [DDD] Postcode 'DDD' not found.",
+    ]
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert warnings == ["Errors in the last 61s: POSTCODE_LENGTH_ERROR=1 (0 not logged), POSTCODE_NOT_FOUND_ERROR=3 (2 not logged)"]
+    assert summary.totals() == {"POSTCODE_NOT_FOUND_ERROR": 4, "POSTCODE_LENGTH_ERROR": 1}
+
+
+def test_flush_and_zero_interval(summary, caplog):
+    with caplog.at_level("DEBUG"):
+        summary.report(PostcodeNotFoundError("AAA"))
+        summary.report(PostcodeNotFoundError("BBB"))
+        summary.flush()
+        summary.flush()
+        summary.interval = 0
+        summary.report(PostcodeNotFoundError("CCC"))
+        summary.report(PostcodeNotFoundError("DDD"))
+
+    assert [r.getMessage() for r in caplog.records if r.levelname == "WARNING"] == [
+        "Errors in the last 0s: POSTCODE_NOT_FOUND_ERROR=2 (1 not logged)"
+    ]
+    assert len(_errors(caplog)) == 3
+
+
+def test_reraised_errors_are_reported_once(summary, caplog):
+    error = PostcodeNotFoundError("AAA")
+
+    def validate():
+        log_and_raise(error)
+
+    with caplog.at_level("DEBUG"):
+        for _ in range(2):
+            with pytest.raises(PostcodeNotFoundError):
+                validate()
+    assert summary.totals() == {"POSTCODE_NOT_FOUND_ERROR": 1}
+    assert caplog.records[0].funcName == "test_reraised_errors_are_reported_once"
+
+
+def test_nested_bulk_errors_are_reported_once(summary, monkeypatch):
+    monkeypatch.setattr(base_module, "error_summary", summary)
+    chain = ChainHandler(ChainHandlerSettings(tiers=[ChainTierSettings(handler=RegexHandlerSettings())]))
+
+    assert isinstance(chain.handle_many(["1234"])[0], PostcodeNotFoundError)
+    assert summary.totals() == {"POSTCODE_NOT_FOUND_ERROR": 1}
+
+
+def test_internal_error_is_not_logged_on_construction(summary, caplog):
+    with caplog.at_level("DEBUG"):
+        InternalError("boom")
+    assert caplog.records == []
+
+
+def test_invalid_postcodes_log_one_line_per_code(summary, caplog):
+    service = Service.using_regex()
+    with caplog.at_level("DEBUG"):
+        for postcode in ["INVALID", "NOPE 1", "XX1 1XXX"]:
+            assert not service.parse_one(postcode).valid
+    assert _errors(caplog) == ["[POSTCODE_NOT_FOUND_ERROR] [INVALID] Postcode 'INVALID' not found."]
+
+
+def _record(message):
+    return logging.LogRecord("postcode", logging.INFO, __file__, 1, message, None, None)
+
+
+@pytest.mark.parametrize(
+    "policy, kept, dropped",
+    [(DropPolicy.DROP_NEW, ["a", "b"], 1), (DropPolicy.DROP_OLDEST, ["b", "c"], 1)],
+)
+def test_full_queue_applies_drop_policy(policy, kept, dropped):
+    records = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(records, policy)
+    for message in "abc":
+        handler.handle(_record(message))
+
+    assert [records.get_nowait().getMessage() for _ in range(records.qsize())] == kept
+    assert handler.dropped == dropped
+
+
+def test_json_formatter_writes_one_object_per_line():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("postcode", logging.ERROR, "service.py", 7, "failed %s", ("SW1A",), sys.exc_info())
+
+    line = JsonFormatter().format(record)
+    entry = json.loads(line)
+    assert "\n" not in line
+    assert entry["level"] == "ERROR"
+    assert entry["message"] == "failed SW1A"
+    assert (entry["file"], entry["line"]) == ("service.py", 7)
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_queued_logging_is_flushed_on_shutdown(tmp_path):
+    log_file = tmp_path / "postcode.log"
+    configure_logger(level="INFO", to_console=False, to_file=str(log_file), queued=True, json_lines=True)
+    try:
+        assert isinstance(logger.handlers[0], BoundedQueueHandler)
+        for i in range(100):
+            logger.info("lookup %d", i)
+        shutdown_logger()
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == [f"lookup {i}" for i in range(100)]
+    finally:
+        shutdown_logger()
+        logger.handlers.clear()
+        logger.addHandler(logging.NullHandler())
+        logger.setLevel(logging.NOTSET)
@@ -0,0 +1,167 @@
+import asyncio
+import math
+
+import pytest
+import requests
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from src.postcode.async_service import AsyncService
+from src.postcode.cache import ResultCache
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.metrics import MetricsRegistry, registry
+from src.postcode.postcode.errors import PostcodeNotFoundError
+from src.postcode.service import Service
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def _counts(name):
+    """Return the count of every non-zero child of a metric in the shared registry."""
+    counts = {key: value["count"] if isinstance(value, dict) else value for key, value in registry.snapshot()[name].items()}
+    return {key: count for key, count in counts.items() if count}
+
+
+def test_counter_gauge_and_histogram():
+    metrics = MetricsRegistry()
+    lookups = metrics.counter("lookups_total", "Lookups.", ("handler",))
+    lookups.inc(handler="regex")
+    lookups.labels("regex").inc(2)
+    size = metrics.gauge("cache_size", "Entries.")
+    size.set(10)
+    size.dec(3)
+    latency = metrics.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["lookups_total"] == {("regex",): 3}
+    assert snapshot["cache_size"] == {(): 7}
+    assert snapshot["latency_seconds"][()] == {"buckets": {0.1: 2, 1.0: 3, math.inf: 4}, "sum": 3.65, "count": 4}
+
+    with pytest.raises(ValueError):
+        lookups.inc(-1, handler="regex")
+    with pytest.raises(ValueError):
+        lookups.labels("regex", "extra")
+    with pytest.raises(ValueError):
+        metrics.gauge("lookups_total", "Lookups.", ("handler",))
+    assert metrics.counter("lookups_total", "Lookups.", ("handler",)) is lookups
+
+
+def test_reset_keeps_children_valid():
+    metrics = MetricsRegistry()
+    child = metrics.counter("lookups_total", "Lookups.").labels()
+    child.inc()
+    metrics.reset()
+    child.inc()
+    assert metrics.snapshot() == {"lookups_total": {(): 1}}
+
+
+def test_prometheus_text_format(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.counter("errors_total", "Errors by code.", ("code",)).inc(code='SAY "HI"')
+    metrics.histogram("latency_seconds", "Latency.", buckets=(0.5,)).observe(0.25)
+
+    text = metrics.to_prometheus()
+    assert text == (
+        "# HELP errors_total Errors by code.\n"
+        "# TYPE errors_total counter\n"
+        'errors_total{code="SAY \\"HI\\""} 1\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{le="0.5"} 1\n'
+        'latency_seconds_bucket{le="+Inf"} 1\n'
+        "latency_seconds_sum 0.25\n"
+        "latency_seconds_count 1\n"
+    )
+
+    path = tmp_path / "metrics" / "postcode.prom"
+    metrics.write_prometheus(path)
+    assert path.read_text() == text
+
+
+def test_service_and_handler_are_instrumented():
+    service = Service.using_regex()
+    for postcode in ["SW1A 1AA", "SW1A 1AA", "AAA", "X"]:
+        service.parse_one(postcode)
+
+    assert _counts("postcode_parse_seconds") == {("ok",): 2, ("error",): 2}
+    assert _counts("postcode_errors_total") == {("POSTCODE_LENGTH_ERROR",): 2}
+    # parse_one already times the call, so the handler lookup inside it is not timed again.
+    assert _counts("postcode_handler_lookup_seconds") == {}
+
+    handler = RegexHandler.default()
+    handler.handle("SW1A 1AA")
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("SW1A 1AC")
+    assert _counts("postcode_handler_lookup_seconds") == {("RegexHandler", "ok"): 1, ("RegexHandler", "error"): 1}
+
+
+def test_http_requests_are_timed_by_status(monkeypatch):
+    response = FakeResponse(404, {"status": 404, "error": "Postcode not found"})
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: response)
+    with Service(PostcodeIOHttpHandler(PostcodeIOHandlerSettings())) as service:
+        assert not service.parse_one("SW1A 1AA").valid
+
+    assert _counts("postcode_http_request_seconds") == {("PostcodeIOHttpHandler", "404"): 1}
+
+
+def test_upstream_results_are_not_counted_as_regex_lookups(monkeypatch):
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: FakeResponse())
+    handler = PostcodeIOHttpHandler(PostcodeIOHandlerSettings())
+    for postcode in ["L1 8JQ", "SW1A 1AA", "M1 1AE"]:
+        handler.handle(postcode)
+    handler.close()
+
+    assert _counts("postcode_handler_lookup_seconds") == {("PostcodeIOHttpHandler", "ok"): 3}
+
+
+def test_bulk_paths_are_instrumented():
+    service = Service.using_regex()
+    postcodes = ["SW1A 1AA", "SW1A 1AC", "X"]
+    service.parse_many(postcodes)
+    service.validate_many(postcodes)
+    service.parse_columns(postcodes)
+    service.parse_values(postcodes)
+
+    methods = ["parse_many", "validate_many", "parse_columns", "parse_values"]
+    assert _counts("postcode_batch_seconds") == {(m,): 1 for m in methods}
+    assert _counts("postcode_batch_postcodes_total") == {**{(m, "ok"): 1 for m in methods}, **{(m, "error"): 2 for m in methods}}
+    assert _counts("postcode_errors_total") == {("POSTCODE_NOT_FOUND_ERROR",): 4, ("POSTCODE_LENGTH_ERROR",): 4}
+    assert _counts("postcode_handler_lookup_seconds") == {("RegexHandler", "ok"): 4, ("RegexHandler", "error"): 4}
+    assert _counts("postcode_parse_seconds") == {}
+
+
+def test_bulk_handler_lookups_and_cache_hits_are_counted(monkeypatch):
+    class BulkResponse:
+        status_code = 200
+
+        def __init__(self, queries):
+            self.queries = queries
+
+        def json(self):
+            return {"status": 200, "result": [{"query": q, "result": {"postcode": q}} for q in self.queries]}
+
+    monkeypatch.setattr(requests.Session, "request", lambda session, method, url, json=None, **kw: BulkResponse(json["postcodes"]))
+    service = Service(PostcodeIOHttpHandler(PostcodeIOHandlerSettings()), ResultCache())
+    service.parse_many(["L1 8JQ", "SW1A 1AC"])
+    service.parse_many(["L1 8JQ", "SW1A 1AC", "M1 1AE"])
+
+    assert _counts("postcode_handler_bulk_seconds") == {("PostcodeIOHttpHandler",): 2}
+    assert _counts("postcode_handler_bulk_lookups_total") == {("PostcodeIOHttpHandler", "ok"): 2, ("PostcodeIOHttpHandler", "error"): 1}
+    assert _counts("postcode_cache_lookups_total") == {("hit",): 2, ("miss",): 3}
+    # SW1A 1AC is rejected by the offline prefilter, inside the bulk lookup but before any request.
+    assert _counts("postcode_errors_total") == {("POSTCODE_NOT_FOUND_ERROR",): 2}
+
+
+def test_async_service_is_instrumented():
+    asyncio.run(AsyncService.using_regex().parse_many(["SW1A 1AA", "X"]))
+
+    assert _counts("postcode_parse_seconds") == {("ok",): 1, ("error",): 1}
+    assert _counts("postcode_errors_total") == {("POSTCODE_LENGTH_ERROR",): 1}
+    assert _counts("postcode_handler_lookup_seconds") == {}
@@ -1,5 +1,8 @@
+import random
 import pytest
 from src.postcode.service import Service
+from src.postcode.handlers.regex import RegexHandler, RegexHandlerSettings
+from src.postcode.handlers.standard import parse_standard
 from .data.parsing import (
     standard_postcodes,
     crown_dependency_postcodes,
@@ -58,3 +61,65 @@ def test_special_postcodes(postcode, postcode_service):
 def test_invalid_postcodes(postcode, postcode_service):
     result = postcode_service.parse_one(postcode)
     assert not result.valid, f"Expected failure for: {postcode} but got: {result.value}"
+
+
+def _sequential_parts(rule, value):
+    for regex in rule.patterns:
+        match = regex.match(value)
+        if match:
+            groups = match.groupdict()
+            return rule.type, groups.get("area"), groups.get("district"), groups.get("sector"), groups.get("unit")
+    return None
+
+
+def test_combined_regex_matches_patterns_in_order():
+    rule = RegexHandler.RULES[0]
+    samples = (
+        standard_postcodes
+        + crown_dependency_postcodes
+        + bot_postcodes
+        + bfpo_postcodes
+        + non_geographic_postcodes
+        + special_postcodes
+        + invalid_postcodes
+    )
+    rng = random.Random(18)
+    samples += ["".join(rng.choice("ABDGHKMRSVWY0123456789 -") for _ in range(rng.randint(2, 9))) for _ in range(5000)]
+    for value in [v for v in samples if isinstance(v, str)]:
+        normalized = " ".join(value.upper().split())
+        assert rule.match_parts(normalized) == _sequential_parts(rule, normalized), normalized
+
+
+def _random_postcode_like(rng):
+    shape = rng.choice(["standard", "bf", "gir", "noise"])
+    if shape == "noise":
+        return "".join(rng.choice("ABFGIRS019 -") for _ in range(rng.randint(0, 11)))
+    if shape == "gir":
+        return rng.choice(["GIR", "GI", "GIRR", "G1R"]) + rng.choice(["", " ", "  "]) + rng.choice(["0AA", "0AB", "1AA", "OAA"])
+    area = "BF1" if shape == "bf" else "".join(rng.choice("ABCIQWZ") for _ in range(rng.randint(0, 3)))
+    district = "".join(rng.choice("09") for _ in range(rng.randint(0, 3))) + rng.choice(["", "A", "K", "C"])
+    space = rng.choice(["", " ", " ", "  ", "-"])
+    inward = rng.choice("059O") + "".join(rng.choice("ABCIKZ") for _ in range(rng.randint(1, 3)))
+    return area + district + space + inward
+
+
+def test_fast_path_matches_regex_rules():
+    rule = RegexHandler.RULES[0]
+    rng = random.Random(19)
+    samples = [v for v in standard_postcodes + special_postcodes + invalid_postcodes if isinstance(v, str)]
+    samples += [_random_postcode_like(rng) for _ in range(50000)]
+    for value in samples:
+        normalized = " ".join(value.upper().split()) if rng.random() < 0.5 else value.upper()
+        expected = rule.match_parts(normalized)
+        assert (parse_standard(normalized) or expected) == expected, normalized
+
+
+def test_fast_path_handles_standard_postcodes():
+    fast = RegexHandler(RegexHandlerSettings(fast_path=True))
+    regex = RegexHandler(RegexHandlerSettings(fast_path=False))
+    for value in standard_postcodes + ["GIR 0AA", "GIR0AA"]:
+        normalized = " ".join(value.upper().split())
+        assert parse_standard(normalized) is not None, normalized
+        assert fast.handle_parts(normalized) == regex.handle_parts(normalized)
+    assert parse_standard("BF1 3AA") is None
+    assert parse_standard("D02 X285") is None
@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+import requests
+from src.postcode.service import Service
+from src.postcode.handlers.errors import HandlerRateLimitError
+from src.postcode.handlers.http import base
+from src.postcode.handlers.http.ratelimit import FileTokenBucket, TokenBucket, parse_retry_after
+
+from .conftest import FakeResponse
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_pause_blocks_until_retry_after(clock):
+    bucket = TokenBucket(rate=10, clock=clock)
+    bucket.pause(5)
+
+    assert bucket.try_acquire() == pytest.approx(5)
+    clock.now = 5.0
+    assert bucket.try_acquire() == pytest.approx(0.1)
+    clock.now = 5.2
+    assert bucket.try_acquire() == 0
+
+
+def test_file_token_bucket_is_shared_between_instances(tmp_path, clock):
+    path = str(tmp_path / "quota.bucket")
+    first = FileTokenBucket(path, rate=1, capacity=2, clock=clock)
+    second = FileTokenBucket(path, rate=1, capacity=2, clock=clock)
+
+    assert first.try_acquire() == 0
+    assert second.try_acquire() == 0
+    assert first.try_acquire() == pytest.approx(1)
+
+    second.pause(3)
+    clock.now = 2.0
+    assert first.try_acquire() == pytest.approx(1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7
+    assert parse_retry_after(None, default=2) == 2
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon", default=1) == 1
+
+
+def test_429_is_retried_after_retry_after(monkeypatch, postcode_io_handler):
+    responses = [FakeResponse(429, headers={"Retry-After": "2"}), FakeResponse()]
+    sleeps = []
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: responses.pop(0))
+    monkeypatch.setattr(base.time, "sleep", sleeps.append)
+
+    with Service(postcode_io_handler()) as service:
+        assert service.validate_one("L1 8JQ")
+    assert sleeps == [2]
+
+
+def test_429_raises_rate_limit_error_once_retries_are_exhausted(monkeypatch, postcode_io_handler):
+    calls = []
+
+    def request(session, *args, **kwargs):
+        calls.append(args)
+        return FakeResponse(429, headers={"Retry-After": "0"})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    monkeypatch.setattr(base.time, "sleep", lambda seconds: None)
+
+    with Service(postcode_io_handler(max_retries=1)) as service:
+        result = service.parse_one("L1 8JQ")
+
+    assert isinstance(result.error, HandlerRateLimitError)
+    assert len(calls) == 2
+
+
+def test_retry_after_beyond_limit_is_not_waited_for(monkeypatch, postcode_io_handler):
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: FakeResponse(429, headers={"Retry-After": "3600"}))
+    monkeypatch.setattr(base.time, "sleep", lambda seconds: pytest.fail("should not sleep"))
+
+    with Service(postcode_io_handler()) as service:
+        result = service.parse_one("L1 8JQ")
+
+    assert result.error.code == "HANDLER_RATE_LIMIT_ERROR"
+    assert result.error.retry_after == 3600
+
+
+def test_rate_limited_handler_paces_requests(monkeypatch, postcode_io_handler):
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: FakeResponse())
+    handler = postcode_io_handler(rate_limit=5, rate_limit_burst=1, coalesce=False)
+    waits = []
+
+    def acquire(bucket):
+        waits.append(bucket.try_acquire())
+
+    monkeypatch.setattr(base, "acquire", acquire)
+    with Service(handler) as service:
+        service.validate_one("L1 8JQ")
+        service.validate_one("SW1W 0NY")
+
+    assert isinstance(handler.rate_limiter, TokenBucket)
+    assert waits[0] == 0
+    assert 0 < waits[1] <= 0.2
+
+
+def test_async_429_pauses_the_bucket(monkeypatch, postcode_io_handler):
+    pytest.importorskip("httpx")
+    import httpx
+
+    responses = [FakeResponse(429, headers={"Retry-After": "0.01"}), FakeResponse()]
+
+    async def request(client, *args, **kwargs):
+        return responses.pop(0)
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", request)
+    handler = postcode_io_handler(rate_limit=100)
+
+    async def main():
+        try:
+            return await handler.ahandle("L1 8JQ")
+        finally:
+            await handler.aclose()
+
+    assert asyncio.run(main()).full == "L1 8JQ"
+    assert responses == []
@@ -0,0 +1,194 @@
+import threading
+import time
+
+import pytest
+from src.postcode.service import Service
+from src.postcode.handlers.base import BaseHandler, BaseHandlerSettings
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.handlers.errors import HandlerTimeoutError
+from src.postcode.postcode.model import Postcode
+
+
+class SlowHandler(BaseHandler):
+    """Regex-backed handler that simulates network latency and tracks concurrency."""
+
+    def __init__(self, settings: BaseHandlerSettings, delay: float = 0.02):
+        self._settings = settings
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    def _handle(self, postcode: str) -> Postcode:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self._delay)
+            if postcode == "M1 1AE":
+                raise HandlerTimeoutError("SlowHandler", 1)
+            return RegexHandler.default().handle(postcode)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def slow_handler():
+    return SlowHandler(BaseHandlerSettings(type="slow", max_workers=4))
+
+
+def test_parse_many_keeps_input_order(slow_handler):
+    postcodes = ["SW1W 0NY", "INVALID", "L1 8JQ", "M1 1AE", "PO16 7GZ"]
+    results = Service(slow_handler).parse_many(postcodes)
+
+    assert [r.valid for r in results] == [True, False, True, False, True]
+    assert results[0].value.full == "SW1W 0NY"
+    assert results[2].value.full == "L1 8JQ"
+    assert results[4].value.full == "PO16 7GZ"
+
+
+def test_parse_many_isolates_item_failures(slow_handler):
+    results = Service(slow_handler).parse_many(["M1 1AE", "L1 8JQ"])
+
+    assert isinstance(results[0].error, HandlerTimeoutError)
+    assert results[1].valid
+
+
+def test_parse_many_bounds_in_flight_lookups(slow_handler):
+    Service(slow_handler).parse_many([f"L{i} 8JQ" for i in range(1, 21)])
+
+    assert slow_handler.calls == 20
+    assert 1 < slow_handler.peak <= 4
+
+
+def test_parse_many_deduplicates_input(slow_handler):
+    postcodes = ["L1 8JQ", "INVALID", "SW1W 0NY", "L1 8JQ", "INVALID", "L1 8JQ", None]
+    results = Service(slow_handler).parse_many(postcodes)
+
+    assert slow_handler.calls == 3
+    assert [r.valid for r in results] == [True, False, True, True, False, True, False]
+    assert results[3].value.full == "L1 8JQ"
+
+
+def test_parse_many_max_workers_override(slow_handler):
+    Service(slow_handler).parse_many([f"L{i} 8JQ" for i in range(1, 11)], max_workers=1)
+
+    assert slow_handler.calls == 10
+    assert slow_handler.peak == 1
+
+
+@pytest.mark.parametrize("method", ["parse_many", "validate_many", "parse_columns", "parse_values"])
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_bulk_methods_reject_max_workers_below_one(slow_handler, method, max_workers):
+    with pytest.raises(ValueError, match="max_workers"):
+        getattr(Service(slow_handler), method)(["L1 8JQ"], max_workers=max_workers)
+    assert slow_handler.calls == 0
+
+
+def test_validate_many_concurrent(slow_handler):
+    assert Service(slow_handler).validate_many(["L1 8JQ", "INVALID", "M1 1AE"]) == [True, False, False]
+
+
+def test_parse_iter_is_lazy_and_ordered():
+    consumed = []
+
+    def source():
+        for postcode in ["L1 8JQ", "INVALID", "M1 1AE"]:
+            consumed.append(postcode)
+            yield postcode
+
+    results = Service.using_regex().parse_iter(source())
+    assert consumed == []
+
+    first = next(results)
+    assert first.value.full == "L1 8JQ"
+    assert consumed == ["L1 8JQ"]
+    assert [r.valid for r in results] == [False, True]
+
+
+def test_parse_iter_prefetch_bounds_look_ahead(slow_handler):
+    consumed = []
+
+    def source():
+        for postcode in ["L1 8JQ", "INVALID", "M1 1AE", "PO16 7GZ"] * 5:
+            consumed.append(postcode)
+            yield postcode
+
+    results = Service(slow_handler).parse_iter(source(), prefetch=3)
+    first = next(results)
+    assert first.valid
+    assert len(consumed) <= 4
+
+    rest = list(results)
+    assert [r.valid for r in [first, *rest]] == [True, False, False, True] * 5
+
+
+def test_parse_file(tmp_path):
+    path = tmp_path / "postcodes.txt"
+    path.write_text("sw1w 0ny\r\nINVALID\n\nL1 8JQ")
+
+    results = list(Service.using_regex().parse_file(path, prefetch=2))
+    assert [r.valid for r in results] == [True, False, False, True]
+    assert results[0].value.full == "SW1W 0NY"
+
+
+def test_parse_columns_matches_parse_many():
+    postcodes = ["sw1w 0ny", "INVALID", "L1 8JQ", "GIR 0AA", "", "BFPO 123"]
+    service = Service.using_regex()
+
+    columns = service.parse_columns(postcodes)
+    results = service.parse_many(postcodes)
+
+    assert len(columns) == len(postcodes)
+    assert columns.valid == [r.valid for r in results]
+    assert columns.error_code == [r.error.code if r.error else None for r in results]
+    assert columns.outcode == [r.value.outcode if r.valid else None for r in results]
+    assert columns.incode == [r.value.incode if r.valid else None for r in results]
+    assert [row.to_postcode() for row in columns] == [r.value for r in results]
+
+
+@pytest.mark.parametrize("method", ["parse_columns", "parse_values"])
+def test_bulk_parsing_bounds_look_ahead(slow_handler, method):
+    gaps = []
+
+    def source():
+        for i in range(60):
+            gaps.append(i - slow_handler.calls)
+            yield "L1 8JQ"
+
+    outcomes = getattr(Service(slow_handler), method)(source())
+    assert len(outcomes) == 60
+    # Four workers may each have four lookups queued ahead of the consumer.
+    assert max(gaps) <= 17
+
+
+def test_parse_many_returns_errors_without_tracebacks(caplog):
+    postcodes = ["sw1w 0ny", "INVALID", "", "SW1A 1AC", 42]
+    service = Service.using_regex()
+
+    with caplog.at_level("ERROR"):
+        results = service.parse_many(postcodes)
+        assert service.validate_many(postcodes) == [True, False, False, False, False]
+    assert [r.error.code if r.error else None for r in results] == [
+        None,
+        "POSTCODE_NOT_FOUND_ERROR",
+        "POSTCODE_FORMAT_ERROR",
+        "POSTCODE_NOT_FOUND_ERROR",
+        "POSTCODE_TYPE_ERROR",
+    ]
+    assert all(r.error.__traceback__ is None for r in results[1:4])
+    assert "INVALID" not in caplog.text
+    assert results[1].error.message == service.parse_one("INVALID").error.message == "Postcode 'INVALID' not found."
+
+
+def test_parse_columns_row_views(slow_handler):
+    columns = Service(slow_handler).parse_columns(["SW1W 0NY", "M1 1AE"])
+
+    assert columns[0].area == "SW"
+    assert columns[0].to_result().value.full == "SW1W 0NY"
+    assert not columns[-1].valid
+    assert isinstance(columns[-1].error, HandlerTimeoutError)
+    assert columns.to_dict()["district"] == ["1W", None]
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from src.postcode.handlers.singleflight import AsyncSingleFlight, SingleFlight
+from src.postcode.handlers.errors import HandlerTimeoutError
+
+
+def _run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            outcomes[i] = target()
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_single_flight_shares_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return "SW1W 0NY"
+
+    outcomes = _run_concurrently(8, lambda: flight.do("SW1W 0NY", fetch))
+
+    assert outcomes == ["SW1W 0NY"] * 8
+    assert len(calls) == 1
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    error = HandlerTimeoutError("Test", 1)
+
+    def fetch():
+        time.sleep(0.05)
+        raise error
+
+    outcomes = _run_concurrently(4, lambda: flight.do("M1 1AE", fetch))
+
+    assert all(outcome is error for outcome in outcomes)
+
+
+def test_single_flight_does_not_cache_completed_calls():
+    flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert flight.do("L1 8JQ", lambda: next(counter)) == 0
+    assert flight.do("L1 8JQ", lambda: next(counter)) == 1
+
+    with pytest.raises(StopIteration):
+        flight.do("L1 8JQ", lambda: next(iter([])))
+
+
+def test_async_single_flight_hands_over_when_the_leader_is_cancelled():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "SW1W 0NY"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("SW1W 0NY", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do("SW1W 0NY", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, *waiters, return_exceptions=True)
+
+    outcomes = asyncio.run(main())
+
+    assert isinstance(outcomes[0], asyncio.CancelledError)
+    assert outcomes[1:] == ["SW1W 0NY"] * 3
+    assert len(calls) == 2
@@ -0,0 +1,152 @@
+import sqlite3
+
+import pytest
+from src.postcode.service import Service
+from src.postcode.handlers.base import BaseHandlerSettings
+from src.postcode.handlers.breaker import CircuitBreakerHandlerSettings
+from src.postcode.handlers.factory import HandlerFactory
+from src.postcode.handlers.regex import RegexHandler
+from src.postcode.handlers.sqlite_cache import SqliteCacheHandler, SqliteCacheHandlerSettings
+from src.postcode.postcode.codec import decode_parts, encode_parts
+from src.postcode.postcode.errors import PostcodeNotFoundError
+
+from .conftest import CountingHandler
+
+pytestmark = pytest.mark.usefixtures("counting_handler")
+
+
+@pytest.fixture
+def cache_handler(tmp_path):
+    """Return a factory for SQLite caches in front of `CountingHandler`, stored under `tmp_path`."""
+
+    def create(**settings) -> SqliteCacheHandler:
+        return SqliteCacheHandler(
+            SqliteCacheHandlerSettings(
+                path=str(tmp_path / "cache" / "postcodes.db"),
+                handler=BaseHandlerSettings(type="counting"),
+                **settings,
+            )
+        )
+
+    return create
+
+
+@pytest.mark.parametrize("postcode", ["SW1W 0NY", "BFPO 123", "AI-2640", "GIR 0AA", "HM 11"])
+def test_codec_round_trip(postcode):
+    parts = RegexHandler.default().handle(postcode).parts
+    assert decode_parts(encode_parts(parts)) == parts
+
+
+def test_sqlite_cache_survives_restarts(cache_handler):
+    first = cache_handler()
+    assert first.handle("SW1W 0NY").full == "SW1W 0NY"
+    first.close()
+
+    second = cache_handler()
+    assert second.handle("SW1W 0NY") == RegexHandler.default().handle("SW1W 0NY")
+    assert CountingHandler.calls == 1
+
+
+def test_sqlite_cache_negative_and_transient_outcomes(cache_handler):
+    handler = cache_handler()
+    service = Service(handler)
+
+    assert isinstance(service.parse_one("ZZZZZZ").error, PostcodeNotFoundError)
+    assert isinstance(service.parse_one("ZZZZZZ").error, PostcodeNotFoundError)
+    assert CountingHandler.calls == 1
+
+    service.parse_one("M1 1AE")
+    service.parse_one("M1 1AE")
+    assert CountingHandler.calls == 3
+
+
+def test_sqlite_cache_expiry(cache_handler, monkeypatch):
+    import src.postcode.handlers.sqlite_cache as module
+
+    now = [1000.0]
+    monkeypatch.setattr(module.time, "time", lambda: now[0])
+    handler = cache_handler(ttl=10)
+
+    handler.handle("L1 8JQ")
+    now[0] += 11
+    handler.handle("L1 8JQ")
+    assert CountingHandler.calls == 2
+
+
+def test_sqlite_cache_prunes_oldest_entries(cache_handler):
+    handler = cache_handler(max_entries=2, prune_interval=3)
+    service = Service(handler)
+
+    service.parse_many(["L1 8JQ", "SW1W 0NY", "PO16 7GZ"])
+    assert handler.get("L1 8JQ") is None
+    assert handler.get("PO16 7GZ") is not None
+
+
+def test_sqlite_cache_created_through_service(tmp_path):
+    service = Service.create(
+        SqliteCacheHandlerSettings(
+            path=str(tmp_path / "postcodes.db"),
+            handler=BaseHandlerSettings(type="counting", max_workers=4),
+        )
+    )
+    results = service.parse_many(["L1 8JQ"] * 8 + ["INVALID"])
+    assert [r.valid for r in results] == [True] * 8 + [False]
+
+
+def test_sqlite_cache_starts_while_another_process_is_writing(tmp_path, cache_handler):
+    path = tmp_path / "cache" / "postcodes.db"
+    path.parent.mkdir()
+    other = sqlite3.connect(str(path), isolation_level=None)
+    other.execute("CREATE TABLE postcodes (key TEXT PRIMARY KEY, value TEXT, error TEXT, stored_at REAL NOT NULL, expires_at REAL)")
+    other.execute("BEGIN IMMEDIATE")
+    other.execute("INSERT INTO postcodes VALUES ('ZZZZZZ', NULL, 'POSTCODE_NOT_FOUND_ERROR', 0, NULL)")
+
+    # Switching to WAL mode needs the lock the other connection holds.
+    handler = cache_handler(busy_timeout=0.1)
+    other.execute("COMMIT")
+    other.close()
+    assert handler.handle("L1 8JQ").full == "L1 8JQ"
+    with pytest.raises(PostcodeNotFoundError):
+        handler.handle("ZZZZZZ")
+    assert CountingHandler.calls == 1
+
+
+def test_sqlite_cache_skips_a_prune_that_cannot_lock(cache_handler, monkeypatch):
+    def locked(self):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(SqliteCacheHandler, "prune", locked)
+    handler = cache_handler(prune_interval=1)
+    assert handler.handle("L1 8JQ").full == "L1 8JQ"
+    assert handler.get("L1 8JQ") is not None
+
+
+def test_sqlite_cache_settings_load_from_a_dict(tmp_path):
+    settings = SqliteCacheHandlerSettings.model_validate(
+        {"path": str(tmp_path / "postcodes.db"), "handler": {"type": "circuit_breaker", "minimum_calls": 2, "handler": {"type": "regex"}}}
+    )
+
+    assert isinstance(settings.handler, CircuitBreakerHandlerSettings)
+    assert settings.handler.minimum_calls == 2
+    assert SqliteCacheHandlerSettings.model_validate(settings.model_dump()) == settings
+    assert HandlerFactory.create(settings).handle("SW1W 0NY").full == "SW1W 0NY"
+
+
+def test_sqlite_cache_treats_a_locked_read_as_a_miss(cache_handler, monkeypatch):
+    class LockedConnection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def execute(self, *args):
+            raise sqlite3.OperationalError("database is locked")
+
+    handler = cache_handler()
+    handler.handle("L1 8JQ")
+    monkeypatch.setattr(handler, "_connection", LockedConnection)
+
+    assert handler.handle("L1 8JQ").full == "L1 8JQ"
+    assert [o.full for o in handler.handle_many(["L1 8JQ", "SW1W 0NY"])] == ["L1 8JQ", "SW1W 0NY"]
+    assert CountingHandler.calls == 4
@@ -0,0 +1,65 @@
+import pytest
+from src.postcode.service import Service
+from src.postcode.directory import PostcodeDirectory, build_directory
+from src.postcode.handlers.dataset import LocalDatasetHandlerSettings
+from src.postcode.suggest import PostcodeSuggester
+
+POSTCODES = ["B33 8TH", "L1 8JQ", "M1 1AE", "S1 1AA", "SW1A 1AA", "SW1A 1AB", "SW1A 2AA", "SW1W 0NY", "SW11 1AA", "W1A 0AX"]
+
+
+@pytest.fixture
+def suggester():
+    return PostcodeSuggester.from_postcodes(POSTCODES)
+
+
+def test_known_postcode_is_its_own_nearest(suggester):
+    assert "sw1a1aa" in suggester
+    assert suggester.suggest("sw1a1aa", k=1)[0].model_dump() == {"postcode": "SW1A 1AA", "distance": 0.0}
+
+
+@pytest.mark.parametrize(
+    "typo, postcode, distance",
+    [
+        ("SW1A IAA", "SW1A 1AA", 0.5),
+        ("5W1A 1AA", "SW1A 1AA", 0.5),
+        ("5WIA 1AA", "SW1A 1AA", 1.0),
+        ("B338HT", "B33 8TH", 0.75),
+        ("L18QJ", "L1 8JQ", 0.75),
+        ("M1 1AF", "M1 1AE", 1.0),
+        ("W1 0AX", "W1A 0AX", 1.0),
+        ("SW1AA 1AA", "SW1A 1AA", 1.0),
+    ],
+)
+def test_typos(suggester, typo, postcode, distance):
+    best = suggester.suggest(typo, k=1)[0]
+    assert (best.postcode, best.distance) == (postcode, distance)
+
+
+def test_ranking_and_limit(suggester):
+    suggestions = suggester.suggest("SW1A 1AC")
+    assert [(s.postcode, s.distance) for s in suggestions] == [("SW1A 1AA", 1.0), ("SW1A 1AB", 1.0)]
+    assert len(suggester.suggest("SW1A 1AC", k=1)) == 1
+
+
+def test_nothing_close(suggester):
+    assert suggester.suggest("ZE1 0AA") == []
+    assert suggester.suggest("not a postcode!") == []
+
+
+def test_from_directory_matches_from_postcodes(tmp_path, suggester):
+    source = tmp_path / "directory.csv"
+    source.write_text("pcds\n" + "\n".join(POSTCODES) + "\n")
+    build_directory(str(source), str(tmp_path / "directory.pcdir"))
+    directory = PostcodeDirectory(str(tmp_path / "directory.pcdir"))
+
+    loaded = PostcodeSuggester.from_directory(directory)
+    assert len(loaded) == len(suggester)
+    assert loaded.suggest("SW1W ONY") == suggester.suggest("SW1W ONY")
+    directory.close()
+
+
+def test_service_suggest(tmp_path):
+    source = tmp_path / "directory.csv"
+    source.write_text("pcds\n" + "\n".join(POSTCODES) + "\n")
+    with Service.create(LocalDatasetHandlerSettings(path=str(source))) as service:
+        assert [s.postcode for s in service.suggest("SW1W 0YN")] == ["SW1W 0NY"]
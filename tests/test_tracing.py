@@ -0,0 +1,115 @@
+import datetime
+from contextlib import contextmanager
+
+import pytest
+import requests
+from src.postcode import tracing
+from src.postcode.handlers.http.postcode_io import PostcodeIOHandlerSettings, PostcodeIOHttpHandler
+from src.postcode.service import Service
+
+from .conftest import FakeResponse
+
+
+class FakeSpan:
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.exceptions = []
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes, self._stack[-1].name if self._stack else None)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.record_exception(e)
+            raise
+        finally:
+            self._stack.pop()
+
+    def __getitem__(self, name):
+        return next(span for span in self.spans if span.name == name)
+
+
+@pytest.fixture
+def tracer():
+    tracer = FakeTracer()
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def test_tracing_is_disabled_by_default():
+    assert tracing.current_tracer() is None
+    with tracing.start_as_current_span("noop", attributes={"a": 1}) as span:
+        span.set_attribute("b", 2)
+    assert Service.using_regex().parse_one("SW1A 1AA").valid
+
+
+def test_parse_one_reports_each_stage(tracer):
+    assert Service.using_regex().parse_one(" sw1a 1aa ").valid
+
+    assert [(span.name, span.parent) for span in tracer.spans] == [
+        ("postcode.parse", None),
+        ("postcode.validate", "postcode.parse"),
+        ("postcode.normalize", "postcode.parse"),
+        ("postcode.handle", "postcode.parse"),
+        ("postcode.regex", "postcode.handle"),
+    ]
+    assert tracer["postcode.parse"].attributes == {"postcode.handler": "RegexHandler", "postcode.valid": True, "postcode.format": "UK"}
+    assert tracer["postcode.handle"].attributes == {"postcode.handler": "RegexHandler", "postcode.format": "UK"}
+    assert tracer["postcode.regex"].attributes == {"postcode.regex.fast_path": False, "postcode.regex.matched": True}
+
+
+def test_failed_stage_is_tagged_with_error_code(tracer):
+    assert not Service.using_regex().parse_one("X").valid
+
+    assert [span.name for span in tracer.spans] == ["postcode.parse", "postcode.validate"]
+    assert tracer["postcode.validate"].attributes["error.code"] == "POSTCODE_LENGTH_ERROR"
+    assert tracer["postcode.parse"].attributes["error.code"] == "POSTCODE_LENGTH_ERROR"
+    assert tracer["postcode.parse"].attributes["postcode.valid"] is False
+
+
+def test_http_request_and_decoding_are_separate_spans(tracer, monkeypatch):
+    response = FakeResponse()
+    response.elapsed = datetime.timedelta(milliseconds=25)
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: response)
+    with Service(PostcodeIOHttpHandler(PostcodeIOHandlerSettings())) as service:
+        assert service.parse_one("L1 8JQ").valid
+
+    assert [(span.name, span.parent) for span in tracer.spans[3:]] == [
+        ("postcode.handle", "postcode.parse"),
+        ("postcode.http.request", "postcode.handle"),
+        ("postcode.http.parse", "postcode.handle"),
+        ("postcode.regex", "postcode.http.parse"),
+    ]
+    request = tracer["postcode.http.request"].attributes
+    assert request["http.status_code"] == "200"
+    assert request["http.response_time"] == 0.025
+    assert request["http.method"] == "GET"
+
+
+def test_disabled_tracing_opens_no_spans_on_the_http_path(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("A span was opened while tracing is disabled.")
+
+    monkeypatch.setattr(tracing, "get_tracer", fail)
+    monkeypatch.setattr(requests.Session, "request", lambda session, *a, **kw: FakeResponse())
+    settings = PostcodeIOHandlerSettings(rate_limit=100)
+    with Service(PostcodeIOHttpHandler(settings)) as service:
+        assert service.parse_one("L1 8JQ").valid
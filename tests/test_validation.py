@@ -1,15 +1,28 @@
+import pickle
+
 import pytest
+from src.postcode.error import InternalError
+from src.postcode.handlers.errors import (
+    HandlerAPIError,
+    HandlerCircuitOpenError,
+    HandlerNoResultsError,
+    HandlerRateLimitError,
+    HandlerTimeoutError,
+)
+from src.postcode.result import Result
 from src.postcode.postcode.validation import (
     validate_postcode_type,
     validate_postcode_not_empty,
     validate_postcode_length,
     validate_postcode_chars,
     validate_postcode,
+    check_postcode,
 )
 from src.postcode.postcode.errors import (
     PostcodeTypeError,
     PostcodeLengthError,
     PostcodeFormatError,
+    PostcodeNotFoundError,
 )
 
 # ------------------------------------------------------------------------
@@ -96,3 +109,72 @@ def test_validate_postcode_valid(value):
 def test_validate_postcode_invalid(value):
     with pytest.raises((PostcodeTypeError, PostcodeFormatError, PostcodeLengthError)):
         validate_postcode(value)
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        ("SW1A 1AA", None),
+        ("W1A-0AX", None),
+        (123, PostcodeTypeError),
+        ("  ", PostcodeFormatError),
+        ("A1", PostcodeLengthError),
+        ("A/1 1AA", PostcodeFormatError),
+    ],
+)
+def test_check_postcode_returns_errors_without_raising(value, error):
+    outcome = check_postcode(value)
+    if error is None:
+        assert outcome is None
+    else:
+        assert type(outcome) is error
+        assert outcome.__traceback__ is None
+        with pytest.raises(error, match=str(outcome.message)[:10]):
+            validate_postcode(value)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        PostcodeNotFoundError("ZZ1 1ZZ"),
+        PostcodeLengthError("A1", 4, 9),
+        PostcodeFormatError("A/1 1AA"),
+        check_postcode("A/1 1AA"),
+        HandlerNoResultsError("PostcodeIOHttpHandler", "ZZ1 1ZZ"),
+        HandlerAPIError("PostcodeIOHttpHandler", 503),
+        HandlerAPIError("PostcodeIOHttpHandler", 400, "Invalid {postcodes} array"),
+        HandlerTimeoutError("PostcodeIOHttpHandler", 5),
+        HandlerCircuitOpenError("PostcodeIOHttpHandler"),
+        HandlerRateLimitError("PostcodeIOHttpHandler", 1.5),
+        InternalError("boom"),
+    ],
+)
+def test_errors_pickle_round_trip(error):
+    assert error.args
+    copy = pickle.loads(pickle.dumps(error))
+    assert type(copy) is type(error)
+    assert (copy.code, copy.message, str(copy), copy.args) == (error.code, error.message, str(error), error.args)
+    assert vars(copy) == vars(error)
+
+    result = pickle.loads(pickle.dumps(Result.failure(error)))
+    assert str(result.error) == str(error)
+
+
+def test_error_message_is_formatted_lazily_and_writable():
+    error = PostcodeNotFoundError("ZZ1 1ZZ")
+    assert error.args == ("Postcode '{postcode}' not found.", {"postcode": "ZZ1 1ZZ"})
+    assert error.message == "Postcode 'ZZ1 1ZZ' not found."
+    error.message = "Gone."
+    assert str(error) == "[POSTCODE_NOT_FOUND_ERROR] [ZZ1 1ZZ] Gone."
+
+
+def test_handler_error_messages_are_formatted_lazily():
+    error = HandlerRateLimitError("PostcodeIOHttpHandler", 1.5)
+    assert error.args == (
+        "{handler} is rate limited; retry after {retry_after:g} seconds.",
+        {"handler": "PostcodeIOHttpHandler", "retry_after": 1.5},
+    )
+    assert (
+        str(error) == "[HANDLER_RATE_LIMIT_ERROR] [PostcodeIOHttpHandler] PostcodeIOHttpHandler is rate limited; retry after 1.5 seconds."
+    )
+    assert HandlerAPIError("PostcodeIOHttpHandler", 400, "Invalid {postcodes} array").message == "Invalid {postcodes} array"
@@ -0,0 +1,57 @@
+import pickle
+import pytest
+from src.postcode.service import Service
+from src.postcode.error import Error
+from src.postcode.postcode.format import PostcodeFormat
+from src.postcode.postcode.model import Postcode
+from src.postcode.postcode.value import PostcodeValue
+
+
+def test_derived_fields_and_conversions():
+    value = PostcodeValue(PostcodeFormat.UK, "SW", "1A", "1", "AA")
+
+    assert (value.outcode, value.incode, value.full) == ("SW1A", "1AA", "SW1A 1AA")
+    assert value.full is value.full
+    assert value.to_postcode() == Postcode(format=PostcodeFormat.UK, area="SW", district="1A", sector="1", unit="AA")
+    assert PostcodeValue.from_postcode(value.to_postcode()) == value
+    assert value.to_result().value.full == "SW1A 1AA"
+
+
+def test_missing_components_match_the_model():
+    value = PostcodeValue(PostcodeFormat.UK, None, None, None, "1234")
+    assert (value.outcode, value.incode, value.full) == ("", "1234", " 1234")
+    assert value.full == value.to_postcode().full
+
+
+def test_immutable_hashable_and_picklable():
+    value = PostcodeValue.from_parts((PostcodeFormat.UK, "M", "1", "1", "AE"))
+
+    with pytest.raises(AttributeError):
+        value.area = "L"
+    with pytest.raises(AttributeError):
+        del value.unit
+    assert len({value, PostcodeValue(PostcodeFormat.UK, "M", "1", "1", "AE")}) == 1
+    assert value != PostcodeValue(PostcodeFormat.UK, "M", "1", "1", "AF")
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert not hasattr(value, "__dict__")
+
+
+def test_parse_values_matches_parse_many():
+    service = Service.using_regex()
+    postcodes = ["SW1A 1AA", "invalid", "l1 8jq", None, "GIR 0AA"]
+
+    values = service.parse_values(postcodes)
+    results = service.parse_many(postcodes)
+
+    assert len(values) == len(results)
+    for value, result in zip(values, results):
+        if result.valid:
+            assert value.to_postcode() == result.value
+        else:
+            assert isinstance(value, Error) and value.code == result.error.code
+
+
+def test_column_rows_convert_to_values():
+    columns = Service.using_regex().parse_columns(["SW1A 1AA", "invalid"])
+    assert columns[0].to_value().full == "SW1A 1AA"
+    assert columns[1].to_value() is None